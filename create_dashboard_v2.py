@@ -5,10 +5,38 @@ Modern, stunning design with language toggle
 Includes ETHYDCO Knowledge Base tab
 """
 
+import numpy as np
 import pandas as pd
 import plotly.graph_objects as go
+import plotly.io as pio
 from plotly.subplots import make_subplots
+from concurrent.futures import ThreadPoolExecutor
+import functools
+import gzip
+import hashlib
+import html
 import json
+import re
+from collections import OrderedDict
+from decimal import Decimal, ROUND_HALF_UP
+
+try:
+    import orjson
+except ImportError:  # optional: faster figure and digest serialization
+    orjson = None
+
+try:
+    import csscompressor
+except ImportError:  # optional: minifies the inlined stylesheet
+    csscompressor = None
+
+try:
+    import brotli
+except ImportError:  # optional: brotli-precompressed copy of the output
+    brotli = None
+
+if orjson is not None:
+    pio.json.config.default_engine = 'orjson'
 
 # ============================================================================
 # CONSTANTS
@@ -16,12 +44,95 @@ import json
 
 OPERATING_HOURS_PER_YEAR = 8000
 
+# ============================================================================
+# LANGUAGE STRINGS
+# ============================================================================
+
+# Per-language chart labels, built once at import
+LANG_STRINGS = {
+    'en': {
+        'phase_labels': ['Phase 1+2: Gas Recovery', 'Phase 3+4: Methanol & MTO'],
+        'phase_short': ['Phase 1+2', 'Phase 3+4'],
+        'product_names': ['LPG (C3+C4)', 'Naphtha (C5+)', 'Hydrogen (H2)', 'Ethane (C2)',
+                          'Methanol Blend', 'Ethylene (MTO)', 'Propylene (MTO)'],
+        'product_axis': 'Value ($ Million/year)',
+        'cost_benefit_legend': ['Gross Value', 'NG Makeup Cost', 'Net Value'],
+        'cost_benefit_axis': 'Value ($ Million)',
+        'sankey_labels': ['Flare Gas', 'Refinery Gas', 'PSA + Sweep', 'Penex',
+                          'H2 Recovery', 'LPG Recovery', 'C5+ Recovery', 'C2 Recovery',
+                          'CO/CO2', 'Methanol', 'MTO Products', 'Net Value'],
+        'h2_categories': ['H2 Available', 'H2 Required', 'Deficit'],
+        'h2_utilization': '<b>Utilization: %.0f%%</b>',
+        'h2_axis': 'Quantity (kt/year)',
+        'heatmap_streams': ['Flare OLD', 'Flare New', 'Refinery', 'PSA', 'Sweep', 'Penex'],
+        'methanol_labels': ['Gasoline Blending', 'MTO Conversion'],
+        'design': 'Design',
+        'actual': 'Actual',
+        'tonnes_per_hour': 'T/hr',
+        'tonnes_per_year': 'T/year',
+        'routing_nodes': [
+            'GASCO Pipeline',      # 0
+            'Purification',        # 1
+            'Steam Crackers',      # 2
+            'Cold Box',            # 3
+            'Demethanizer',        # 4
+            'De-C3 Column',        # 5
+            'De-C4 Column',        # 6
+            'Quench Tower',        # 7
+            'Amine Stripper',      # 8
+            'PE Plant',            # 9
+            'Butadiene Unit',      # 10
+            'Fuel Gas System',     # 11
+            'Incinerator',         # 12
+            'Export'               # 13
+        ],
+    },
+    'ar': {
+        'phase_labels': ['المرحلة 1+2: استرداد الغاز', 'المرحلة 3+4: الميثانول'],
+        'phase_short': ['المرحلة 1+2', 'المرحلة 3+4'],
+        'product_names': ['غاز مسال (LPG)', 'نافثا (C5+)', 'هيدروجين (H2)', 'إيثان (C2)',
+                          'ميثانول', 'إيثيلين MTO', 'بروبيلين MTO'],
+        'product_axis': 'القيمة (مليون دولار/سنة)',
+        'cost_benefit_legend': ['القيمة الإجمالية', 'تكلفة الغاز الطبيعي', 'القيمة الصافية'],
+        'cost_benefit_axis': 'القيمة (مليون $)',
+        'sankey_labels': ['غاز الشعلة', 'غاز المصفاة', 'PSA + كنس', 'بنيكس',
+                          'استرداد H2', 'استرداد LPG', 'استرداد C5+', 'استرداد C2',
+                          'CO/CO2', 'ميثانول', 'منتجات MTO', 'القيمة الصافية'],
+        'h2_categories': ['H2 المتوفر', 'H2 المطلوب', 'العجز'],
+        'h2_utilization': '<b>نسبة الاستخدام: %.0f%%</b>',
+        'h2_axis': 'الكمية (ألف طن/سنة)',
+        'heatmap_streams': ['شعلة قديم', 'شعلة جديد', 'مصفاة', 'PSA', 'كنس', 'بنيكس'],
+        'methanol_labels': ['مزج البنزين', 'تحويل MTO'],
+        'design': 'التصميم',
+        'actual': 'الفعلي',
+        'tonnes_per_hour': 'طن/ساعة',
+        'tonnes_per_year': 'طن/سنة',
+        'routing_nodes': [
+            'خط جاسكو',           # 0
+            'التنقية',            # 1
+            'التكسير البخاري',    # 2
+            'الصندوق البارد',     # 3
+            'عمود الميثان',       # 4
+            'عمود C3',           # 5
+            'عمود C4',           # 6
+            'برج التبريد',        # 7
+            'منزع الأمين',        # 8
+            'مصنع PE',           # 9
+            'وحدة البيوتادايين',  # 10
+            'نظام الوقود',        # 11
+            'المحرقة',            # 12
+            'التصدير'             # 13
+        ],
+    },
+}
+
 # ============================================================================
 # ETHYDCO DATA STRUCTURE
 # ============================================================================
 
+@functools.lru_cache(maxsize=1)
 def load_ethydco_data():
-    """Load ETHYDCO questionnaire data."""
+    """Load ETHYDCO questionnaire data (built once; treat the result as read-only)."""
     return {
         'company_info': {
             'name': 'ETHYDCO',
@@ -598,19 +709,49 @@ def load_metrics():
 
     return metrics
 
+# ============================================================================
+# RENDER CACHE
+# ============================================================================
+
+# Input data keyed by content digest, so cached renderers can be keyed on a
+# hashable string instead of the (unhashable) nested dicts. A renderer only
+# reads this on a cache miss, right after register_data(), so it is kept as a
+# small LRU rather than holding every data version ever rendered.
+_DATA_BY_DIGEST = OrderedDict()
+_DATA_BY_DIGEST_SIZE = 8
+
+def content_digest(data):
+    """Return a stable content hash of a JSON-serialisable data structure."""
+    if orjson is not None:
+        payload = orjson.dumps(data, option=orjson.OPT_SORT_KEYS)
+    else:
+        payload = json.dumps(data, sort_keys=True, ensure_ascii=False).encode('utf-8')
+    return hashlib.blake2b(payload, digest_size=16).hexdigest()
+
+def register_data(data):
+    """Remember data under its content digest and return the digest."""
+    digest = content_digest(data)
+    _DATA_BY_DIGEST[digest] = data
+    _DATA_BY_DIGEST.move_to_end(digest)
+    while len(_DATA_BY_DIGEST) > _DATA_BY_DIGEST_SIZE:
+        _DATA_BY_DIGEST.popitem(last=False)
+    return digest
+
+def clear_render_caches():
+    """Drop all cached HTML and chart JSON (call after the source data is reloaded)."""
+    load_ethydco_data.cache_clear()
+    _generate_kb_cards_cached.cache_clear()
+    _generate_kb_html_cached.cache_clear()
+    _chart_json_cached.cache_clear()
+    _DATA_BY_DIGEST.clear()
+
 # ============================================================================
 # CHART GENERATORS - Optimized for readability
 # ============================================================================
 
 def create_phase_donut(metrics, lang='en'):
     """Create donut chart for phase distribution."""
-    if lang == 'ar':
-        labels = ['المرحلة 1+2: استرداد الغاز', 'المرحلة 3+4: الميثانول']
-        title = 'توزيع القيمة حسب المرحلة'
-    else:
-        labels = ['Phase 1+2: Gas Recovery', 'Phase 3+4: Methanol & MTO']
-        title = 'Value Distribution by Phase'
-
+    labels = LANG_STRINGS[lang]['phase_labels']
     values = [metrics['summary']['phase12_net'], metrics['summary']['phase34_net']]
 
     fig = go.Figure(data=[go.Pie(
@@ -642,16 +783,9 @@ def create_phase_donut(metrics, lang='en'):
 
 def create_product_bars(metrics, lang='en'):
     """Create horizontal bar chart for product values."""
-    if lang == 'ar':
-        products = ['غاز مسال (LPG)', 'نافثا (C5+)', 'هيدروجين (H2)', 'إيثان (C2)',
-                   'ميثانول', 'إيثيلين MTO', 'بروبيلين MTO']
-        title = 'قيم المنتجات السنوية'
-        xaxis_title = 'القيمة (مليون دولار/سنة)'
-    else:
-        products = ['LPG (C3+C4)', 'Naphtha (C5+)', 'Hydrogen (H2)', 'Ethane (C2)',
-                   'Methanol Blend', 'Ethylene (MTO)', 'Propylene (MTO)']
-        title = 'Annual Product Values'
-        xaxis_title = 'Value ($ Million/year)'
+    strings = LANG_STRINGS[lang]
+    products = strings['product_names']
+    xaxis_title = strings['product_axis']
 
     values = [
         metrics['calc1']['LPG_value'] / 1e6,
@@ -695,14 +829,9 @@ def create_product_bars(metrics, lang='en'):
 
 def create_cost_benefit_bars(metrics, lang='en'):
     """Create grouped bar chart for cost-benefit analysis."""
-    if lang == 'ar':
-        categories = ['المرحلة 1+2', 'المرحلة 3+4']
-        legend_labels = ['القيمة الإجمالية', 'تكلفة الغاز الطبيعي', 'القيمة الصافية']
-        title = 'تحليل التكلفة والعائد'
-    else:
-        categories = ['Phase 1+2', 'Phase 3+4']
-        legend_labels = ['Gross Value', 'NG Makeup Cost', 'Net Value']
-        title = 'Cost-Benefit Analysis'
+    strings = LANG_STRINGS[lang]
+    categories = strings['phase_short']
+    legend_labels = strings['cost_benefit_legend']
 
     fig = go.Figure()
 
@@ -736,7 +865,7 @@ def create_cost_benefit_bars(metrics, lang='en'):
         textfont=dict(size=12, color='#f1f5f9')
     ))
 
-    yaxis_title = 'القيمة (مليون $)' if lang == 'ar' else 'Value ($ Million)'
+    yaxis_title = strings['cost_benefit_axis']
 
     fig.update_layout(
         barmode='group',
@@ -757,14 +886,7 @@ def create_cost_benefit_bars(metrics, lang='en'):
 
 def create_sankey(metrics, lang='en'):
     """Create Sankey diagram for material/value flow."""
-    if lang == 'ar':
-        labels = ['غاز الشعلة', 'غاز المصفاة', 'PSA + كنس', 'بنيكس',
-                 'استرداد H2', 'استرداد LPG', 'استرداد C5+', 'استرداد C2',
-                 'CO/CO2', 'ميثانول', 'منتجات MTO', 'القيمة الصافية']
-    else:
-        labels = ['Flare Gas', 'Refinery Gas', 'PSA + Sweep', 'Penex',
-                 'H2 Recovery', 'LPG Recovery', 'C5+ Recovery', 'C2 Recovery',
-                 'CO/CO2', 'Methanol', 'MTO Products', 'Net Value']
+    labels = LANG_STRINGS[lang]['sankey_labels']
 
     # Source -> Target connections
     source = [0,0,0, 1,1,1,1, 2,2,2, 3,3,3, 4, 5, 6, 7, 8, 9, 10]
@@ -801,9 +923,25 @@ def create_sankey(metrics, lang='en'):
 
     return fig
 
-def create_gauge(value, max_val, title, lang='en'):
-    """Create a modern gauge chart."""
-    fig = go.Figure(go.Indicator(
+def create_gauges(min_value, max_value, lang='en'):
+    """Create the min/max coverage gauges side by side in one figure."""
+    fig = make_subplots(rows=1, cols=2, specs=[[{'type': 'indicator'}, {'type': 'indicator'}]],
+                        horizontal_spacing=0.1)
+    for col, value in enumerate((min_value, max_value), start=1):
+        fig.add_trace(_gauge_indicator(value), row=1, col=col)
+
+    fig.update_layout(
+        margin=dict(t=20, b=10, l=20, r=20),
+        paper_bgcolor='rgba(0,0,0,0)',
+        height=200,
+        font=dict(family='Inter', color='#f1f5f9'),
+        autosize=True
+    )
+
+    return fig
+
+def _gauge_indicator(value):
+    return go.Indicator(
         mode="gauge+number",
         value=value * 100,
         number={'suffix': '%', 'font': {'size': 36, 'family': 'Inter', 'color': '#f1f5f9'}},
@@ -819,30 +957,16 @@ def create_gauge(value, max_val, title, lang='en'):
                 {'range': [75, 100], 'color': 'rgba(34,197,94,0.2)'}
             ],
         }
-    ))
-
-    fig.update_layout(
-        margin=dict(t=20, b=10, l=20, r=20),
-        paper_bgcolor='rgba(0,0,0,0)',
-        height=200,
-        font=dict(family='Inter', color='#f1f5f9'),
-        autosize=True
     )
 
-    return fig
-
 def create_h2_balance(metrics, lang='en'):
     """Create H2 balance visualization."""
-    if lang == 'ar':
-        categories = ['H2 المتوفر', 'H2 المطلوب', 'العجز']
-        title = 'توازن الهيدروجين لإنتاج الميثانول'
-    else:
-        categories = ['H2 Available', 'H2 Required', 'Deficit']
-        title = 'H2 Balance for Methanol'
+    strings = LANG_STRINGS[lang]
+    categories = strings['h2_categories']
 
-    values = [metrics['calc5']['H2_available']/1000,
-              metrics['calc5']['H2_required']/1000,
-              metrics['calc5']['H2_deficit']/1000]
+    values = np.asarray([metrics['calc5']['H2_available'],
+                         metrics['calc5']['H2_required'],
+                         metrics['calc5']['H2_deficit']], dtype=np.float32) / 1000
     colors = ['#22c55e', '#0ea5e9', '#ef4444']
 
     fig = go.Figure(data=[
@@ -859,14 +983,14 @@ def create_h2_balance(metrics, lang='en'):
 
     utilization = metrics['calc5']['H2_utilization'] * 100
     fig.add_annotation(
-        x=1, y=max(values)*1.1,
-        text=f"<b>Utilization: {utilization:.0f}%</b>" if lang == 'en' else f"<b>نسبة الاستخدام: {utilization:.0f}%</b>",
+        x=1, y=values.max()*1.1,
+        text=strings['h2_utilization'] % utilization,
         showarrow=False,
         font=dict(size=14, color='#0ea5e9', family='Inter')
     )
 
     fig.update_layout(
-        yaxis=dict(title=dict(text='Quantity (kt/year)' if lang == 'en' else 'الكمية (ألف طن/سنة)', font=dict(size=10, color='#f1f5f9')),
+        yaxis=dict(title=dict(text=strings['h2_axis'], font=dict(size=10, color='#f1f5f9')),
                    gridcolor='rgba(255,255,255,0.1)', tickfont=dict(size=10, color='#f1f5f9')),
         xaxis=dict(tickfont=dict(size=10, family='Inter', color='#f1f5f9')),
         margin=dict(t=40, b=30, l=50, r=20),
@@ -880,21 +1004,12 @@ def create_h2_balance(metrics, lang='en'):
 
 def create_stream_heatmap(metrics, lang='en'):
     """Create component distribution heatmap."""
-    if lang == 'ar':
-        streams = ['شعلة قديم', 'شعلة جديد', 'مصفاة', 'PSA', 'كنس', 'بنيكس']
-    else:
-        streams = ['Flare OLD', 'Flare New', 'Refinery', 'PSA', 'Sweep', 'Penex']
+    streams = LANG_STRINGS[lang]['heatmap_streams']
 
     components = ['H2', 'CH4', 'C2', 'C3', 'C4', 'C5+', 'CO', 'CO2']
 
-    z = []
-    for comp in components:
-        row = metrics['stream_components'][comp]
-        total = sum(row)
-        if total > 0:
-            z.append([v/1000 for v in row])  # Convert to thousands
-        else:
-            z.append([0]*6)
+    # numpy input lets Plotly ship z as a base64 typed array
+    z = np.asarray([metrics['stream_components'][comp] for comp in components], dtype=np.float32) / 1000  # Convert to thousands
 
     fig = go.Figure(data=go.Heatmap(
         z=z,
@@ -922,12 +1037,9 @@ def create_stream_heatmap(metrics, lang='en'):
 
 def create_methanol_allocation(metrics, lang='en'):
     """Create methanol allocation pie."""
-    if lang == 'ar':
-        labels = ['مزج البنزين', 'تحويل MTO']
-    else:
-        labels = ['Gasoline Blending', 'MTO Conversion']
+    labels = LANG_STRINGS[lang]['methanol_labels']
 
-    values = [metrics['calc6']['methanol_in_gasoline'], metrics['calc6']['methanol_for_MTO']]
+    values = np.asarray([metrics['calc6']['methanol_in_gasoline'], metrics['calc6']['methanol_for_MTO']], dtype=np.float32)
 
     fig = go.Figure(data=[go.Pie(
         labels=labels,
@@ -967,6 +1079,7 @@ def get_numeric_value(val):
 
 def create_design_actual_chart(ethydco_data, lang='en'):
     """Create grouped bar chart comparing design vs actual capacity."""
+    strings = LANG_STRINGS[lang]
     items = []
     design_vals = []
     actual_vals = []
@@ -1006,31 +1119,31 @@ def create_design_actual_chart(ethydco_data, lang='en'):
 
     fig = go.Figure()
 
-    fig.add_trace(go.Bar(
-        name='Design' if lang == 'en' else 'التصميم',
-        x=items,
-        y=design_vals,
-        marker_color='#0ea5e9',
-        text=[f'{v:.1f}' for v in design_vals],
-        textposition='outside',
-        textfont=dict(size=10, color='#f1f5f9')
-    ))
-
-    fig.add_trace(go.Bar(
-        name='Actual' if lang == 'en' else 'الفعلي',
-        x=items,
-        y=actual_vals,
-        marker_color='#22c55e',
-        text=[f'{v:.1f}' for v in actual_vals],
-        textposition='outside',
-        textfont=dict(size=10, color='#f1f5f9')
-    ))
+    # Each trace carries its annual values too, so the page's T/hr | T/year
+    # toggle can swap them in with Plotly.update instead of re-plotting
+    for trace_name, vals, color in ((strings['design'], design_vals, '#0ea5e9'),
+                                    (strings['actual'], actual_vals, '#22c55e')):
+        annual_vals = [v * OPERATING_HOURS_PER_YEAR for v in vals]
+        hourly_text = [f'{v:.1f}' for v in vals]
+        fig.add_trace(go.Bar(
+            name=trace_name,
+            x=items,
+            y=vals,
+            marker_color=color,
+            text=hourly_text,
+            textposition='outside',
+            textfont=dict(size=10, color='#f1f5f9'),
+            meta=dict(
+                hourly=dict(y=vals, text=hourly_text),
+                annual=dict(y=annual_vals, text=[format_number(v) for v in annual_vals])
+            )
+        ))
 
     fig.update_layout(
         barmode='group',
         xaxis=dict(tickangle=-45, tickfont=dict(size=9, color='#f1f5f9')),
         yaxis=dict(
-            title=dict(text='T/hr' if lang == 'en' else 'طن/ساعة', font=dict(size=10, color='#f1f5f9')),
+            title=dict(text=strings['tonnes_per_hour'], font=dict(size=10, color='#f1f5f9')),
             gridcolor='rgba(255,255,255,0.1)',
             tickfont=dict(size=10, color='#f1f5f9')
         ),
@@ -1039,7 +1152,8 @@ def create_design_actual_chart(ethydco_data, lang='en'):
         paper_bgcolor='rgba(0,0,0,0)',
         plot_bgcolor='rgba(0,0,0,0)',
         height=400,
-        bargap=0.2
+        bargap=0.2,
+        meta=dict(units=dict(hourly=strings['tonnes_per_hour'], annual=strings['tonnes_per_year']))
     )
 
     return fig
@@ -1048,40 +1162,7 @@ def create_design_actual_chart(ethydco_data, lang='en'):
 def create_routing_sankey(ethydco_data, lang='en'):
     """Create Sankey diagram showing stream routing at ETHYDCO."""
 
-    if lang == 'ar':
-        nodes = [
-            'خط جاسكو',           # 0
-            'التنقية',            # 1
-            'التكسير البخاري',    # 2
-            'الصندوق البارد',     # 3
-            'عمود الميثان',       # 4
-            'عمود C3',           # 5
-            'عمود C4',           # 6
-            'برج التبريد',        # 7
-            'منزع الأمين',        # 8
-            'مصنع PE',           # 9
-            'وحدة البيوتادايين',  # 10
-            'نظام الوقود',        # 11
-            'المحرقة',            # 12
-            'التصدير'             # 13
-        ]
-    else:
-        nodes = [
-            'GASCO Pipeline',      # 0
-            'Purification',        # 1
-            'Steam Crackers',      # 2
-            'Cold Box',            # 3
-            'Demethanizer',        # 4
-            'De-C3 Column',        # 5
-            'De-C4 Column',        # 6
-            'Quench Tower',        # 7
-            'Amine Stripper',      # 8
-            'PE Plant',            # 9
-            'Butadiene Unit',      # 10
-            'Fuel Gas System',     # 11
-            'Incinerator',         # 12
-            'Export'               # 13
-        ]
+    nodes = LANG_STRINGS[lang]['routing_nodes']
 
     # Define links (source, target, value in T/hr equivalent)
     links = [
@@ -1152,6 +1233,60 @@ def create_routing_sankey(ethydco_data, lang='en'):
     return fig
 
 
+# ============================================================================
+# CHART ASSEMBLY
+# ============================================================================
+
+def create_charts(metrics, ethydco_data, lang='en'):
+    """Build every dashboard figure for one language."""
+    return {
+        'donut': create_phase_donut(metrics, lang),
+        'products': create_product_bars(metrics, lang),
+        'cost_benefit': create_cost_benefit_bars(metrics, lang),
+        'sankey': create_sankey(metrics, lang),
+        'gauges': create_gauges(metrics['calc3']['coverage_min'], metrics['calc3']['coverage_max'], lang),
+        'h2_balance': create_h2_balance(metrics, lang),
+        'heatmap': create_stream_heatmap(metrics, lang),
+        'methanol': create_methanol_allocation(metrics, lang),
+        'kb_design_actual': create_design_actual_chart(ethydco_data, lang),
+        'kb_routing': create_routing_sankey(ethydco_data, lang)
+    }
+
+def chart_json(metrics, ethydco_data, lang='en'):
+    """Return {chart key: figure JSON} for one language (cached by data content)."""
+    return _chart_json_cached(register_data(metrics), register_data(ethydco_data), lang)
+
+# Chart keys as named in the page script
+CHART_JS_NAMES = (
+    ('donut', 'donut'), ('products', 'products'), ('cost_benefit', 'costbenefit'),
+    ('sankey', 'sankey'), ('gauges', 'gauges'),
+    ('h2_balance', 'h2'), ('heatmap', 'heatmap'), ('methanol', 'methanol'),
+    ('kb_design_actual', 'kbDesign'), ('kb_routing', 'kbRouting')
+)
+
+def charts_json_payload(chart_jsons):
+    """Join one language's chart JSON into a single object for a JSON data block."""
+    payload = '{' + ','.join(f'"{js_name}":{chart_jsons[key]}' for key, js_name in CHART_JS_NAMES) + '}'
+    # '<' only occurs inside JSON strings; escaping it keeps </script> and
+    # <!-- sequences in chart text from ending the data block early
+    return payload.replace('<', '\\u003c')
+
+@functools.lru_cache(maxsize=1)
+def chart_template_json():
+    """Serialize the default Plotly template once; the page shares it across all charts."""
+    template = pio.templates[pio.templates.default]
+    return pio.json.to_json_plotly(template.to_plotly_json()).replace('<', '\\u003c')
+
+@functools.lru_cache(maxsize=8)
+def _chart_json_cached(metrics_digest, ethydco_digest, lang):
+    figs = create_charts(_DATA_BY_DIGEST[metrics_digest], _DATA_BY_DIGEST[ethydco_digest], lang)
+    # Every figure would otherwise embed its own ~7 KB copy of the default
+    # template; the page re-attaches the single shared copy before plotting
+    for fig in figs.values():
+        fig.layout.template = None
+    return {key: fig.to_json() for key, fig in figs.items()}
+
+
 # ============================================================================
 # HTML GENERATION - KNOWLEDGE BASE
 # ============================================================================
@@ -1170,38 +1305,150 @@ def format_value_display(value, unit=''):
         return f"{value:.2f}"
     return str(value)
 
+def convert_to_annual(value, unit):
+    """Convert an hourly (T/hr or Kg/hr) value to tonnes per year."""
+    if 'Year' in unit:
+        return value
+    if 'Kg' in unit:
+        return value * OPERATING_HOURS_PER_YEAR / 1000
+    return value * OPERATING_HOURS_PER_YEAR
+
+def format_number(num):
+    """Format a card summary number with one decimal and a K/M suffix."""
+    for scale, suffix in ((1000000, 'M'), (1000, 'K'), (1, '')):
+        if num >= scale or scale == 1:
+            # Half-up on the exact binary value, matching JS Number.toFixed
+            return str(Decimal(num / scale).quantize(Decimal('0.1'), ROUND_HALF_UP)) + suffix
+
+def unit_display_strings(value, unit):
+    """Return a card value's (hourly, annual) summary strings, or blanks if not numeric."""
+    num = get_numeric_value(value)
+    if not num:
+        return '', ''
+    return format_number(num), format_number(convert_to_annual(num, unit))
+
+def css_string(value):
+    """Quote text as a CSS string literal, escaping backslashes and quotes."""
+    return "'" + str(value).replace('\\', '\\\\').replace("'", "\\'") + "'"
+
 def format_composition_html(composition, comp_unit):
-    """Format composition data as HTML list."""
+    """Format composition data as HTML list (unit rendered once per list via CSS)."""
     if not composition:
         return ''
 
     lines = []
     for key, val in composition.items():
         if isinstance(val, dict) and 'min' in val:
-            lines.append(f"<li><span class='comp-name'>{key}:</span> <span class='comp-val'>{val['min']}-{val['max']} {comp_unit}</span></li>")
-        else:
-            lines.append(f"<li><span class='comp-name'>{key}:</span> <span class='comp-val'>{val} {comp_unit}</span></li>")
+            val = f"{val['min']}-{val['max']}"
+        lines.append(f"<li><span class='comp-name'>{key}:</span> <span class='comp-val'>{val}</span></li>")
+
+    # The unit goes into a CSS string inside an HTML attribute, so it is
+    # escaped for both
+    unit_css = html.escape(css_string(comp_unit), quote=True)
+    return f'<ul class="comp-list" style="--comp-unit: {unit_css}">' + ''.join(lines) + '</ul>'
+
+_CONDITION_ITEM = "<div class='condition-item'><span class='cond-label'>%s</span><span class='cond-value'>%s</span></div>"
+
+# (condition key, label, value formatter) in display order. A formatter
+# returning None skips the entry.
+_CONDITION_HANDLERS = (
+    ('P', 'P', lambda v, c: f"{v} {c.get('P_unit', 'kg/cm²g')}"),
+    ('T', 'T', lambda v, c: f"{v} {c.get('T_unit', '°C')}"),
+    ('pressure', 'P (min)', lambda v, c: f"{v['min']} {v.get('unit', '')}" if isinstance(v, dict) else None),
+    ('temperature', 'T', lambda v, c: v),
+    ('phase', 'Phase', lambda v, c: v),
+)
+
+def format_conditions_html(conditions):
+    """Format operating conditions as condition-item HTML."""
+    if not conditions:
+        return ''
+
+    cond_items = []
+    for key, label, fmt in _CONDITION_HANDLERS:
+        if key in conditions:
+            value = fmt(conditions[key], conditions)
+            if value is not None:
+                cond_items.append(_CONDITION_ITEM % (label, value))
 
-    return '<ul class="comp-list">' + ''.join(lines) + '</ul>'
+    return ''.join(cond_items)
 
 def generate_kb_cards(ethydco_data):
-    """Generate Knowledge Base expandable cards HTML."""
-    cards = []
-
-    # Combine all items
-    all_items = []
-    for item in ethydco_data['feeds']:
-        all_items.append(item)
-    for item in ethydco_data['products']:
-        all_items.append(item)
-    for item in ethydco_data['flared_gases']:
-        all_items.append(item)
-    for item in ethydco_data['fuel_gas']:
-        all_items.append(item)
-    for item in ethydco_data['other_gases']:
-        all_items.append(item)
+    """Generate Knowledge Base expandable cards HTML (cached by data content)."""
+    return _generate_kb_cards_cached(register_data(ethydco_data))
 
-    for item in all_items:
+@functools.lru_cache(maxsize=4)
+def _generate_kb_cards_cached(digest):
+    return ''.join(iter_kb_cards(_DATA_BY_DIGEST[digest]))
+
+# Card markup filled by name with str.format_map
+_KB_CARD_SHELL = '''
+        <div class="kb-card" data-category="{category}" data-id="{item_id}"
+             data-search="{search}"
+             data-design-unit="{design_unit}"
+             data-design-hourly="{design_hourly}" data-design-annual="{design_annual}"
+             data-actual-hourly="{actual_hourly}" data-actual-annual="{actual_annual}">
+            <div class="kb-card-header" data-action="card">
+                <div class="kb-card-icon">{icon}</div>
+                <div class="kb-card-title">
+                    <h3 class="en-only">{name}</h3>
+                    <h3 class="ar-only">{name_ar}</h3>
+                    <span class="kb-card-subtitle">{category_title} | {data_source}</span>
+                </div>
+                <div class="kb-card-summary">
+                    <div class="summary-value">
+                        <span class="design-value">{design_summary}</span>
+                        <span class="actual-value">{actual_summary}</span>
+                        <span class="unit">{design_unit}</span>
+                    </div>
+                </div>
+                <div class="kb-card-expand">
+                    <span class="expand-icon">▼</span>
+                </div>
+            </div>
+            <div class="kb-card-body">{body}
+            </div>
+        </div>
+        '''
+
+# Stream lists of the ETHYDCO data, in card display order
+KB_SECTIONS = ('feeds', 'products', 'flared_gases', 'fuel_gas', 'other_gases')
+
+
+def iter_kb_items(ethydco_data):
+    """Yield every Knowledge Base stream item in display order."""
+    for section in KB_SECTIONS:
+        yield from ethydco_data[section]
+
+
+def kb_category_counts(ethydco_data):
+    """Count Knowledge Base cards per filter category, plus 'all'."""
+    counts = dict.fromkeys(('all', 'feeds', 'products', 'flares', 'fuel', 'other'), 0)
+    for item in iter_kb_items(ethydco_data):
+        counts['all'] += 1
+        counts[item['category']] = counts.get(item['category'], 0) + 1
+    return counts
+
+
+_TAG_RE = re.compile(r'<[^>]*>')
+
+# Stands in for data-search while the card is rendered; tags (and so this
+# attribute) are stripped before the card's text is taken
+_KB_SEARCH_MARKER = '\x00'
+
+def kb_search_text(item, card_html):
+    """Build the lowercased title+body text the KB search box matches a card against.
+
+    Mirrors the card's textContent (conditions, composition, capacity,
+    definition text, ...) so search matches everything the card shows.
+    """
+    text = html.unescape(_TAG_RE.sub('', card_html))
+    return html.escape(' '.join(f"{item['id']} {item['category']} {text}".split()).lower())
+
+
+def iter_kb_cards(ethydco_data):
+    """Yield Knowledge Base expandable card HTML, one card at a time."""
+    for item in iter_kb_items(ethydco_data):
         item_id = item['id']
         name = item['name']
         name_ar = item.get('name_ar', name)
@@ -1218,140 +1465,63 @@ def generate_kb_cards(ethydco_data):
         design_display = format_value_display(design_val)
         actual_display = format_value_display(actual_val)
 
-        # Calculate utilization percentage for progress bar
-        design_num = get_numeric_value(design_val)
-        actual_num = get_numeric_value(actual_val)
-        if design_num and actual_num and design_num > 0:
-            utilization_pct = min(100, (actual_num / design_num) * 100)
-        else:
-            utilization_pct = 0
-
-        # Get composition
-        composition = item.get('composition', {})
-        comp_unit = item.get('composition_unit', '')
-        composition_html = format_composition_html(composition, comp_unit)
-
-        # Get conditions
-        conditions = item.get('conditions', {})
-        conditions_html = ''
-        if conditions:
-            cond_items = []
-            if 'P' in conditions:
-                p_unit = conditions.get('P_unit', 'kg/cm²g')
-                cond_items.append(f"<div class='condition-item'><span class='cond-label'>P</span><span class='cond-value'>{conditions['P']} {p_unit}</span></div>")
-            if 'T' in conditions:
-                t_unit = conditions.get('T_unit', '°C')
-                cond_items.append(f"<div class='condition-item'><span class='cond-label'>T</span><span class='cond-value'>{conditions['T']} {t_unit}</span></div>")
-            if 'pressure' in conditions:
-                p_data = conditions['pressure']
-                if isinstance(p_data, dict):
-                    cond_items.append(f"<div class='condition-item'><span class='cond-label'>P (min)</span><span class='cond-value'>{p_data['min']} {p_data.get('unit', '')}</span></div>")
-            if 'temperature' in conditions:
-                cond_items.append(f"<div class='condition-item'><span class='cond-label'>T</span><span class='cond-value'>{conditions['temperature']}</span></div>")
-            if 'phase' in conditions:
-                cond_items.append(f"<div class='condition-item'><span class='cond-label'>Phase</span><span class='cond-value'>{conditions['phase']}</span></div>")
-            conditions_html = ''.join(cond_items)
-
-        # Get routing
-        routing = item.get('routing', {})
-        routing_html = ''
-        if routing:
-            source = routing.get('source', '')
-            source_ar = routing.get('source_ar', source)
-            dest = routing.get('destination', '')
-            dest_ar = routing.get('destination_ar', dest)
-            routing_html = f'''
-            <div class="routing-section">
-                <h4 class="en-only">Stream Routing</h4>
-                <h4 class="ar-only">مسار التيار</h4>
-                <div class="routing-flow">
-                    <div class="route-node source">
-                        <span class="en-only">{source}</span>
-                        <span class="ar-only">{source_ar}</span>
-                    </div>
-                    <div class="route-arrow">→</div>
-                    <div class="route-node destination">
-                        <span class="en-only">{dest}</span>
-                        <span class="ar-only">{dest_ar}</span>
-                    </div>
-                </div>
-            </div>
-            '''
+        # Generate card icon based on category
+        icon_map = {
+            'feeds': '⚡',
+            'products': '📦',
+            'flares': '🔥',
+            'fuel': '⛽',
+            'other': '🌀'
+        }
+        icon = icon_map.get(category, '📋')
 
-        # Get comments
-        comment = item.get('comment', '')
-        comment_ar = item.get('comment_ar', comment)
-        comment_html = ''
-        if comment:
-            comment_html = f'''
-            <div class="comments-section">
-                <h4 class="en-only">Notes</h4>
-                <h4 class="ar-only">ملاحظات</h4>
-                <p class="en-only">{comment}</p>
-                <p class="ar-only">{comment_ar}</p>
-            </div>
-            '''
+        # Body sections, in display order; each is only built when the item
+        # has the data for it.
+        sections = []
 
-        # Get definition
-        def_key = item.get('definition_key', '')
-        definition_html = ''
-        if def_key and def_key in DEFINITIONS:
-            defn = DEFINITIONS[def_key]
-            definition_html = f'''
-            <div class="definition-toggle" onclick="toggleDefinition(this)">
-                <span class="en-only">📖 What is {defn['term']}?</span>
-                <span class="ar-only">📖 ما هو {defn['term_ar']}؟</span>
-                <span class="toggle-icon">+</span>
-            </div>
-            <div class="definition-content">
-                <p class="simple-def en-only">{defn['simple']}</p>
-                <p class="simple-def ar-only">{defn['simple_ar']}</p>
-                <div class="detailed-def">
-                    <p>{defn['detailed']}</p>
+        # Build capacity section if values exist
+        if design_val is not None or actual_val is not None:
+            # Calculate utilization percentage for progress bar
+            design_num = get_numeric_value(design_val)
+            actual_num = get_numeric_value(actual_val)
+            if design_num and actual_num and design_num > 0:
+                utilization_pct = min(100, (actual_num / design_num) * 100)
+            else:
+                utilization_pct = 0
+
+            sections.append(f'''
+            <div class="capacity-section">
+                <div class="capacity-row">
+                    <span class="label en-only">Design Capacity:</span>
+                    <span class="label ar-only">السعة التصميمية:</span>
+                    <span class="value design" data-value="{design_num or ''}" data-unit="{design_unit}">{design_display} {design_unit}</span>
+                </div>
+                <div class="capacity-row">
+                    <span class="label en-only">Actual Capacity:</span>
+                    <span class="label ar-only">السعة الفعلية:</span>
+                    <span class="value actual" data-value="{actual_num or ''}" data-unit="{actual_unit}">{actual_display} {actual_unit}</span>
+                </div>
+                <div class="capacity-bar">
+                    <div class="bar-fill" style="--fill-ratio: {utilization_pct / 100:.4f}"></div>
+                </div>
+                <div class="utilization-label" style="text-align:right; font-size:0.8rem; color:#64748b; margin-top:5px;">
+                    {utilization_pct:.0f}% <span class="en-only">utilization</span><span class="ar-only">استخدام</span>
                 </div>
             </div>
-            '''
-
-        # Handle special items (impurities, limitations, flares)
-        special_content = ''
-        if 'fresh_feed' in item:
-            fresh = item['fresh_feed']
-            treated = item['treated_feed']
-            special_content = f'''
-            <div class="special-section">
-                <h4 class="en-only">Fresh Feed (from GASCO)</h4>
-                <h4 class="ar-only">التغذية الطازجة (من جاسكو)</h4>
-                <ul class="comp-list">
-                    <li>CO2: {fresh['CO2']['value']} {fresh['CO2']['unit']}</li>
-                    <li>H2S: {fresh['H2S']['value']} {fresh['H2S']['unit']}</li>
-                    <li>Hg: {fresh['Hg']['value']} {fresh['Hg']['unit']}</li>
-                </ul>
-                <h4 class="en-only" style="margin-top:15px;">Treated Feed (to Crackers)</h4>
-                <h4 class="ar-only" style="margin-top:15px;">التغذية المعالجة (للتكسير)</h4>
-                <ul class="comp-list">
-                    <li>CO2: {treated['CO2']['value']} {treated['CO2']['unit']}</li>
-                    <li>H2S: {treated['H2S']}</li>
-                    <li>Hg: {treated['Hg']}</li>
-                </ul>
-            </div>
-            '''
+            ''')
 
-        if 'limitations' in item:
-            lims = item['limitations']
-            lims_ar = item.get('limitations_ar', lims)
-            lim_items_en = ''.join([f'<li>{l}</li>' for l in lims])
-            lim_items_ar = ''.join([f'<li>{l}</li>' for l in lims_ar])
-            special_content = f'''
+        # Handle special items (impurities, limitations, flares). The first
+        # matching key wins; the order mirrors the original last-assignment
+        # precedence (description > flare_type > limitations > fresh_feed).
+        if 'description' in item:
+            sections.append(f'''
             <div class="special-section">
-                <h4 class="en-only">Feed Limitations</h4>
-                <h4 class="ar-only">قيود التغذية</h4>
-                <ul class="comp-list en-only">{lim_items_en}</ul>
-                <ul class="comp-list ar-only">{lim_items_ar}</ul>
+                <p class="en-only">{item['description']}</p>
+                <p class="ar-only">{item.get('description_ar', item['description'])}</p>
             </div>
-            '''
-
-        if 'flare_type' in item:
-            special_content = f'''
+            ''')
+        elif 'flare_type' in item:
+            sections.append(f'''
             <div class="special-section">
                 <div class="data-row">
                     <span class="en-only">Flare Type:</span>
@@ -1371,66 +1541,59 @@ def generate_kb_cards(ethydco_data):
                     <span>{'No' if not item.get('is_measured', False) else 'Yes'}</span>
                 </div>
             </div>
-            '''
-
-        if 'description' in item:
-            special_content = f'''
-            <div class="special-section">
-                <p class="en-only">{item['description']}</p>
-                <p class="ar-only">{item.get('description_ar', item['description'])}</p>
+            ''')
+        elif 'limitations' in item:
+            lims = item['limitations']
+            lims_ar = item.get('limitations_ar', lims)
+            lim_items_en = ''.join([f'<li>{l}</li>' for l in lims])
+            lim_items_ar = ''.join([f'<li>{l}</li>' for l in lims_ar])
+            sections.append(f'''
+            <div class="special-section">
+                <h4 class="en-only">Feed Limitations</h4>
+                <h4 class="ar-only">قيود التغذية</h4>
+                <ul class="comp-list en-only">{lim_items_en}</ul>
+                <ul class="comp-list ar-only">{lim_items_ar}</ul>
             </div>
-            '''
-
-        # Generate card icon based on category
-        icon_map = {
-            'feeds': '⚡',
-            'products': '📦',
-            'flares': '🔥',
-            'fuel': '⛽',
-            'other': '🌀'
-        }
-        icon = icon_map.get(category, '📋')
-
-        # Build capacity section if values exist
-        capacity_section = ''
-        if design_val is not None or actual_val is not None:
-            capacity_section = f'''
-            <div class="capacity-section">
-                <div class="capacity-row">
-                    <span class="label en-only">Design Capacity:</span>
-                    <span class="label ar-only">السعة التصميمية:</span>
-                    <span class="value design" data-value="{get_numeric_value(design_val) or ''}" data-unit="{design_unit}">{design_display} {design_unit}</span>
-                </div>
-                <div class="capacity-row">
-                    <span class="label en-only">Actual Capacity:</span>
-                    <span class="label ar-only">السعة الفعلية:</span>
-                    <span class="value actual" data-value="{get_numeric_value(actual_val) or ''}" data-unit="{actual_unit}">{actual_display} {actual_unit}</span>
-                </div>
-                <div class="capacity-bar">
-                    <div class="bar-fill" style="width: {utilization_pct:.0f}%"></div>
-                </div>
-                <div class="utilization-label" style="text-align:right; font-size:0.8rem; color:#64748b; margin-top:5px;">
-                    {utilization_pct:.0f}% <span class="en-only">utilization</span><span class="ar-only">استخدام</span>
-                </div>
+            ''')
+        elif 'fresh_feed' in item:
+            fresh = item['fresh_feed']
+            treated = item['treated_feed']
+            sections.append(f'''
+            <div class="special-section">
+                <h4 class="en-only">Fresh Feed (from GASCO)</h4>
+                <h4 class="ar-only">التغذية الطازجة (من جاسكو)</h4>
+                <ul class="comp-list">
+                    <li>CO2: {fresh['CO2']['value']} {fresh['CO2']['unit']}</li>
+                    <li>H2S: {fresh['H2S']['value']} {fresh['H2S']['unit']}</li>
+                    <li>Hg: {fresh['Hg']['value']} {fresh['Hg']['unit']}</li>
+                </ul>
+                <h4 class="en-only" style="margin-top:15px;">Treated Feed (to Crackers)</h4>
+                <h4 class="ar-only" style="margin-top:15px;">التغذية المعالجة (للتكسير)</h4>
+                <ul class="comp-list">
+                    <li>CO2: {treated['CO2']['value']} {treated['CO2']['unit']}</li>
+                    <li>H2S: {treated['H2S']}</li>
+                    <li>Hg: {treated['Hg']}</li>
+                </ul>
             </div>
-            '''
+            ''')
 
         # Build composition section
-        comp_section = ''
-        if composition_html:
-            comp_section = f'''
+        composition = item.get('composition')
+        if composition:
+            comp_unit = item.get('composition_unit', '')
+            sections.append(f'''
             <div class="composition-section">
                 <h4 class="en-only">Composition ({comp_unit})</h4>
                 <h4 class="ar-only">التركيب ({comp_unit})</h4>
-                {composition_html}
+                {format_composition_html(composition, comp_unit)}
                 <div class="comp-chart" id="comp-{item_id}"></div>
             </div>
-            '''
+            ''')
 
         # Build conditions section
-        cond_section = ''
+        conditions_html = format_conditions_html(item.get('conditions'))
         if conditions_html:
-            cond_section = f'''
+            sections.append(f'''
             <div class="conditions-section">
                 <h4 class="en-only">Operating Conditions</h4>
                 <h4 class="ar-only">ظروف التشغيل</h4>
@@ -1438,161 +1601,242 @@ def generate_kb_cards(ethydco_data):
                     {conditions_html}
                 </div>
             </div>
-            '''
+            ''')
 
-        # Build complete card
-        card = f'''
-        <div class="kb-card" data-category="{category}" data-id="{item_id}"
-             data-design-value="{get_numeric_value(design_val) or ''}"
-             data-design-unit="{design_unit}"
-             data-actual-value="{get_numeric_value(actual_val) or ''}"
-             data-actual-unit="{actual_unit}">
-            <div class="kb-card-header" onclick="toggleCard(this)">
-                <div class="kb-card-icon">{icon}</div>
-                <div class="kb-card-title">
-                    <h3 class="en-only">{name}</h3>
-                    <h3 class="ar-only">{name_ar}</h3>
-                    <span class="kb-card-subtitle">{category.title()} | {data_source}</span>
-                </div>
-                <div class="kb-card-summary">
-                    <div class="summary-value">
-                        <span class="design-value">{design_display if design_val else ''}</span>
-                        <span class="actual-value">{actual_display if actual_val else ''}</span>
-                        <span class="unit">{design_unit}</span>
+        # Get routing
+        routing = item.get('routing')
+        if routing:
+            source = routing.get('source', '')
+            source_ar = routing.get('source_ar', source)
+            dest = routing.get('destination', '')
+            dest_ar = routing.get('destination_ar', dest)
+            sections.append(f'''
+            <div class="routing-section">
+                <h4 class="en-only">Stream Routing</h4>
+                <h4 class="ar-only">مسار التيار</h4>
+                <div class="routing-flow">
+                    <div class="route-node source">
+                        <span class="en-only">{source}</span>
+                        <span class="ar-only">{source_ar}</span>
+                    </div>
+                    <div class="route-arrow">→</div>
+                    <div class="route-node destination">
+                        <span class="en-only">{dest}</span>
+                        <span class="ar-only">{dest_ar}</span>
                     </div>
                 </div>
-                <div class="kb-card-expand">
-                    <span class="expand-icon">▼</span>
+            </div>
+            ''')
+
+        # Get definition
+        defn = DEFINITIONS.get(item.get('definition_key', ''))
+        if defn:
+            sections.append(f'''
+            <div class="definition-toggle" data-action="definition">
+                <span class="en-only">📖 What is {defn['term']}?</span>
+                <span class="ar-only">📖 ما هو {defn['term_ar']}؟</span>
+                <span class="toggle-icon">+</span>
+            </div>
+            <div class="definition-content">
+                <div class="definition-body">
+                    <div class="definition-inner">
+                        <p class="simple-def en-only">{defn['simple']}</p>
+                        <p class="simple-def ar-only">{defn['simple_ar']}</p>
+                        <div class="detailed-def">
+                            <p>{defn['detailed']}</p>
+                        </div>
+                    </div>
                 </div>
             </div>
-            <div class="kb-card-body">
-                {capacity_section}
-                {special_content}
-                {comp_section}
-                {cond_section}
-                {routing_html}
-                {definition_html}
-                {comment_html}
+            ''')
+
+        # Get comments
+        comment = item.get('comment', '')
+        if comment:
+            comment_ar = item.get('comment_ar', comment)
+            sections.append(f'''
+            <div class="comments-section">
+                <h4 class="en-only">Notes</h4>
+                <h4 class="ar-only">ملاحظات</h4>
+                <p class="en-only">{comment}</p>
+                <p class="ar-only">{comment_ar}</p>
+            </div>
+            ''')
+
+        # Build complete card
+        design_hourly, design_annual = unit_display_strings(design_val, design_unit)
+        actual_hourly, actual_annual = unit_display_strings(actual_val, actual_unit or design_unit)
+        card = _KB_CARD_SHELL.format_map({
+            'category': category, 'item_id': item_id,
+            'search': _KB_SEARCH_MARKER, 'design_unit': design_unit,
+            'design_hourly': design_hourly, 'design_annual': design_annual,
+            'actual_hourly': actual_hourly, 'actual_annual': actual_annual,
+            'icon': icon, 'name': name, 'name_ar': name_ar,
+            'category_title': category.title(), 'data_source': data_source,
+            'design_summary': design_display if design_val else '',
+            'actual_summary': actual_display if actual_val else '',
+            'body': ''.join(sections)
+        })
+        yield card.replace(_KB_SEARCH_MARKER, kb_search_text(item, card), 1)
+
+
+_DEF_CARD_TEMPLATE = '''
+        <div class="def-card" data-action="def-card">
+            <div class="def-term en-only">{term}</div>
+            <div class="def-term ar-only">{term_ar}</div>
+            <div class="def-simple en-only">{simple}</div>
+            <div class="def-simple ar-only">{simple_ar}</div>
+            <div class="def-detailed">
+                <p>{detailed}</p>
             </div>
         </div>
         '''
-        cards.append(card)
-
-    return ''.join(cards)
-
 
 def generate_definitions_html():
     """Generate definitions/glossary section HTML."""
-    cards = []
-    for key, defn in DEFINITIONS.items():
-        card = f'''
-        <div class="def-card" onclick="toggleDefCard(this)">
-            <div class="def-term en-only">{defn['term']}</div>
-            <div class="def-term ar-only">{defn['term_ar']}</div>
-            <div class="def-simple en-only">{defn['simple']}</div>
-            <div class="def-simple ar-only">{defn['simple_ar']}</div>
-            <div class="def-detailed" style="display:none;">
-                <p>{defn['detailed']}</p>
+    return ''.join(_DEF_CARD_TEMPLATE.format_map(defn) for defn in DEFINITIONS.values())
+
+
+def generate_kb_html(ethydco_data):
+    """Generate the Knowledge Base tab markup (cached by data content)."""
+    return _generate_kb_html_cached(register_data(ethydco_data))
+
+@functools.lru_cache(maxsize=4)
+def _generate_kb_html_cached(digest):
+    ethydco_data = _DATA_BY_DIGEST[digest]
+    info = ethydco_data['company_info']
+    counts = kb_category_counts(ethydco_data)
+    return f'''
+            <!-- Header Section with Company Info -->
+            <div class="kb-header">
+                <div class="company-info-card">
+                    <div class="company-logo">E</div>
+                    <div class="company-details">
+                        <h2 class="en-only">{info['name']} - {info['full_name']}</h2>
+                        <h2 class="ar-only">{info['name_ar']} - {info['full_name_ar']}</h2>
+                        <p class="en-only">{info['scope']}</p>
+                        <p class="ar-only">{info['scope_ar']}</p>
+                    </div>
+                </div>
+
+                <!-- Controls Row -->
+                <div class="kb-controls">
+                    <!-- Search Box -->
+                    <div class="search-box">
+                        <input type="text" id="kb-search" placeholder="Search streams, products..." oninput="filterKB()">
+                        <span class="search-icon">🔍</span>
+                    </div>
+
+                    <!-- Unit Toggle -->
+                    <div class="unit-toggle">
+                        <button class="unit-btn active" data-action="unit" data-unit="hourly">T/hr</button>
+                        <button class="unit-btn" data-action="unit" data-unit="annual">T/year</button>
+                    </div>
+                </div>
             </div>
-        </div>
-        '''
-        cards.append(card)
-    return ''.join(cards)
 
+            <!-- Category Navigation -->
+            <div class="category-nav">
+                <button class="cat-btn active" data-action="category" data-cat="all">
+                    <span class="i18n" data-en="All" data-ar="الكل"></span>
+                    <span class="cat-count" id="count-all">{counts['all']}</span>
+                </button>
+                <button class="cat-btn" data-action="category" data-cat="feeds">
+                    <span class="cat-icon">⚡</span>
+                    <span class="i18n" data-en="Feeds" data-ar="التغذية"></span>
+                    <span class="cat-count" id="count-feeds">{counts['feeds']}</span>
+                </button>
+                <button class="cat-btn" data-action="category" data-cat="products">
+                    <span class="cat-icon">📦</span>
+                    <span class="i18n" data-en="Products" data-ar="المنتجات"></span>
+                    <span class="cat-count" id="count-products">{counts['products']}</span>
+                </button>
+                <button class="cat-btn" data-action="category" data-cat="flares">
+                    <span class="cat-icon">🔥</span>
+                    <span class="i18n" data-en="Flares" data-ar="الشعلات"></span>
+                    <span class="cat-count" id="count-flares">{counts['flares']}</span>
+                </button>
+                <button class="cat-btn" data-action="category" data-cat="fuel">
+                    <span class="cat-icon">⛽</span>
+                    <span class="i18n" data-en="Fuel Gas" data-ar="غاز الوقود"></span>
+                    <span class="cat-count" id="count-fuel">{counts['fuel']}</span>
+                </button>
+                <button class="cat-btn" data-action="category" data-cat="other">
+                    <span class="cat-icon">🌀</span>
+                    <span class="i18n" data-en="Other" data-ar="أخرى"></span>
+                    <span class="cat-count" id="count-other">{counts['other']}</span>
+                </button>
+            </div>
 
-# ============================================================================
-# HTML GENERATION - ORIGINAL DASHBOARD
-# ============================================================================
+            <!-- Filter Indicator -->
+            <div class="filter-indicator" id="filter-indicator">
+                <span id="filter-text"></span>
+                <button class="clear-btn" data-action="clear-filters">✕</button>
+            </div>
 
-def generate_stream_cards(metrics):
-    """Generate stream detail cards HTML."""
-    cards = []
-    for i in range(6):
-        flow_val = metrics['streams']['flow_ty'][i] / 1000
-        card = f'''
-        <div class="data-card">
-            <div class="data-card-header">{metrics['streams']['names'][i]} <span class="ar-only">({metrics['streams']['names_ar'][i]})</span></div>
-            <div class="data-card-value">{flow_val:.1f}K <span style="font-size: 0.8rem; color: var(--gray);">t/y</span></div>
-            <div class="data-row"><span>H2</span><span>{metrics['stream_components']['H2'][i]:,.0f} t/y</span></div>
-            <div class="data-row"><span>CH4</span><span>{metrics['stream_components']['CH4'][i]:,.0f} t/y</span></div>
-            <div class="data-row"><span>C2</span><span>{metrics['stream_components']['C2'][i]:,.0f} t/y</span></div>
-            <div class="data-row"><span>C3</span><span>{metrics['stream_components']['C3'][i]:,.0f} t/y</span></div>
-            <div class="data-row"><span>C4</span><span>{metrics['stream_components']['C4'][i]:,.0f} t/y</span></div>
-            <div class="data-row"><span>C5+</span><span>{metrics['stream_components']['C5+'][i]:,.0f} t/y</span></div>
-        </div>
-        '''
-        cards.append(card)
-    return ''.join(cards)
+            <!-- CARDS FIRST - Primary Content -->
+            <div class="kb-cards-grid" id="kb-cards-container">
+                {generate_kb_cards(ethydco_data)}
+            </div>
 
-def generate_prices_table(metrics):
-    """Generate product prices table rows."""
-    rows = []
-    for k, v in metrics['prices'].items():
-        rows.append(f'<tr><td>{k}</td><td>${v:,}</td></tr>')
-    return ''.join(rows)
+            <!-- Collapsible Charts Section - AT BOTTOM -->
+            <div class="kb-charts-section">
+                <div class="charts-toggle" data-action="charts-section">
+                    <h3>
+                        <span>📊</span>
+                        <span class="i18n" data-en="Charts & Visualizations" data-ar="الرسوم البيانية"></span>
+                    </h3>
+                    <span class="toggle-arrow">▼</span>
+                </div>
+                <div class="kb-charts-content" id="kb-charts-content">
+                    <div class="chart-grid">
+                        <div class="chart-card">
+                            <div class="chart-title">
+                                <span class="i18n" data-en="Design vs Actual Capacity" data-ar="السعة التصميمية مقابل الفعلية"></span>
+                            </div>
+                            <div id="chart-kb-design-en" class="en-only"></div>
+                            <div id="chart-kb-design-ar" class="ar-only"></div>
+                        </div>
+                        <div class="chart-card">
+                            <div class="chart-title">
+                                <span class="i18n" data-en="ETHYDCO Process Flow" data-ar="مسار العمليات في إيثيدكو"></span>
+                            </div>
+                            <div id="chart-kb-routing-en" class="en-only"></div>
+                            <div id="chart-kb-routing-ar" class="ar-only"></div>
+                        </div>
+                    </div>
+                </div>
+            </div>
 
-def generate_html(metrics):
-    """Generate the complete modern HTML dashboard."""
+            <!-- Collapsible Definitions Section - AT BOTTOM -->
+            <div class="definitions-section">
+                <div class="definitions-toggle" data-action="definitions-section">
+                    <h3>
+                        <span>📖</span>
+                        <span class="i18n" data-en="Glossary / Definitions" data-ar="المصطلحات والتعريفات"></span>
+                    </h3>
+                    <span class="toggle-arrow">▼</span>
+                </div>
+                <div class="definitions-content" id="definitions-content">
+                    <div class="definitions-grid" id="definitions-container">
+                        {DEFINITIONS_HTML}
+                    </div>
+                </div>
+            </div>
+'''
 
-    # Pre-generate stream cards and price table
-    stream_cards_html = generate_stream_cards(metrics)
-    prices_table_html = generate_prices_table(metrics)
 
-    # Load ETHYDCO data and generate Knowledge Base content
-    ethydco_data = load_ethydco_data()
-    kb_cards_html = generate_kb_cards(ethydco_data)
-    definitions_html = generate_definitions_html()
-
-    # Pre-generate all charts for both languages
-    charts = {
-        'en': {
-            'donut': create_phase_donut(metrics, 'en'),
-            'products': create_product_bars(metrics, 'en'),
-            'cost_benefit': create_cost_benefit_bars(metrics, 'en'),
-            'sankey': create_sankey(metrics, 'en'),
-            'gauge_min': create_gauge(metrics['calc3']['coverage_min'], 100, 'Min Coverage', 'en'),
-            'gauge_max': create_gauge(metrics['calc3']['coverage_max'], 100, 'Max Coverage', 'en'),
-            'h2_balance': create_h2_balance(metrics, 'en'),
-            'heatmap': create_stream_heatmap(metrics, 'en'),
-            'methanol': create_methanol_allocation(metrics, 'en'),
-            'kb_design_actual': create_design_actual_chart(ethydco_data, 'en'),
-            'kb_routing': create_routing_sankey(ethydco_data, 'en')
-        },
-        'ar': {
-            'donut': create_phase_donut(metrics, 'ar'),
-            'products': create_product_bars(metrics, 'ar'),
-            'cost_benefit': create_cost_benefit_bars(metrics, 'ar'),
-            'sankey': create_sankey(metrics, 'ar'),
-            'gauge_min': create_gauge(metrics['calc3']['coverage_min'], 100, 'تغطية الحد الأدنى', 'ar'),
-            'gauge_max': create_gauge(metrics['calc3']['coverage_max'], 100, 'تغطية الحد الأقصى', 'ar'),
-            'h2_balance': create_h2_balance(metrics, 'ar'),
-            'heatmap': create_stream_heatmap(metrics, 'ar'),
-            'methanol': create_methanol_allocation(metrics, 'ar'),
-            'kb_design_actual': create_design_actual_chart(ethydco_data, 'ar'),
-            'kb_routing': create_routing_sankey(ethydco_data, 'ar')
-        }
-    }
+# The glossary depends only on DEFINITIONS, so it is rendered once at import
+DEFINITIONS_HTML = generate_definitions_html()
 
-    # Extract values for KPIs
-    total_value = metrics['summary']['total_net']
-    phase12 = metrics['summary']['phase12_net']
-    phase34 = metrics['summary']['phase34_net']
 
-    # ETHYDCO company info
-    company_name = ethydco_data['company_info']['name']
-    company_full = ethydco_data['company_info']['full_name']
-    company_scope = ethydco_data['company_info']['scope']
+# ============================================================================
+# HTML GENERATION - STYLES
+# ============================================================================
 
-    html = f'''<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>MIDOR-ETHYDCO Integration Dashboard</title>
-    <link href="https://fonts.googleapis.com/css2?family=Inter:wght@300;400;500;600;700;800&family=Cairo:wght@400;600;700&display=swap" rel="stylesheet">
-    <script src="https://cdn.plot.ly/plotly-2.27.0.min.js"></script>
-    <style>
-        :root {{
+# Page-wide stylesheet (header, nav, overview to detailed tabs), built once at
+# import and inlined in <head> by DASHBOARD_HEAD.
+DASHBOARD_CSS = '''        :root {
             --primary: #0ea5e9;
             --primary-dark: #0284c7;
             --secondary: #06b6d4;
@@ -1608,29 +1852,34 @@ def generate_html(metrics):
             --glass-border: rgba(255, 255, 255, 0.2);
             --shadow: 0 25px 50px -12px rgba(0, 0, 0, 0.25);
             --shadow-sm: 0 10px 40px -10px rgba(0, 0, 0, 0.15);
-        }}
+            /* Text scale shared by the card and table rules */
+            --fs-xs: 0.75rem;
+            --fs-sm: 0.85rem;
+            --fs-md: 0.9rem;
+            --fs-base: 1rem;
+        }
 
-        * {{
+        * {
             margin: 0;
             padding: 0;
             box-sizing: border-box;
-        }}
+        }
 
-        body {{
+        body {
             font-family: 'Inter', sans-serif;
             background: linear-gradient(135deg, var(--dark) 0%, #1a1a2e 50%, var(--dark-light) 100%);
             min-height: 100vh;
             color: var(--white);
             overflow-x: hidden;
-        }}
+        }
 
-        body.rtl {{
+        body.rtl {
             direction: rtl;
             font-family: 'Cairo', sans-serif;
-        }}
+        }
 
         /* Animated background */
-        .bg-animation {{
+        .bg-animation {
             position: fixed;
             top: 0;
             left: 0;
@@ -1638,9 +1887,11 @@ def generate_html(metrics):
             height: 100%;
             z-index: -1;
             overflow: hidden;
-        }}
+            pointer-events: none;
+            contain: strict;
+        }
 
-        .bg-animation::before {{
+        .bg-animation::before {
             content: '';
             position: absolute;
             top: -50%;
@@ -1651,15 +1902,16 @@ def generate_html(metrics):
                         radial-gradient(circle at 80% 20%, rgba(245, 158, 11, 0.1) 0%, transparent 50%),
                         radial-gradient(circle at 40% 40%, rgba(14, 165, 233, 0.1) 0%, transparent 40%);
             animation: rotate 30s linear infinite;
-        }}
+            will-change: transform;
+        }
 
-        @keyframes rotate {{
-            from {{ transform: rotate(0deg); }}
-            to {{ transform: rotate(360deg); }}
-        }}
+        @keyframes rotate {
+            from { transform: rotate(0deg); }
+            to { transform: rotate(360deg); }
+        }
 
         /* Header */
-        .header {{
+        .header {
             padding: 30px 50px;
             display: flex;
             justify-content: space-between;
@@ -1670,15 +1922,15 @@ def generate_html(metrics):
             position: sticky;
             top: 0;
             z-index: 100;
-        }}
+        }
 
-        .logo {{
+        .logo {
             display: flex;
             align-items: center;
             gap: 15px;
-        }}
+        }
 
-        .logo-icon {{
+        .logo-icon {
             width: 50px;
             height: 50px;
             background: linear-gradient(135deg, var(--primary) 0%, var(--secondary) 100%);
@@ -1689,64 +1941,64 @@ def generate_html(metrics):
             font-size: 24px;
             font-weight: 800;
             box-shadow: 0 10px 30px rgba(6, 182, 212, 0.3);
-        }}
+        }
 
-        .logo-text h1 {{
+        .logo-text h1 {
             font-size: 1.5rem;
             font-weight: 700;
             background: linear-gradient(90deg, var(--white) 0%, var(--secondary) 100%);
             -webkit-background-clip: text;
             -webkit-text-fill-color: transparent;
             background-clip: text;
-        }}
+        }
 
-        .logo-text span {{
-            font-size: 0.85rem;
+        .logo-text span {
+            font-size: var(--fs-sm);
             color: var(--gray);
-        }}
+        }
 
         /* Language Toggle */
-        .lang-toggle {{
+        .lang-toggle {
             display: flex;
             background: var(--glass);
             border-radius: 50px;
             padding: 5px;
             border: 1px solid var(--glass-border);
-        }}
+        }
 
-        .lang-btn {{
+        .lang-btn {
             padding: 10px 25px;
             border: none;
             background: transparent;
             color: var(--gray);
-            font-size: 0.9rem;
+            font-size: var(--fs-md);
             font-weight: 600;
             cursor: pointer;
             border-radius: 50px;
-            transition: all 0.3s ease;
+            transition: background 0.3s ease, color 0.3s ease, box-shadow 0.3s ease;
             font-family: inherit;
-        }}
+        }
 
-        .lang-btn.active {{
+        .lang-btn.active {
             background: linear-gradient(135deg, var(--primary) 0%, var(--secondary) 100%);
             color: var(--white);
             box-shadow: 0 5px 20px rgba(6, 182, 212, 0.4);
-        }}
+        }
 
-        .lang-btn:hover:not(.active) {{
+        .lang-btn:hover:not(.active) {
             color: var(--white);
-        }}
+        }
 
         /* Navigation */
-        .nav {{
+        .nav {
             display: flex;
             justify-content: center;
             gap: 10px;
             padding: 20px 50px;
             flex-wrap: wrap;
-        }}
+        }
 
-        .nav-btn {{
+        .nav-btn {
             padding: 14px 28px;
             background: var(--glass);
             border: 1px solid var(--glass-border);
@@ -1755,55 +2007,55 @@ def generate_html(metrics):
             font-size: 0.95rem;
             font-weight: 500;
             cursor: pointer;
-            transition: all 0.3s ease;
+            transition: background 0.3s ease, border-color 0.3s ease, color 0.3s ease, box-shadow 0.3s ease, transform 0.3s ease;
             backdrop-filter: blur(10px);
             font-family: inherit;
-        }}
+        }
 
-        .nav-btn:hover {{
+        .nav-btn:hover {
             background: rgba(14, 165, 233, 0.2);
             border-color: var(--primary);
             color: var(--white);
             transform: translateY(-2px);
-        }}
+        }
 
-        .nav-btn.active {{
+        .nav-btn.active {
             background: linear-gradient(135deg, var(--primary) 0%, var(--secondary) 100%);
             border-color: transparent;
             color: var(--white);
             box-shadow: 0 10px 30px rgba(6, 182, 212, 0.3);
-        }}
+        }
 
         /* Main Content */
-        .content {{
+        .content {
             max-width: 1600px;
             margin: 0 auto;
             padding: 30px 50px 60px;
-        }}
+        }
 
-        .tab-content {{
+        .tab-content {
             display: none;
             animation: fadeIn 0.5s ease;
-        }}
+        }
 
-        .tab-content.active {{
+        .tab-content.active {
             display: block;
-        }}
+        }
 
-        @keyframes fadeIn {{
-            from {{ opacity: 0; transform: translateY(20px); }}
-            to {{ opacity: 1; transform: translateY(0); }}
-        }}
+        @keyframes fadeIn {
+            from { opacity: 0; transform: translateY(20px); }
+            to { opacity: 1; transform: translateY(0); }
+        }
 
         /* KPI Section */
-        .kpi-section {{
+        .kpi-section {
             display: grid;
             grid-template-columns: 2fr 1fr 1fr;
             gap: 25px;
             margin-bottom: 40px;
-        }}
+        }
 
-        .kpi-card {{
+        .kpi-card {
             background: var(--glass);
             backdrop-filter: blur(20px);
             border: 1px solid var(--glass-border);
@@ -1811,16 +2063,16 @@ def generate_html(metrics):
             padding: 35px;
             position: relative;
             overflow: hidden;
-            transition: all 0.4s ease;
-        }}
+            transition: border-color 0.4s ease, box-shadow 0.4s ease, transform 0.4s ease;
+        }
 
-        .kpi-card:hover {{
+        .kpi-card:hover {
             transform: translateY(-5px);
             box-shadow: var(--shadow);
             border-color: var(--primary);
-        }}
+        }
 
-        .kpi-card::before {{
+        .kpi-card::before {
             content: '';
             position: absolute;
             top: 0;
@@ -1828,32 +2080,32 @@ def generate_html(metrics):
             right: 0;
             height: 4px;
             background: linear-gradient(90deg, var(--primary) 0%, var(--secondary) 100%);
-        }}
+        }
 
-        .kpi-card.accent::before {{
+        .kpi-card.accent::before {
             background: linear-gradient(90deg, var(--accent) 0%, #fbbf24 100%);
-        }}
+        }
 
-        .kpi-card.success::before {{
+        .kpi-card.success::before {
             background: linear-gradient(90deg, var(--success) 0%, #4ade80 100%);
-        }}
+        }
 
-        .kpi-card.main {{
+        .kpi-card.main {
             grid-row: span 2;
             display: flex;
             flex-direction: column;
             justify-content: center;
             text-align: center;
-        }}
+        }
 
-        .kpi-label {{
-            font-size: 1rem;
+        .kpi-label {
+            font-size: var(--fs-base);
             color: var(--gray);
             margin-bottom: 15px;
             font-weight: 500;
-        }}
+        }
 
-        .kpi-value {{
+        .kpi-value {
             font-size: 4rem;
             font-weight: 800;
             background: linear-gradient(135deg, var(--white) 0%, var(--secondary) 100%);
@@ -1862,61 +2114,61 @@ def generate_html(metrics):
             background-clip: text;
             line-height: 1;
             margin-bottom: 15px;
-        }}
+        }
 
-        .kpi-card.main .kpi-value {{
+        .kpi-card.main .kpi-value {
             font-size: 5.5rem;
-        }}
+        }
 
-        .kpi-sublabel {{
-            font-size: 0.9rem;
+        .kpi-sublabel {
+            font-size: var(--fs-md);
             color: var(--gray);
-        }}
+        }
 
-        .kpi-icon {{
+        .kpi-icon {
             position: absolute;
             top: 25px;
             right: 25px;
             font-size: 2.5rem;
             opacity: 0.15;
-        }}
+        }
 
-        .rtl .kpi-icon {{
+        .rtl .kpi-icon {
             right: auto;
             left: 25px;
-        }}
+        }
 
         /* Chart Cards */
-        .chart-grid {{
+        .chart-grid {
             display: grid;
             grid-template-columns: repeat(2, 1fr);
             gap: 25px;
             margin-bottom: 30px;
-        }}
+        }
 
-        .chart-grid.three {{
+        .chart-grid.three {
             grid-template-columns: repeat(3, 1fr);
-        }}
+        }
 
-        .chart-card {{
+        .chart-card {
             background: var(--glass);
             backdrop-filter: blur(20px);
             border: 1px solid var(--glass-border);
             border-radius: 24px;
             padding: 25px;
-            transition: all 0.4s ease;
-        }}
+            transition: border-color 0.4s ease, box-shadow 0.4s ease;
+        }
 
-        .chart-card:hover {{
+        .chart-card:hover {
             border-color: var(--primary);
             box-shadow: var(--shadow-sm);
-        }}
+        }
 
-        .chart-card.full {{
+        .chart-card.full {
             grid-column: 1 / -1;
-        }}
+        }
 
-        .chart-title {{
+        .chart-title {
             font-size: 1.1rem;
             font-weight: 600;
             color: var(--white);
@@ -1924,331 +2176,342 @@ def generate_html(metrics):
             display: flex;
             align-items: center;
             gap: 10px;
-        }}
+        }
 
-        .chart-title::before {{
+        .chart-title::before {
             content: '';
             width: 4px;
             height: 20px;
             background: linear-gradient(180deg, var(--primary) 0%, var(--secondary) 100%);
             border-radius: 2px;
-        }}
+        }
 
         /* Data Cards */
-        .data-grid {{
+        .data-grid {
             display: grid;
             grid-template-columns: repeat(auto-fit, minmax(280px, 1fr));
             gap: 20px;
             margin-bottom: 30px;
-        }}
+        }
 
-        .data-card {{
+        .data-card {
             background: var(--glass);
             backdrop-filter: blur(20px);
             border: 1px solid var(--glass-border);
             border-radius: 20px;
             padding: 25px;
-            transition: all 0.3s ease;
-        }}
+            transition: border-color 0.3s ease, transform 0.3s ease;
+        }
 
-        .data-card:hover {{
+        .data-card:hover {
             transform: translateY(-3px);
             border-color: var(--secondary);
-        }}
+        }
 
-        .data-card-header {{
+        .data-card-header {
             font-weight: 600;
-            font-size: 1rem;
+            font-size: var(--fs-base);
             color: var(--secondary);
             margin-bottom: 15px;
             padding-bottom: 10px;
             border-bottom: 1px solid var(--glass-border);
-        }}
+        }
 
-        .data-card-value {{
+        .data-card-value {
             font-size: 2rem;
             font-weight: 700;
             color: var(--white);
             margin-bottom: 5px;
-        }}
+        }
 
-        .data-row {{
+        .data-row {
             display: flex;
             justify-content: space-between;
             padding: 8px 0;
             border-bottom: 1px dashed rgba(255,255,255,0.1);
-            font-size: 0.9rem;
-        }}
+            font-size: var(--fs-md);
+        }
 
-        .data-row:last-child {{
+        .data-row:last-child {
             border-bottom: none;
-        }}
+        }
 
-        .data-row span:first-child {{
+        .data-row span:first-child {
             color: var(--gray);
-        }}
+        }
 
-        .data-row span:last-child {{
+        .data-row span:last-child {
             color: var(--white);
             font-weight: 500;
-        }}
+        }
 
         /* Gauge Container */
-        .gauge-container {{
+        /* Labels sit under the two halves of one gauge figure, which Plotly
+           does not mirror for RTL, so keep the columns in LTR order */
+        .gauge-container {
             display: grid;
             grid-template-columns: repeat(2, 1fr);
             gap: 20px;
-        }}
+            direction: ltr;
+        }
 
-        .gauge-card {{
+        .gauge-card {
             text-align: center;
-        }}
+        }
 
-        .gauge-label {{
-            font-size: 0.9rem;
+        .gauge-label {
+            font-size: var(--fs-md);
             color: var(--gray);
             margin-top: 10px;
-        }}
+        }
 
         /* Table Styles */
-        .table-container {{
+        .table-container {
             background: var(--glass);
             backdrop-filter: blur(20px);
             border: 1px solid var(--glass-border);
             border-radius: 20px;
             padding: 25px;
             overflow-x: auto;
-        }}
+        }
 
-        .data-table {{
+        .data-table {
             width: 100%;
             border-collapse: collapse;
-        }}
+        }
 
-        .data-table th {{
+        .data-table th {
             background: rgba(14, 165, 233, 0.2);
             color: var(--secondary);
             padding: 15px;
             text-align: left;
             font-weight: 600;
-            font-size: 0.9rem;
-        }}
+            font-size: var(--fs-md);
+        }
 
-        .rtl .data-table th {{
+        .rtl .data-table th {
             text-align: right;
-        }}
+        }
 
-        .data-table td {{
+        .data-table td {
             padding: 15px;
             border-bottom: 1px solid var(--glass-border);
             color: var(--white);
-            font-size: 0.9rem;
-        }}
+            font-size: var(--fs-md);
+        }
 
-        .data-table tr:hover td {{
+        .data-table tr:hover td {
             background: rgba(255,255,255,0.05);
-        }}
+        }
 
-        .data-table .value {{
+        .data-table .value {
             color: var(--success);
             font-weight: 600;
-        }}
+        }
 
-        .data-table .cost {{
+        .data-table .cost {
             color: var(--danger);
-        }}
+        }
 
         /* Footer */
-        .footer {{
+        .footer {
             text-align: center;
             padding: 40px;
             color: var(--gray);
-            font-size: 0.85rem;
-        }}
+            font-size: var(--fs-sm);
+        }
 
         /* Responsive */
-        @media (max-width: 1200px) {{
-            .kpi-section {{
+        @media (max-width: 1200px) {
+            .kpi-section {
                 grid-template-columns: 1fr 1fr;
-            }}
-            .kpi-card.main {{
+            }
+            .kpi-card.main {
                 grid-column: 1 / -1;
                 grid-row: auto;
-            }}
-            .chart-grid.three {{
+            }
+            .chart-grid.three {
                 grid-template-columns: repeat(2, 1fr);
-            }}
-        }}
+            }
+        }
 
-        @media (max-width: 900px) {{
-            .header {{
+        @media (max-width: 900px) {
+            .header {
                 padding: 20px 25px;
                 flex-direction: column;
                 gap: 20px;
-            }}
-            .content {{
+            }
+            .content {
                 padding: 20px 25px 40px;
-            }}
-            .chart-grid {{
+            }
+            .chart-grid {
                 grid-template-columns: 1fr;
-            }}
-            .chart-grid.three {{
+            }
+            .chart-grid.three {
                 grid-template-columns: 1fr;
-            }}
-            .kpi-section {{
+            }
+            .kpi-section {
                 grid-template-columns: 1fr;
-            }}
-            .kpi-card.main .kpi-value {{
+            }
+            .kpi-card.main .kpi-value {
                 font-size: 3.5rem;
-            }}
-            .nav {{
+            }
+            .nav {
                 padding: 15px 20px;
-            }}
-            .nav-btn {{
+            }
+            .nav-btn {
                 padding: 12px 20px;
-                font-size: 0.85rem;
-            }}
-            .gauge-container {{
+                font-size: var(--fs-sm);
+            }
+            .gauge-container {
                 grid-template-columns: 1fr 1fr;
                 gap: 10px;
-            }}
-            .data-grid {{
+            }
+            .data-grid {
                 grid-template-columns: 1fr;
-            }}
-        }}
+            }
+        }
 
         /* Mobile phones */
-        @media (max-width: 480px) {{
-            .header {{
+        @media (max-width: 480px) {
+            .header {
                 padding: 15px;
                 gap: 15px;
-            }}
-            .logo-text h1 {{
+            }
+            .logo-text h1 {
                 font-size: 1.2rem;
-            }}
-            .logo-text span {{
-                font-size: 0.75rem;
-            }}
-            .logo-icon {{
+            }
+            .logo-text span {
+                font-size: var(--fs-xs);
+            }
+            .logo-icon {
                 width: 40px;
                 height: 40px;
                 font-size: 20px;
-            }}
-            .lang-toggle {{
+            }
+            .lang-toggle {
                 width: 100%;
                 justify-content: center;
-            }}
-            .lang-btn {{
+            }
+            .lang-btn {
                 padding: 8px 20px;
-                font-size: 0.85rem;
-            }}
-            .nav {{
+                font-size: var(--fs-sm);
+            }
+            .nav {
                 padding: 10px 15px;
                 gap: 8px;
-            }}
-            .nav-btn {{
+            }
+            .nav-btn {
                 padding: 10px 14px;
                 font-size: 0.8rem;
                 border-radius: 10px;
-            }}
-            .content {{
+            }
+            .content {
                 padding: 15px 15px 30px;
-            }}
-            .kpi-card {{
+            }
+            .kpi-card {
                 padding: 20px;
                 border-radius: 16px;
-            }}
-            .kpi-card.main .kpi-value {{
+            }
+            .kpi-card.main .kpi-value {
                 font-size: 2.8rem;
-            }}
-            .kpi-value {{
+            }
+            .kpi-value {
                 font-size: 2.5rem;
-            }}
-            .kpi-label {{
-                font-size: 0.9rem;
-            }}
-            .kpi-sublabel {{
+            }
+            .kpi-label {
+                font-size: var(--fs-md);
+            }
+            .kpi-sublabel {
                 font-size: 0.8rem;
-            }}
-            .kpi-icon {{
+            }
+            .kpi-icon {
                 font-size: 2rem;
                 top: 15px;
                 right: 15px;
-            }}
-            .chart-card {{
+            }
+            .chart-card {
                 padding: 15px;
                 border-radius: 16px;
-            }}
-            .chart-title {{
-                font-size: 1rem;
+            }
+            .chart-title {
+                font-size: var(--fs-base);
                 margin-bottom: 15px;
-            }}
-            .gauge-container {{
-                grid-template-columns: 1fr;
+            }
+            .gauge-container {
                 gap: 15px;
-            }}
-            .gauge-label {{
+            }
+            .gauge-label {
                 font-size: 0.8rem;
-            }}
-            .data-card {{
+            }
+            .data-card {
                 padding: 20px;
                 border-radius: 16px;
-            }}
-            .data-card-header {{
-                font-size: 0.9rem;
-            }}
-            .data-card-value {{
+            }
+            .data-card-header {
+                font-size: var(--fs-md);
+            }
+            .data-card-value {
                 font-size: 1.6rem;
-            }}
-            .data-row {{
-                font-size: 0.85rem;
-            }}
-            .table-container {{
+            }
+            .data-row {
+                font-size: var(--fs-sm);
+            }
+            .table-container {
                 padding: 15px;
                 border-radius: 16px;
                 overflow-x: auto;
-            }}
+            }
             .data-table th,
-            .data-table td {{
+            .data-table td {
                 padding: 10px 8px;
                 font-size: 0.8rem;
-            }}
-            .footer {{
+            }
+            .footer {
                 padding: 25px 15px;
-                font-size: 0.75rem;
-            }}
-        }}
+                font-size: var(--fs-xs);
+            }
+        }
 
         /* Extra small phones */
-        @media (max-width: 360px) {{
-            .kpi-card.main .kpi-value {{
+        @media (max-width: 360px) {
+            .kpi-card.main .kpi-value {
                 font-size: 2.2rem;
-            }}
-            .kpi-value {{
+            }
+            .kpi-value {
                 font-size: 2rem;
-            }}
-            .nav-btn {{
+            }
+            .nav-btn {
                 padding: 8px 10px;
-                font-size: 0.75rem;
-            }}
-        }}
+                font-size: var(--fs-xs);
+            }
+        }
 
         /* Hide elements based on language */
-        .en-only {{ display: block; }}
-        .ar-only {{ display: none; }}
-        .rtl .en-only {{ display: none; }}
-        .rtl .ar-only {{ display: block; }}
+        .en-only { display: block; }
+        .ar-only { display: none; }
+        .rtl .en-only { display: none; }
+        .rtl .ar-only { display: block; }
+
+        /* Single-element bilingual chrome labels; the text comes from
+           data-en / data-ar so the hidden language costs no DOM node */
+        .i18n { display: block; }
+        .i18n::before { content: attr(data-en); }
+        .rtl .i18n::before { content: attr(data-ar); }
+'''
 
-        /* ============================================
+# Knowledge Base tab styles. They ship inside the KB <template> next to the
+# markup they style, so the browser only parses them when the tab is opened.
+KB_CSS = '''        /* ============================================
            KNOWLEDGE BASE TAB STYLES - MOBILE FIRST
            ============================================ */
 
         /* KB Header - Compact for mobile */
-        .kb-header {{
+        .kb-header {
             margin-bottom: 15px;
-        }}
+        }
 
-        .company-info-card {{
+        .company-info-card {
             background: var(--glass);
             backdrop-filter: blur(20px);
             border: 1px solid var(--glass-border);
@@ -2258,9 +2521,9 @@ def generate_html(metrics):
             align-items: center;
             gap: 12px;
             margin-bottom: 12px;
-        }}
+        }
 
-        .company-logo {{
+        .company-logo {
             width: 45px;
             height: 45px;
             background: linear-gradient(135deg, #22c55e 0%, #06b6d4 100%);
@@ -2273,34 +2536,34 @@ def generate_html(metrics):
             color: white;
             box-shadow: 0 4px 15px rgba(34, 197, 94, 0.3);
             flex-shrink: 0;
-        }}
+        }
 
-        .company-details h2 {{
-            font-size: 1rem;
+        .company-details h2 {
+            font-size: var(--fs-base);
             margin-bottom: 2px;
             background: linear-gradient(90deg, var(--white) 0%, var(--secondary) 100%);
             -webkit-background-clip: text;
             -webkit-text-fill-color: transparent;
-        }}
+        }
 
-        .company-details p {{
+        .company-details p {
             color: var(--gray);
             font-size: 0.8rem;
-        }}
+        }
 
         /* KB Controls - Stacked on mobile */
-        .kb-controls {{
+        .kb-controls {
             display: flex;
             flex-direction: column;
             gap: 10px;
-        }}
+        }
 
-        .search-box {{
+        .search-box {
             position: relative;
             width: 100%;
-        }}
+        }
 
-        .search-box input {{
+        .search-box input {
             width: 100%;
             padding: 12px 15px 12px 42px;
             background: var(--glass);
@@ -2310,62 +2573,62 @@ def generate_html(metrics):
             font-size: 0.95rem;
             font-family: inherit;
             outline: none;
-            transition: all 0.3s ease;
-        }}
+            transition: border-color 0.3s ease, box-shadow 0.3s ease;
+        }
 
-        .search-box input:focus {{
+        .search-box input:focus {
             border-color: var(--primary);
             box-shadow: 0 0 15px rgba(14, 165, 233, 0.2);
-        }}
+        }
 
-        .search-box .search-icon {{
+        .search-box .search-icon {
             position: absolute;
             left: 14px;
             top: 50%;
             transform: translateY(-50%);
-            font-size: 1rem;
-        }}
+            font-size: var(--fs-base);
+        }
 
-        .rtl .search-box .search-icon {{
+        .rtl .search-box .search-icon {
             left: auto;
             right: 14px;
-        }}
+        }
 
-        .rtl .search-box input {{
+        .rtl .search-box input {
             padding: 12px 42px 12px 15px;
-        }}
+        }
 
         /* Unit Toggle - Full width on mobile */
-        .unit-toggle {{
+        .unit-toggle {
             display: flex;
             background: var(--glass);
             border-radius: 10px;
             padding: 3px;
             border: 1px solid var(--glass-border);
             width: 100%;
-        }}
+        }
 
-        .unit-btn {{
+        .unit-btn {
             flex: 1;
             padding: 10px 15px;
             border: none;
             background: transparent;
             color: var(--gray);
-            font-size: 0.85rem;
+            font-size: var(--fs-sm);
             font-weight: 600;
             cursor: pointer;
             border-radius: 8px;
-            transition: all 0.3s ease;
+            transition: background 0.3s ease, color 0.3s ease;
             font-family: inherit;
-        }}
+        }
 
-        .unit-btn.active {{
+        .unit-btn.active {
             background: var(--primary);
             color: var(--white);
-        }}
+        }
 
         /* Category Navigation - Horizontal scroll on mobile */
-        .category-nav {{
+        .category-nav {
             display: flex;
             gap: 8px;
             padding: 12px 0;
@@ -2374,13 +2637,13 @@ def generate_html(metrics):
             scrollbar-width: none;
             border-bottom: 1px solid var(--glass-border);
             margin-bottom: 15px;
-        }}
+        }
 
-        .category-nav::-webkit-scrollbar {{
+        .category-nav::-webkit-scrollbar {
             display: none;
-        }}
+        }
 
-        .cat-btn {{
+        .cat-btn {
             display: flex;
             align-items: center;
             gap: 6px;
@@ -2392,78 +2655,80 @@ def generate_html(metrics):
             font-size: 0.8rem;
             font-weight: 500;
             cursor: pointer;
-            transition: all 0.3s ease;
+            transition: background 0.3s ease, border-color 0.3s ease, color 0.3s ease;
             font-family: inherit;
             white-space: nowrap;
             flex-shrink: 0;
-        }}
+        }
 
-        .cat-btn:hover {{
+        .cat-btn:hover {
             background: rgba(14, 165, 233, 0.15);
             border-color: var(--primary);
             color: var(--white);
-        }}
+        }
 
-        .cat-btn.active {{
+        .cat-btn.active {
             background: linear-gradient(135deg, var(--primary) 0%, var(--secondary) 100%);
             border-color: transparent;
             color: var(--white);
-        }}
+        }
 
-        .cat-icon {{
-            font-size: 1rem;
-        }}
+        .cat-icon {
+            font-size: var(--fs-base);
+        }
 
-        .cat-count {{
+        .cat-count {
             background: rgba(255,255,255,0.2);
             padding: 2px 6px;
             border-radius: 20px;
-            font-size: 0.75rem;
-        }}
+            font-size: var(--fs-xs);
+        }
 
         /* KB Cards Grid - Single column on mobile, cards first */
-        .kb-cards-grid {{
+        .kb-cards-grid {
             display: grid;
             grid-template-columns: 1fr;
             gap: 12px;
             margin-bottom: 20px;
-        }}
+        }
 
         /* Active filter indicator */
-        .filter-indicator {{
+        .filter-indicator {
             display: none;
             padding: 10px 15px;
             background: linear-gradient(135deg, rgba(14, 165, 233, 0.15) 0%, rgba(6, 182, 212, 0.15) 100%);
             border: 1px solid var(--primary);
             border-radius: 10px;
             margin-bottom: 15px;
-            font-size: 0.85rem;
+            font-size: var(--fs-sm);
             color: var(--secondary);
-        }}
+        }
 
-        .filter-indicator.visible {{
+        .filter-indicator.visible {
             display: flex;
             align-items: center;
             justify-content: space-between;
-        }}
+        }
 
-        .filter-indicator .clear-btn {{
+        .filter-indicator .clear-btn {
             background: none;
             border: none;
             color: var(--gray);
             cursor: pointer;
-            font-size: 1rem;
+            font-size: var(--fs-base);
             padding: 2px 8px;
-        }}
+        }
 
         /* Collapsible Charts Section - At bottom */
-        .kb-charts-section {{
+        .kb-charts-section {
             margin-top: 25px;
             border-top: 1px solid var(--glass-border);
             padding-top: 15px;
-        }}
+        }
 
-        .charts-toggle {{
+        /* Shared by the collapsible charts and definitions sections */
+        .charts-toggle,
+        .definitions-toggle {
             display: flex;
             align-items: center;
             justify-content: space-between;
@@ -2473,197 +2738,190 @@ def generate_html(metrics):
             border-radius: 12px;
             cursor: pointer;
             margin-bottom: 15px;
-            transition: all 0.3s ease;
-        }}
+            transition: border-color 0.3s ease;
+        }
 
-        .charts-toggle:hover {{
+        .charts-toggle:hover {
             border-color: var(--primary);
-        }}
+        }
 
-        .charts-toggle h3 {{
+        .charts-toggle h3,
+        .definitions-toggle h3 {
             font-size: 0.95rem;
             font-weight: 600;
             color: var(--light);
             display: flex;
             align-items: center;
             gap: 8px;
-        }}
+        }
 
-        .charts-toggle .toggle-arrow {{
+        .charts-toggle .toggle-arrow,
+        .definitions-toggle .toggle-arrow {
             color: var(--gray);
-            font-size: 1rem;
+            font-size: var(--fs-base);
             transition: transform 0.3s ease;
-        }}
+        }
 
-        .charts-toggle.expanded .toggle-arrow {{
+        .charts-toggle.expanded .toggle-arrow,
+        .definitions-toggle.expanded .toggle-arrow {
             transform: rotate(180deg);
-        }}
+        }
 
-        .kb-charts-content {{
+        .kb-charts-content {
             display: none;
             padding-top: 10px;
-        }}
+        }
 
-        .kb-charts-content.visible {{
+        .kb-charts-content.visible {
             display: block;
-        }}
+        }
 
-        .kb-charts-content .chart-grid {{
+        .kb-charts-content .chart-grid {
             display: grid;
             grid-template-columns: 1fr;
             gap: 15px;
-        }}
+        }
 
-        .kb-charts-content .chart-card {{
+        .kb-charts-content .chart-card {
             min-height: 280px;
-        }}
+        }
 
         /* Collapsible Definitions Section */
-        .definitions-section {{
+        .definitions-section {
             margin-top: 25px;
             padding-top: 15px;
             border-top: 1px solid var(--glass-border);
-        }}
-
-        .definitions-toggle {{
-            display: flex;
-            align-items: center;
-            justify-content: space-between;
-            padding: 12px 15px;
-            background: var(--glass);
-            border: 1px solid var(--glass-border);
-            border-radius: 12px;
-            cursor: pointer;
-            margin-bottom: 15px;
-            transition: all 0.3s ease;
-        }}
+        }
 
-        .definitions-toggle:hover {{
+        .definitions-toggle:hover {
             border-color: var(--secondary);
-        }}
-
-        .definitions-toggle h3 {{
-            font-size: 0.95rem;
-            font-weight: 600;
-            color: var(--light);
-            display: flex;
-            align-items: center;
-            gap: 8px;
-        }}
-
-        .definitions-toggle .toggle-arrow {{
-            color: var(--gray);
-            font-size: 1rem;
-            transition: transform 0.3s ease;
-        }}
-
-        .definitions-toggle.expanded .toggle-arrow {{
-            transform: rotate(180deg);
-        }}
+        }
 
-        .definitions-content {{
+        .definitions-content {
             display: none;
-        }}
+        }
 
-        .definitions-content.visible {{
+        .definitions-content.visible {
             display: block;
-        }}
+        }
 
         /* Desktop adjustments */
-        @media (min-width: 768px) {{
-            .company-info-card {{
+        @media (min-width: 768px) {
+            .company-info-card {
                 padding: 20px;
                 gap: 20px;
-            }}
+            }
 
-            .company-logo {{
+            .company-logo {
                 width: 60px;
                 height: 60px;
                 font-size: 28px;
-            }}
+            }
 
-            .company-details h2 {{
+            .company-details h2 {
                 font-size: 1.2rem;
-            }}
+            }
 
-            .kb-controls {{
+            .kb-controls {
                 flex-direction: row;
                 justify-content: space-between;
                 align-items: center;
-            }}
+            }
 
-            .search-box {{
+            .search-box {
                 max-width: 350px;
-            }}
+            }
 
-            .unit-toggle {{
+            .unit-toggle {
                 width: auto;
-            }}
+            }
 
-            .kb-cards-grid {{
+            .kb-cards-grid {
                 grid-template-columns: repeat(auto-fill, minmax(340px, 1fr));
                 gap: 15px;
-            }}
+            }
 
-            .kb-charts-content .chart-grid {{
+            .kb-charts-content .chart-grid {
                 grid-template-columns: repeat(2, 1fr);
-            }}
-        }}
+            }
+        }
 
-        @media (min-width: 1024px) {{
-            .company-info-card {{
+        @media (min-width: 1024px) {
+            .company-info-card {
                 padding: 25px;
-            }}
+            }
 
-            .company-logo {{
+            .company-logo {
                 width: 70px;
                 height: 70px;
                 font-size: 32px;
-            }}
+            }
 
-            .company-details h2 {{
+            .company-details h2 {
                 font-size: 1.3rem;
-            }}
+            }
 
-            .kb-cards-grid {{
+            .kb-cards-grid {
                 grid-template-columns: repeat(auto-fill, minmax(380px, 1fr));
-            }}
-        }}
+            }
+        }
 
         /* KB Card - Mobile first */
-        .kb-card {{
+        .kb-card {
             background: var(--glass);
-            backdrop-filter: blur(20px);
             border: 1px solid var(--glass-border);
             border-radius: 14px;
             overflow: hidden;
-            transition: all 0.3s ease;
-        }}
+            transition: border-color 0.3s ease, box-shadow 0.3s ease;
+            /* Off-screen cards skip rendering; 'auto' remembers the last real size */
+            content-visibility: auto;
+            contain-intrinsic-size: auto 75px;
+        }
 
-        .kb-card:hover {{
+        .kb-card:hover {
             border-color: var(--primary);
             box-shadow: 0 5px 20px rgba(14, 165, 233, 0.15);
-        }}
+        }
 
-        .kb-card.hidden {{
+        /* Only the open card pays for a backdrop blur */
+        .kb-card.expanded {
+            backdrop-filter: blur(12px);
+        }
+
+        .kb-card.hidden {
             display: none;
-        }}
+        }
 
-        .kb-card-header {{
-            display: flex;
+        /* Layer hints only where hover animations can actually fire */
+        @media (hover: hover) {
+            .kb-card {
+                will-change: box-shadow;
+            }
+
+            .expand-icon,
+            .toggle-arrow,
+            .toggle-icon {
+                will-change: transform;
+            }
+        }
+
+        /* Fixed icon/expand tracks: only the summary column is content-sized */
+        .kb-card-header {
+            display: grid;
+            grid-template-columns: 38px minmax(0, 1fr) auto 26px;
             align-items: center;
             padding: 12px 14px;
             cursor: pointer;
             gap: 10px;
             border-bottom: 1px solid transparent;
-            transition: all 0.3s ease;
-        }}
+            transition: border-color 0.3s ease;
+        }
 
-        .kb-card.expanded .kb-card-header {{
+        .kb-card.expanded .kb-card-header {
             border-bottom-color: var(--glass-border);
-        }}
+        }
 
-        .kb-card-icon {{
+        .kb-card-icon {
             width: 38px;
             height: 38px;
             background: linear-gradient(135deg, var(--primary) 0%, var(--secondary) 100%);
@@ -2672,271 +2930,269 @@ def generate_html(metrics):
             align-items: center;
             justify-content: center;
             font-size: 1.1rem;
-            flex-shrink: 0;
-        }}
-
-        .kb-card-title {{
-            flex: 1;
-            min-width: 0;
-        }}
+        }
 
-        .kb-card-title h3 {{
-            font-size: 0.9rem;
+        .kb-card-title h3 {
+            font-size: var(--fs-md);
             font-weight: 600;
             margin-bottom: 2px;
             white-space: nowrap;
             overflow: hidden;
             text-overflow: ellipsis;
-        }}
+        }
 
-        .kb-card-subtitle {{
+        .kb-card-subtitle {
             font-size: 0.7rem;
             color: var(--gray);
-        }}
+        }
 
-        .kb-card-summary {{
+        .kb-card-summary {
             text-align: right;
-            flex-shrink: 0;
-        }}
+        }
 
-        .rtl .kb-card-summary {{
+        .rtl .kb-card-summary {
             text-align: left;
-        }}
+        }
 
-        .summary-value {{
+        .summary-value {
             display: flex;
             flex-direction: column;
             align-items: flex-end;
             gap: 1px;
-        }}
+        }
 
-        .rtl .summary-value {{
+        .rtl .summary-value {
             align-items: flex-start;
-        }}
+        }
 
-        .summary-value .design-value {{
-            font-size: 1rem;
+        .summary-value .design-value {
+            font-size: var(--fs-base);
             font-weight: 700;
             color: var(--secondary);
-        }}
+        }
 
-        .summary-value .actual-value {{
-            font-size: 0.75rem;
+        .summary-value .actual-value {
+            font-size: var(--fs-xs);
             color: var(--success);
-        }}
+        }
 
-        .summary-value .unit {{
+        .summary-value .unit {
             font-size: 0.65rem;
             color: var(--gray);
-        }}
+        }
 
-        .kb-card-expand {{
+        .kb-card-expand {
             width: 26px;
             height: 26px;
             display: flex;
             align-items: center;
             justify-content: center;
-            flex-shrink: 0;
-        }}
+        }
 
-        .expand-icon {{
+        .expand-icon {
             transition: transform 0.3s ease;
             color: var(--gray);
-            font-size: 0.9rem;
-        }}
+            font-size: var(--fs-md);
+        }
 
-        .kb-card.expanded .expand-icon {{
+        .kb-card.expanded .expand-icon {
             transform: rotate(180deg);
-        }}
+        }
 
         /* Card Body */
-        .kb-card-body {{
+        .kb-card-body {
             display: none;
             padding: 14px;
-            animation: slideDown 0.3s ease;
-        }}
+        }
 
-        .kb-card.expanded .kb-card-body {{
+        .kb-card.expanded .kb-card-body {
             display: block;
-        }}
-
-        @keyframes slideDown {{
-            from {{ opacity: 0; transform: translateY(-10px); }}
-            to {{ opacity: 1; transform: translateY(0); }}
-        }}
+        }
 
         /* Capacity Section */
-        .capacity-section {{
+        .capacity-section {
             margin-bottom: 15px;
             padding: 12px;
             background: rgba(0,0,0,0.2);
             border-radius: 10px;
-        }}
+        }
 
-        .capacity-row {{
+        .capacity-row {
             display: flex;
             justify-content: space-between;
             margin-bottom: 6px;
-            font-size: 0.85rem;
-        }}
+            font-size: var(--fs-sm);
+        }
 
-        .capacity-row .label {{
+        .capacity-row .label {
             color: var(--gray);
-        }}
+        }
 
-        .capacity-row .value.design {{
+        .capacity-row .value.design {
             color: var(--secondary);
             font-weight: 600;
-        }}
+        }
 
-        .capacity-row .value.actual {{
+        .capacity-row .value.actual {
             color: var(--success);
             font-weight: 600;
-        }}
+        }
 
-        .capacity-bar {{
+        .capacity-bar {
             height: 6px;
             background: rgba(255,255,255,0.1);
             border-radius: 3px;
             margin-top: 8px;
             overflow: hidden;
-        }}
+        }
 
-        .bar-fill {{
+        .bar-fill {
+            width: 100%;
             height: 100%;
             background: linear-gradient(90deg, var(--success) 0%, var(--secondary) 100%);
             border-radius: 3px;
-            transition: width 0.5s ease;
-        }}
+            transform: scaleX(var(--fill-ratio, 0));
+            transform-origin: left;
+            transition: transform 0.5s ease;
+        }
+
+        .rtl .bar-fill {
+            transform-origin: right;
+        }
 
         /* Desktop card adjustments */
-        @media (min-width: 768px) {{
-            .kb-card-header {{
+        @media (min-width: 768px) {
+            .kb-card-header {
+                grid-template-columns: 45px minmax(0, 1fr) auto 26px;
                 padding: 15px 18px;
                 gap: 12px;
-            }}
+            }
 
-            .kb-card-icon {{
+            .kb-card-icon {
                 width: 45px;
                 height: 45px;
                 font-size: 1.2rem;
-            }}
+            }
 
-            .kb-card-title h3 {{
+            .kb-card-title h3 {
                 font-size: 0.95rem;
-            }}
+            }
 
-            .summary-value .design-value {{
+            .summary-value .design-value {
                 font-size: 1.1rem;
-            }}
+            }
 
-            .kb-card-body {{
+            .kb-card-body {
                 padding: 18px;
-            }}
-        }}
+            }
+        }
 
         /* Composition Section */
-        .composition-section, .conditions-section, .routing-section, .special-section {{
+        .composition-section, .conditions-section, .routing-section, .special-section {
             margin-bottom: 20px;
-        }}
+        }
 
-        .composition-section h4, .conditions-section h4, .routing-section h4, .special-section h4 {{
-            font-size: 0.9rem;
+        .composition-section h4, .conditions-section h4, .routing-section h4, .special-section h4 {
+            font-size: var(--fs-md);
             color: var(--gray);
             margin-bottom: 10px;
-        }}
+        }
 
-        .comp-list {{
+        .comp-list {
             list-style: none;
             padding: 0;
             margin: 0;
-        }}
+        }
 
-        .comp-list li {{
+        .comp-list li {
             padding: 6px 0;
             border-bottom: 1px dashed rgba(255,255,255,0.1);
             display: flex;
             justify-content: space-between;
-            font-size: 0.9rem;
-        }}
+            font-size: var(--fs-md);
+        }
 
-        .comp-list li:last-child {{
+        .comp-list li:last-child {
             border-bottom: none;
-        }}
+        }
 
-        .comp-name {{
+        .comp-name {
             color: var(--gray);
-        }}
+        }
 
-        .comp-val {{
+        .comp-val {
             color: var(--white);
             font-weight: 500;
-        }}
+        }
 
-        .comp-chart {{
+        .comp-val::after {
+            content: ' ' var(--comp-unit, '');
+        }
+
+        .comp-chart {
             margin-top: 15px;
             height: 180px;
-        }}
+        }
 
         /* Conditions Grid */
-        .conditions-grid {{
+        .conditions-grid {
             display: flex;
             gap: 15px;
             flex-wrap: wrap;
-        }}
+        }
 
-        .condition-item {{
+        .condition-item {
             background: rgba(14, 165, 233, 0.1);
             padding: 10px 15px;
             border-radius: 8px;
             display: flex;
             gap: 10px;
             align-items: center;
-        }}
+        }
 
-        .cond-label {{
+        .cond-label {
             font-weight: 600;
             color: var(--secondary);
-        }}
+        }
 
-        .cond-value {{
+        .cond-value {
             color: var(--white);
-        }}
+        }
 
         /* Routing Section */
-        .routing-flow {{
+        .routing-flow {
             display: flex;
             align-items: center;
             gap: 15px;
             flex-wrap: wrap;
-        }}
+        }
 
-        .route-node {{
+        .route-node {
             padding: 12px 18px;
             border-radius: 10px;
-            font-size: 0.9rem;
+            font-size: var(--fs-md);
             font-weight: 500;
-        }}
+        }
 
-        .route-node.source {{
+        .route-node.source {
             background: linear-gradient(135deg, rgba(245, 158, 11, 0.2) 0%, rgba(245, 158, 11, 0.1) 100%);
             border: 1px solid rgba(245, 158, 11, 0.3);
             color: #f59e0b;
-        }}
+        }
 
-        .route-node.destination {{
+        .route-node.destination {
             background: linear-gradient(135deg, rgba(34, 197, 94, 0.2) 0%, rgba(34, 197, 94, 0.1) 100%);
             border: 1px solid rgba(34, 197, 94, 0.3);
             color: #22c55e;
-        }}
+        }
 
-        .route-arrow {{
+        .route-arrow {
             font-size: 1.5rem;
             color: var(--gray);
-        }}
+        }
 
         /* Definition Toggle */
-        .definition-toggle {{
+        .definition-toggle {
             display: flex;
             justify-content: space-between;
             align-items: center;
@@ -2946,189 +3202,220 @@ def generate_html(metrics):
             border-radius: 10px;
             cursor: pointer;
             margin-bottom: 10px;
-            transition: all 0.3s ease;
-        }}
+            transition: background 0.3s ease;
+        }
 
-        .definition-toggle:hover {{
+        .definition-toggle:hover {
             background: rgba(138, 92, 246, 0.15);
-        }}
+        }
 
-        .toggle-icon {{
+        .toggle-icon {
             font-size: 1.2rem;
             color: var(--gray);
             transition: transform 0.3s ease;
-        }}
+        }
 
-        .definition-toggle.expanded .toggle-icon {{
+        .definition-toggle.expanded .toggle-icon {
             transform: rotate(45deg);
-        }}
+        }
 
-        .definition-content {{
-            padding: 0 15px;
-            max-height: 0;
+        /* Collapsed via a 0fr grid row. The grid item stays padding-free so the
+           row can shrink to 0; the padding sits on the inner wrapper */
+        .definition-content {
+            display: grid;
+            grid-template-rows: 0fr;
             overflow: hidden;
-            transition: max-height 0.3s ease, padding 0.3s ease;
-        }}
+            transition: grid-template-rows 0.3s ease;
+        }
+
+        .definition-toggle.expanded + .definition-content {
+            grid-template-rows: 1fr;
+        }
+
+        .definition-body {
+            min-height: 0;
+            overflow: hidden;
+        }
 
-        .definition-toggle.expanded + .definition-content {{
-            max-height: 300px;
+        .definition-inner {
             padding: 15px;
-        }}
+        }
 
-        .simple-def {{
+        .simple-def {
             color: var(--secondary);
             font-weight: 500;
             margin-bottom: 10px;
-        }}
+        }
 
-        .detailed-def {{
+        .detailed-def {
             color: var(--gray);
-            font-size: 0.9rem;
+            font-size: var(--fs-md);
             line-height: 1.6;
             display: none;
-        }}
+        }
 
-        .definition-toggle.expanded + .definition-content .detailed-def {{
+        .definition-toggle.expanded + .definition-content .detailed-def {
             display: block;
-        }}
+        }
 
         /* Comments Section */
-        .comments-section {{
+        .comments-section {
             padding: 15px;
             background: rgba(255,255,255,0.05);
             border-radius: 10px;
             border-left: 3px solid var(--accent);
             margin-top: 15px;
-        }}
+        }
 
-        .rtl .comments-section {{
+        .rtl .comments-section {
             border-left: none;
             border-right: 3px solid var(--accent);
-        }}
+        }
 
-        .comments-section h4 {{
-            font-size: 0.85rem;
+        .comments-section h4 {
+            font-size: var(--fs-sm);
             color: var(--gray);
             margin-bottom: 8px;
-        }}
+        }
 
-        .comments-section p {{
-            font-size: 0.9rem;
+        .comments-section p {
+            font-size: var(--fs-md);
             color: var(--light);
             line-height: 1.5;
-        }}
+        }
 
         /* Definitions Section */
-        .definitions-section {{
+        .definitions-section {
             margin-top: 40px;
             padding-top: 30px;
             border-top: 1px solid var(--glass-border);
-        }}
+        }
 
-        .definitions-grid {{
+        .definitions-grid {
             display: grid;
             grid-template-columns: repeat(auto-fill, minmax(280px, 1fr));
             gap: 15px;
-        }}
+        }
 
-        .def-card {{
+        .def-card {
             background: var(--glass);
             border: 1px solid var(--glass-border);
             border-radius: 12px;
             padding: 15px;
             cursor: pointer;
-            transition: all 0.3s ease;
-        }}
+            transition: border-color 0.3s ease;
+            content-visibility: auto;
+            contain-intrinsic-size: auto 110px;
+        }
 
-        .def-card:hover {{
+        .def-card:hover {
             border-color: var(--secondary);
-        }}
+        }
 
-        .def-card.expanded {{
+        .def-card.expanded {
             border-color: var(--primary);
-        }}
+        }
 
-        .def-term {{
+        .def-term {
             font-weight: 600;
             color: var(--secondary);
             margin-bottom: 5px;
-        }}
+        }
 
-        .def-simple {{
-            font-size: 0.9rem;
+        .def-simple {
+            font-size: var(--fs-md);
             color: var(--light);
-        }}
+        }
 
-        .def-detailed {{
+        .def-detailed {
             margin-top: 10px;
             padding-top: 10px;
             border-top: 1px dashed var(--glass-border);
-            font-size: 0.85rem;
+            font-size: var(--fs-sm);
             color: var(--gray);
             line-height: 1.5;
             display: none;
-        }}
+        }
+
+        .def-card.expanded .def-detailed {
+            display: block;
+        }
 
         /* Mobile routing */
-        @media (max-width: 480px) {{
-            .routing-flow {{
+        @media (max-width: 480px) {
+            .routing-flow {
                 flex-direction: column;
                 align-items: stretch;
                 gap: 8px;
-            }}
+            }
 
-            .route-arrow {{
+            .route-arrow {
                 transform: rotate(90deg);
                 align-self: center;
-            }}
+            }
 
-            .route-node {{
+            .route-node {
                 text-align: center;
                 padding: 10px 14px;
-                font-size: 0.85rem;
-            }}
-        }}
-    </style>
+                font-size: var(--fs-sm);
+            }
+        }
+'''
+
+if csscompressor is not None:
+    DASHBOARD_CSS = csscompressor.compress(DASHBOARD_CSS) + '\n'
+    KB_CSS = csscompressor.compress(KB_CSS)
+
+# Everything up to <body>'s first child, assembled once at import so
+# generate_html emits it without any formatting work.
+DASHBOARD_HEAD = '''<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>MIDOR-ETHYDCO Integration Dashboard</title>
+    <link href="https://fonts.googleapis.com/css2?family=Inter:wght@300;400;500;600;700;800&family=Cairo:wght@400;600;700&display=swap" rel="stylesheet">
+    <script src="https://cdn.plot.ly/plotly-2.35.2.min.js" defer></script>
+    <style>
+''' + DASHBOARD_CSS + '''    </style>
 </head>
 <body>
     <div class="bg-animation"></div>
 
-    <header class="header">
+'''
+
+# Page body after the opening <body>; filled by generate_html with a single
+# str.format_map call, so literal braces (JS/inline CSS) are doubled.
+DASHBOARD_BODY = '''    <header class="header">
         <div class="logo">
             <div class="logo-icon">M</div>
             <div class="logo-text">
                 <h1 class="en-only">MIDOR-ETHYDCO Integration</h1>
                 <h1 class="ar-only">تكامل ميدور وإيثيدكو</h1>
-                <span class="en-only">Petrochemical Integration Analysis</span>
-                <span class="ar-only">تحليل التكامل البتروكيماوي</span>
+                <span class="i18n" data-en="Petrochemical Integration Analysis" data-ar="تحليل التكامل البتروكيماوي"></span>
             </div>
         </div>
         <div class="lang-toggle">
-            <button class="lang-btn active" onclick="setLanguage('en')">English</button>
-            <button class="lang-btn" onclick="setLanguage('ar')">العربية</button>
+            <button class="lang-btn active" data-action="lang" data-lang="en">English</button>
+            <button class="lang-btn" data-action="lang" data-lang="ar">العربية</button>
         </div>
     </header>
 
     <nav class="nav">
-        <button class="nav-btn active" onclick="showTab('overview')">
-            <span class="en-only">Overview</span>
-            <span class="ar-only">نظرة عامة</span>
+        <button class="nav-btn active" data-action="tab" data-tab="overview">
+            <span class="i18n" data-en="Overview" data-ar="نظرة عامة"></span>
         </button>
-        <button class="nav-btn" onclick="showTab('financial')">
-            <span class="en-only">Financial Analysis</span>
-            <span class="ar-only">التحليل المالي</span>
+        <button class="nav-btn" data-action="tab" data-tab="financial">
+            <span class="i18n" data-en="Financial Analysis" data-ar="التحليل المالي"></span>
         </button>
-        <button class="nav-btn" onclick="showTab('process')">
-            <span class="en-only">Process Flow</span>
-            <span class="ar-only">تدفق العمليات</span>
+        <button class="nav-btn" data-action="tab" data-tab="process">
+            <span class="i18n" data-en="Process Flow" data-ar="تدفق العمليات"></span>
         </button>
-        <button class="nav-btn" onclick="showTab('detailed')">
-            <span class="en-only">Detailed Data</span>
-            <span class="ar-only">البيانات التفصيلية</span>
+        <button class="nav-btn" data-action="tab" data-tab="detailed">
+            <span class="i18n" data-en="Detailed Data" data-ar="البيانات التفصيلية"></span>
         </button>
-        <button class="nav-btn" onclick="showTab('knowledge')">
-            <span class="en-only">ETHYDCO Knowledge Base</span>
-            <span class="ar-only">قاعدة معرفة إيثيدكو</span>
+        <button class="nav-btn" data-action="tab" data-tab="knowledge">
+            <span class="i18n" data-en="ETHYDCO Knowledge Base" data-ar="قاعدة معرفة إيثيدكو"></span>
         </button>
     </nav>
 
@@ -3139,7 +3426,7 @@ def generate_html(metrics):
                 <div class="kpi-card main">
                     <div class="kpi-label en-only">Total Annual Integration Value</div>
                     <div class="kpi-label ar-only">إجمالي قيمة التكامل السنوية</div>
-                    <div class="kpi-value">${total_value/1e6:.0f}M</div>
+                    <div class="kpi-value">${total_value_m:.0f}M</div>
                     <div class="kpi-sublabel en-only">Net value after all costs</div>
                     <div class="kpi-sublabel ar-only">القيمة الصافية بعد جميع التكاليف</div>
                 </div>
@@ -3147,7 +3434,7 @@ def generate_html(metrics):
                     <div class="kpi-icon">⚡</div>
                     <div class="kpi-label en-only">Phase 1+2: Gas Recovery</div>
                     <div class="kpi-label ar-only">المرحلة 1+2: استرداد الغاز</div>
-                    <div class="kpi-value">${phase12/1e6:.0f}M</div>
+                    <div class="kpi-value">${phase12_m:.0f}M</div>
                     <div class="kpi-sublabel en-only">LPG, H2, C2, C5+ Recovery</div>
                     <div class="kpi-sublabel ar-only">استرداد الغاز المسال والهيدروجين</div>
                 </div>
@@ -3155,7 +3442,7 @@ def generate_html(metrics):
                     <div class="kpi-icon">🧪</div>
                     <div class="kpi-label en-only">Phase 3+4: Methanol & MTO</div>
                     <div class="kpi-label ar-only">المرحلة 3+4: الميثانول</div>
-                    <div class="kpi-value">${phase34/1e6:.0f}M</div>
+                    <div class="kpi-value">${phase34_m:.0f}M</div>
                     <div class="kpi-sublabel en-only">Methanol Blending & Olefins</div>
                     <div class="kpi-sublabel ar-only">مزج الميثانول والأوليفينات</div>
                 </div>
@@ -3164,19 +3451,17 @@ def generate_html(metrics):
             <div class="chart-grid">
                 <div class="chart-card">
                     <div class="chart-title">
-                        <span class="en-only">Value Distribution</span>
-                        <span class="ar-only">توزيع القيمة</span>
+                        <span class="i18n" data-en="Value Distribution" data-ar="توزيع القيمة"></span>
                     </div>
-                    <div id="chart-donut-en"></div>
-                    <div id="chart-donut-ar"></div>
+                    <div id="chart-donut-en" class="en-only"></div>
+                    <div id="chart-donut-ar" class="ar-only"></div>
                 </div>
                 <div class="chart-card">
                     <div class="chart-title">
-                        <span class="en-only">Product Values</span>
-                        <span class="ar-only">قيم المنتجات</span>
+                        <span class="i18n" data-en="Product Values" data-ar="قيم المنتجات"></span>
                     </div>
-                    <div id="chart-products-en"></div>
-                    <div id="chart-products-ar"></div>
+                    <div id="chart-products-en" class="en-only"></div>
+                    <div id="chart-products-ar" class="ar-only"></div>
                 </div>
             </div>
         </div>
@@ -3186,18 +3471,16 @@ def generate_html(metrics):
             <div class="chart-grid">
                 <div class="chart-card full">
                     <div class="chart-title">
-                        <span class="en-only">Cost-Benefit Analysis</span>
-                        <span class="ar-only">تحليل التكلفة والعائد</span>
+                        <span class="i18n" data-en="Cost-Benefit Analysis" data-ar="تحليل التكلفة والعائد"></span>
                     </div>
-                    <div id="chart-costbenefit-en"></div>
-                    <div id="chart-costbenefit-ar"></div>
+                    <div id="chart-costbenefit-en" class="en-only"></div>
+                    <div id="chart-costbenefit-ar" class="ar-only"></div>
                 </div>
             </div>
 
             <div class="table-container">
                 <div class="chart-title">
-                    <span class="en-only">Financial Summary</span>
-                    <span class="ar-only">الملخص المالي</span>
+                    <span class="i18n" data-en="Financial Summary" data-ar="الملخص المالي"></span>
                 </div>
                 <table class="data-table">
                     <thead>
@@ -3211,50 +3494,16 @@ def generate_html(metrics):
                         </tr>
                     </thead>
                     <tbody>
-                        <tr>
-                            <td>LPG (C3+C4)</td>
-                            <td>{metrics['calc1']['total_LPG']:,.0f}</td>
-                            <td class="value">${metrics['calc1']['LPG_value']:,.0f}</td>
-                        </tr>
-                        <tr>
-                            <td>C5+ (Naphtha)</td>
-                            <td>{metrics['calc1']['total_C5+']:,.0f}</td>
-                            <td class="value">${metrics['calc1']['C5+_value']:,.0f}</td>
-                        </tr>
-                        <tr>
-                            <td>Hydrogen (H2)</td>
-                            <td>{metrics['calc2']['total_H2']:,.0f}</td>
-                            <td class="value">${metrics['calc2']['H2_value']:,.0f}</td>
-                        </tr>
-                        <tr>
-                            <td>Ethane (C2)</td>
-                            <td>{metrics['calc3']['MIDOR_C2_supply']:,.0f}</td>
-                            <td class="value">${metrics['calc3']['C2_value']:,.0f}</td>
-                        </tr>
-                        <tr>
-                            <td>Methanol Blend</td>
-                            <td>{metrics['calc6']['methanol_in_gasoline']:,.0f}</td>
-                            <td class="value">${metrics['calc6']['methanol_value']:,.0f}</td>
-                        </tr>
-                        <tr>
-                            <td>Ethylene (MTO)</td>
-                            <td>{metrics['calc6']['ethylene_from_MTO']:,.0f}</td>
-                            <td class="value">${metrics['calc6']['ethylene_value']:,.0f}</td>
-                        </tr>
-                        <tr>
-                            <td>Propylene (MTO)</td>
-                            <td>{metrics['calc6']['propylene_from_MTO']:,.0f}</td>
-                            <td class="value">${metrics['calc6']['propylene_value']:,.0f}</td>
-                        </tr>
+                        {product_rows_html}
                         <tr style="background: rgba(239,68,68,0.1);">
                             <td><strong class="en-only">NG Makeup Cost</strong><strong class="ar-only">تكلفة الغاز الطبيعي</strong></td>
                             <td>-</td>
-                            <td class="cost">-${metrics['summary']['phase12_NG_cost']:,.0f}</td>
+                            <td class="cost">-${summary[phase12_NG_cost]:,.0f}</td>
                         </tr>
                         <tr style="background: rgba(34,197,94,0.2);">
                             <td><strong class="en-only">TOTAL NET VALUE</strong><strong class="ar-only">إجمالي القيمة الصافية</strong></td>
                             <td>-</td>
-                            <td class="value"><strong>${metrics['summary']['total_net']:,.0f}</strong></td>
+                            <td class="value"><strong>${summary[total_net]:,.0f}</strong></td>
                         </tr>
                     </tbody>
                 </table>
@@ -3266,30 +3515,26 @@ def generate_html(metrics):
             <div class="chart-grid">
                 <div class="chart-card full">
                     <div class="chart-title">
-                        <span class="en-only">Material & Value Flow</span>
-                        <span class="ar-only">تدفق المواد والقيمة</span>
+                        <span class="i18n" data-en="Material & Value Flow" data-ar="تدفق المواد والقيمة"></span>
                     </div>
-                    <div id="chart-sankey-en"></div>
-                    <div id="chart-sankey-ar"></div>
+                    <div id="chart-sankey-en" class="en-only"></div>
+                    <div id="chart-sankey-ar" class="ar-only"></div>
                 </div>
             </div>
 
             <div class="chart-grid">
                 <div class="chart-card">
                     <div class="chart-title">
-                        <span class="en-only">ETHYDCO C2 Feed Coverage</span>
-                        <span class="ar-only">تغطية تغذية الإيثان لإيثيدكو</span>
+                        <span class="i18n" data-en="ETHYDCO C2 Feed Coverage" data-ar="تغطية تغذية الإيثان لإيثيدكو"></span>
                     </div>
+                    <div id="chart-gauges-en" class="en-only"></div>
+                    <div id="chart-gauges-ar" class="ar-only"></div>
                     <div class="gauge-container">
                         <div class="gauge-card">
-                            <div id="chart-gauge-min-en"></div>
-                            <div id="chart-gauge-min-ar"></div>
                             <div class="gauge-label en-only">Min Demand Coverage</div>
                             <div class="gauge-label ar-only">تغطية الحد الأدنى</div>
                         </div>
                         <div class="gauge-card">
-                            <div id="chart-gauge-max-en"></div>
-                            <div id="chart-gauge-max-ar"></div>
                             <div class="gauge-label en-only">Max Demand Coverage</div>
                             <div class="gauge-label ar-only">تغطية الحد الأقصى</div>
                         </div>
@@ -3297,30 +3542,27 @@ def generate_html(metrics):
                 </div>
                 <div class="chart-card">
                     <div class="chart-title">
-                        <span class="en-only">H2 Balance for Methanol</span>
-                        <span class="ar-only">توازن الهيدروجين للميثانول</span>
+                        <span class="i18n" data-en="H2 Balance for Methanol" data-ar="توازن الهيدروجين للميثانول"></span>
                     </div>
-                    <div id="chart-h2-en"></div>
-                    <div id="chart-h2-ar"></div>
+                    <div id="chart-h2-en" class="en-only"></div>
+                    <div id="chart-h2-ar" class="ar-only"></div>
                 </div>
             </div>
 
             <div class="chart-grid">
                 <div class="chart-card">
                     <div class="chart-title">
-                        <span class="en-only">Stream Component Distribution</span>
-                        <span class="ar-only">توزيع مكونات التيارات</span>
+                        <span class="i18n" data-en="Stream Component Distribution" data-ar="توزيع مكونات التيارات"></span>
                     </div>
-                    <div id="chart-heatmap-en"></div>
-                    <div id="chart-heatmap-ar"></div>
+                    <div id="chart-heatmap-en" class="en-only"></div>
+                    <div id="chart-heatmap-ar" class="ar-only"></div>
                 </div>
                 <div class="chart-card">
                     <div class="chart-title">
-                        <span class="en-only">Methanol Allocation</span>
-                        <span class="ar-only">توزيع الميثانول</span>
+                        <span class="i18n" data-en="Methanol Allocation" data-ar="توزيع الميثانول"></span>
                     </div>
-                    <div id="chart-methanol-en"></div>
-                    <div id="chart-methanol-ar"></div>
+                    <div id="chart-methanol-en" class="en-only"></div>
+                    <div id="chart-methanol-ar" class="ar-only"></div>
                 </div>
             </div>
         </div>
@@ -3328,8 +3570,7 @@ def generate_html(metrics):
         <!-- DETAILED TAB -->
         <div id="detailed" class="tab-content">
             <div class="chart-title" style="margin-bottom: 20px; font-size: 1.3rem;">
-                <span class="en-only">Stream Details</span>
-                <span class="ar-only">تفاصيل التيارات</span>
+                <span class="i18n" data-en="Stream Details" data-ar="تفاصيل التيارات"></span>
             </div>
 
             <div class="data-grid">
@@ -3338,8 +3579,7 @@ def generate_html(metrics):
 
             <div class="table-container" style="margin-top: 30px;">
                 <div class="chart-title">
-                    <span class="en-only">Product Prices</span>
-                    <span class="ar-only">أسعار المنتجات</span>
+                    <span class="i18n" data-en="Product Prices" data-ar="أسعار المنتجات"></span>
                 </div>
                 <table class="data-table">
                     <thead>
@@ -3359,204 +3599,110 @@ def generate_html(metrics):
 
         <!-- KNOWLEDGE BASE TAB -->
         <div id="knowledge" class="tab-content">
-            <!-- Header Section with Company Info -->
-            <div class="kb-header">
-                <div class="company-info-card">
-                    <div class="company-logo">E</div>
-                    <div class="company-details">
-                        <h2 class="en-only">{company_name} - {company_full}</h2>
-                        <h2 class="ar-only">{ethydco_data['company_info']['name_ar']} - {ethydco_data['company_info']['full_name_ar']}</h2>
-                        <p class="en-only">{company_scope}</p>
-                        <p class="ar-only">{ethydco_data['company_info']['scope_ar']}</p>
-                    </div>
-                </div>
-
-                <!-- Controls Row -->
-                <div class="kb-controls">
-                    <!-- Search Box -->
-                    <div class="search-box">
-                        <input type="text" id="kb-search" placeholder="Search streams, products..." oninput="filterKB()">
-                        <span class="search-icon">🔍</span>
-                    </div>
-
-                    <!-- Unit Toggle -->
-                    <div class="unit-toggle">
-                        <button class="unit-btn active" onclick="setUnit('hourly')" data-unit="hourly">T/hr</button>
-                        <button class="unit-btn" onclick="setUnit('annual')" data-unit="annual">T/year</button>
-                    </div>
-                </div>
-            </div>
-
-            <!-- Category Navigation -->
-            <div class="category-nav">
-                <button class="cat-btn active" onclick="filterCategory('all')" data-cat="all">
-                    <span class="en-only">All</span>
-                    <span class="ar-only">الكل</span>
-                    <span class="cat-count" id="count-all">17</span>
-                </button>
-                <button class="cat-btn" onclick="filterCategory('feeds')" data-cat="feeds">
-                    <span class="cat-icon">⚡</span>
-                    <span class="en-only">Feeds</span>
-                    <span class="ar-only">التغذية</span>
-                    <span class="cat-count" id="count-feeds">4</span>
-                </button>
-                <button class="cat-btn" onclick="filterCategory('products')" data-cat="products">
-                    <span class="cat-icon">📦</span>
-                    <span class="en-only">Products</span>
-                    <span class="ar-only">المنتجات</span>
-                    <span class="cat-count" id="count-products">7</span>
-                </button>
-                <button class="cat-btn" onclick="filterCategory('flares')" data-cat="flares">
-                    <span class="cat-icon">🔥</span>
-                    <span class="en-only">Flares</span>
-                    <span class="ar-only">الشعلات</span>
-                    <span class="cat-count" id="count-flares">2</span>
-                </button>
-                <button class="cat-btn" onclick="filterCategory('fuel')" data-cat="fuel">
-                    <span class="cat-icon">⛽</span>
-                    <span class="en-only">Fuel Gas</span>
-                    <span class="ar-only">غاز الوقود</span>
-                    <span class="cat-count" id="count-fuel">3</span>
-                </button>
-                <button class="cat-btn" onclick="filterCategory('other')" data-cat="other">
-                    <span class="cat-icon">🌀</span>
-                    <span class="en-only">Other</span>
-                    <span class="ar-only">أخرى</span>
-                    <span class="cat-count" id="count-other">1</span>
-                </button>
-            </div>
-
-            <!-- Filter Indicator -->
-            <div class="filter-indicator" id="filter-indicator">
-                <span id="filter-text"></span>
-                <button class="clear-btn" onclick="clearFilters()">✕</button>
-            </div>
-
-            <!-- CARDS FIRST - Primary Content -->
-            <div class="kb-cards-grid" id="kb-cards-container">
-                {kb_cards_html}
-            </div>
-
-            <!-- Collapsible Charts Section - AT BOTTOM -->
-            <div class="kb-charts-section">
-                <div class="charts-toggle" onclick="toggleChartsSection(this)">
-                    <h3>
-                        <span>📊</span>
-                        <span class="en-only">Charts & Visualizations</span>
-                        <span class="ar-only">الرسوم البيانية</span>
-                    </h3>
-                    <span class="toggle-arrow">▼</span>
-                </div>
-                <div class="kb-charts-content" id="kb-charts-content">
-                    <div class="chart-grid">
-                        <div class="chart-card">
-                            <div class="chart-title">
-                                <span class="en-only">Design vs Actual Capacity</span>
-                                <span class="ar-only">السعة التصميمية مقابل الفعلية</span>
-                            </div>
-                            <div id="chart-kb-design-en"></div>
-                            <div id="chart-kb-design-ar"></div>
-                        </div>
-                        <div class="chart-card">
-                            <div class="chart-title">
-                                <span class="en-only">ETHYDCO Process Flow</span>
-                                <span class="ar-only">مسار العمليات في إيثيدكو</span>
-                            </div>
-                            <div id="chart-kb-routing-en"></div>
-                            <div id="chart-kb-routing-ar"></div>
-                        </div>
-                    </div>
-                </div>
-            </div>
-
-            <!-- Collapsible Definitions Section - AT BOTTOM -->
-            <div class="definitions-section">
-                <div class="definitions-toggle" onclick="toggleDefinitionsSection(this)">
-                    <h3>
-                        <span>📖</span>
-                        <span class="en-only">Glossary / Definitions</span>
-                        <span class="ar-only">المصطلحات والتعريفات</span>
-                    </h3>
-                    <span class="toggle-arrow">▼</span>
-                </div>
-                <div class="definitions-content" id="definitions-content">
-                    <div class="definitions-grid" id="definitions-container">
-                        {definitions_html}
-                    </div>
-                </div>
-            </div>
+            <!-- Moved into the page on first visit (see ensureKnowledgeBase) -->
+            <template id="kb-template"><style>{kb_css}</style>{kb_html}</template>
         </div>
     </main>
 
     <footer class="footer">
-        <span class="en-only">MIDOR-ETHYDCO Integration Analysis | Generated: {pd.Timestamp.now().strftime('%Y-%m-%d')}</span>
-        <span class="ar-only">تحليل التكامل بين ميدور وإيثيدكو | تاريخ الإنشاء: {pd.Timestamp.now().strftime('%Y-%m-%d')}</span>
+        <span class="en-only">MIDOR-ETHYDCO Integration Analysis | Generated: {generated}</span>
+        <span class="ar-only">تحليل التكامل بين ميدور وإيثيدكو | تاريخ الإنشاء: {generated}</span>
     </footer>
 
+    <!-- Chart data per language; inert until JSON.parse'd on first use -->
+    <script type="application/json" id="charts-en">{charts_json[en]}</script>
+    <script type="application/json" id="charts-ar">{charts_json[ar]}</script>
+    <script type="application/json" id="charts-template">{charts_json[template]}</script>
+
     <script>
-        // Chart data
-        var chartsEN = {{
-            donut: {charts['en']['donut'].to_json()},
-            products: {charts['en']['products'].to_json()},
-            costbenefit: {charts['en']['cost_benefit'].to_json()},
-            sankey: {charts['en']['sankey'].to_json()},
-            gaugeMin: {charts['en']['gauge_min'].to_json()},
-            gaugeMax: {charts['en']['gauge_max'].to_json()},
-            h2: {charts['en']['h2_balance'].to_json()},
-            heatmap: {charts['en']['heatmap'].to_json()},
-            methanol: {charts['en']['methanol'].to_json()},
-            kbDesign: {charts['en']['kb_design_actual'].to_json()},
-            kbRouting: {charts['en']['kb_routing'].to_json()}
-        }};
+        var chartData = {{}};
 
-        var chartsAR = {{
-            donut: {charts['ar']['donut'].to_json()},
-            products: {charts['ar']['products'].to_json()},
-            costbenefit: {charts['ar']['cost_benefit'].to_json()},
-            sankey: {charts['ar']['sankey'].to_json()},
-            gaugeMin: {charts['ar']['gauge_min'].to_json()},
-            gaugeMax: {charts['ar']['gauge_max'].to_json()},
-            h2: {charts['ar']['h2_balance'].to_json()},
-            heatmap: {charts['ar']['heatmap'].to_json()},
-            methanol: {charts['ar']['methanol'].to_json()},
-            kbDesign: {charts['ar']['kb_design_actual'].to_json()},
-            kbRouting: {charts['ar']['kb_routing'].to_json()}
-        }};
+        function parseChartBlock(name) {{
+            if (!chartData[name]) {{
+                chartData[name] = JSON.parse(document.getElementById('charts-' + name).textContent);
+            }}
+            return chartData[name];
+        }}
+
+        // Figures ship without layout.template; every chart shares one copy
+        function getCharts(lang) {{
+            var fresh = !chartData[lang];
+            var charts = parseChartBlock(lang);
+            if (fresh) {{
+                var template = parseChartBlock('template');
+                Object.values(charts).forEach(chart => chart.layout.template = template);
+            }}
+            return charts;
+        }}
 
         var config = {{responsive: true, displayModeBar: false}};
         var currentLang = 'en';
         var currentCategory = 'all';
         var currentUnit = 'hourly';
-        var OPERATING_HOURS = 8000;
+
+        // Elements the tab and language handlers touch on every call,
+        // queried once. Per-language chart containers carry en-only/ar-only,
+        // so the body.rtl class alone decides which set is displayed
+        var TABS = Array.from(document.querySelectorAll('.tab-content'));
+        var NAV_BTNS = Array.from(document.querySelectorAll('.nav-btn'));
+        var LANG_BTNS = Array.from(document.querySelectorAll('.lang-btn'));
+
+        // Charts per tab as [chart key, container id prefix]. A chart is
+        // plotted the first time its tab is shown in a given language, so
+        // load only pays for the visible Overview charts
+        var TAB_CHARTS = {{
+            overview: [['donut', 'chart-donut'], ['products', 'chart-products']],
+            financial: [['costbenefit', 'chart-costbenefit']],
+            detailed: [],
+            process: [['sankey', 'chart-sankey'], ['gauges', 'chart-gauges'], ['h2', 'chart-h2'],
+                      ['heatmap', 'chart-heatmap'], ['methanol', 'chart-methanol']],
+            knowledge: [['kbDesign', 'chart-kb-design'], ['kbRouting', 'chart-kb-routing']]
+        }};
+        var activeTab = 'overview';
+        var plotted = {{}};
+        var chartUnits = {{}};
 
         function renderCharts(lang) {{
-            var charts = lang === 'ar' ? chartsAR : chartsEN;
-            var suffix = '-' + lang;
-            var otherSuffix = lang === 'ar' ? '-en' : '-ar';
-
-            // Hide other language charts
-            document.querySelectorAll('[id$="' + otherSuffix + '"]').forEach(el => el.style.display = 'none');
-            document.querySelectorAll('[id$="' + suffix + '"]').forEach(el => el.style.display = 'block');
-
-            Plotly.newPlot('chart-donut' + suffix, charts.donut.data, charts.donut.layout, config);
-            Plotly.newPlot('chart-products' + suffix, charts.products.data, charts.products.layout, config);
-            Plotly.newPlot('chart-costbenefit' + suffix, charts.costbenefit.data, charts.costbenefit.layout, config);
-            Plotly.newPlot('chart-sankey' + suffix, charts.sankey.data, charts.sankey.layout, config);
-            Plotly.newPlot('chart-gauge-min' + suffix, charts.gaugeMin.data, charts.gaugeMin.layout, config);
-            Plotly.newPlot('chart-gauge-max' + suffix, charts.gaugeMax.data, charts.gaugeMax.layout, config);
-            Plotly.newPlot('chart-h2' + suffix, charts.h2.data, charts.h2.layout, config);
-            Plotly.newPlot('chart-heatmap' + suffix, charts.heatmap.data, charts.heatmap.layout, config);
-            Plotly.newPlot('chart-methanol' + suffix, charts.methanol.data, charts.methanol.layout, config);
-
-            // KB Charts
-            var kbDesignEl = document.getElementById('chart-kb-design' + suffix);
-            var kbRoutingEl = document.getElementById('chart-kb-routing' + suffix);
-            if (kbDesignEl) {{
-                Plotly.newPlot('chart-kb-design' + suffix, charts.kbDesign.data, charts.kbDesign.layout, config);
-            }}
-            if (kbRoutingEl) {{
-                Plotly.newPlot('chart-kb-routing' + suffix, charts.kbRouting.data, charts.kbRouting.layout, config);
+            // plotly.js is deferred; the DOMContentLoaded render catches up
+            if (typeof Plotly === 'undefined') return;
+            var charts = getCharts(lang);
+
+            // KB charts live in a collapsible section; plot them once it is open
+            if (activeTab === 'knowledge') {{
+                var kbCharts = document.getElementById('kb-charts-content');
+                if (!kbCharts || !kbCharts.classList.contains('visible')) return;
             }}
+
+            // Charts plotted earlier were hidden since and may have missed
+            // window resizes; re-measure just those instead of every plot
+            TAB_CHARTS[activeTab].forEach(([key, prefix]) => {{
+                var id = prefix + '-' + lang;
+                if (plotted[id]) {{
+                    var el = document.getElementById(id);
+                    if (el.offsetParent) {{
+                        syncChartUnit(id);
+                        Plotly.Plots.resize(el);
+                    }}
+                    return;
+                }}
+                Plotly.react(id, charts[key].data, charts[key].layout, config);
+                plotted[id] = true;
+                syncChartUnit(id);
+            }});
+        }}
+
+        // Charts whose layout.meta.units is set carry hourly and annual
+        // values on each trace; swap them in place to follow the unit toggle
+        function syncChartUnit(id) {{
+            if ((chartUnits[id] || 'hourly') === currentUnit) return;
+            var gd = document.getElementById(id);
+            var meta = gd.layout.meta;
+            if (!meta || !meta.units) return;
+            chartUnits[id] = currentUnit;
+            Plotly.update(gd, {{
+                y: gd.data.map(trace => trace.meta[currentUnit].y),
+                text: gd.data.map(trace => trace.meta[currentUnit].text)
+            }}, {{'yaxis.title.text': meta.units[currentUnit]}});
         }}
 
         function setLanguage(lang) {{
@@ -3564,45 +3710,71 @@ def generate_html(metrics):
             document.body.classList.toggle('rtl', lang === 'ar');
 
             // Update toggle buttons
-            document.querySelectorAll('.lang-btn').forEach(btn => {{
-                btn.classList.toggle('active', btn.textContent.includes(lang === 'ar' ? 'العربية' : 'English'));
+            LANG_BTNS.forEach(btn => {{
+                btn.classList.toggle('active', btn.dataset.lang === lang);
             }});
 
             renderCharts(lang);
-            window.dispatchEvent(new Event('resize'));
         }}
 
-        function showTab(tabId) {{
-            document.querySelectorAll('.tab-content').forEach(tab => tab.classList.remove('active'));
-            document.querySelectorAll('.nav-btn').forEach(btn => btn.classList.remove('active'));
+        function showTab(tabId, navBtn) {{
+            TABS.forEach(tab => tab.classList.remove('active'));
+            NAV_BTNS.forEach(btn => btn.classList.remove('active'));
 
             document.getElementById(tabId).classList.add('active');
-            event.target.closest('.nav-btn').classList.add('active');
+            navBtn.classList.add('active');
+            activeTab = tabId;
+            if (tabId === 'knowledge') ensureKnowledgeBase();
+
+            setTimeout(() => renderCharts(currentLang), 100);
+        }}
+
+        // Clickable controls carry data-action (plus data-tab/-lang/-cat/-unit
+        // where needed); one delegated listener dispatches them all
+        var CLICK_ACTIONS = {{
+            'lang': el => setLanguage(el.dataset.lang),
+            'tab': el => showTab(el.dataset.tab, el),
+            'card': toggleCard,
+            'definition': toggleDefinition,
+            'def-card': toggleDefCard,
+            'charts-section': toggleChartsSection,
+            'definitions-section': toggleDefinitionsSection,
+            'category': el => filterCategory(el.dataset.cat),
+            'unit': el => setUnit(el.dataset.unit),
+            'clear-filters': clearFilters
+        }};
 
-            setTimeout(() => {{
-                window.dispatchEvent(new Event('resize'));
-                if (tabId === 'knowledge') {{
-                    renderCharts(currentLang);
-                }}
-            }}, 100);
-        }}
+        document.addEventListener('click', e => {{
+            var el = e.target.closest('[data-action]');
+            if (el) CLICK_ACTIONS[el.dataset.action](el);
+        }});
 
         // ============================================
         // KNOWLEDGE BASE FUNCTIONS
         // ============================================
 
+        // The KB tab ships inside an inert <template>; swap it into the
+        // live DOM the first time the tab is opened and build the search
+        // index while the browser is idle, before the first keystroke
+        function ensureKnowledgeBase() {{
+            var tpl = document.getElementById('kb-template');
+            if (tpl) {{
+                tpl.replaceWith(tpl.content);
+                (window.requestIdleCallback || setTimeout)(getKbIndex);
+            }}
+        }}
+
         function toggleCard(header) {{
             var card = header.closest('.kb-card');
             card.classList.toggle('expanded');
         }}
 
+        function toggleDefinition(toggle) {{
+            toggle.classList.toggle('expanded');
+        }}
+
         function toggleDefCard(card) {{
-            var detailed = card.querySelector('.def-detailed');
-            if (detailed) {{
-                var isExpanded = detailed.style.display === 'block';
-                detailed.style.display = isExpanded ? 'none' : 'block';
-                card.classList.toggle('expanded', !isExpanded);
-            }}
+            card.classList.toggle('expanded');
         }}
 
         // Toggle collapsible charts section
@@ -3611,10 +3783,7 @@ def generate_html(metrics):
             var content = document.getElementById('kb-charts-content');
             content.classList.toggle('visible');
             if (content.classList.contains('visible')) {{
-                setTimeout(() => {{
-                    window.dispatchEvent(new Event('resize'));
-                    renderCharts(currentLang);
-                }}, 100);
+                setTimeout(() => renderCharts(currentLang), 100);
             }}
         }}
 
@@ -3629,28 +3798,20 @@ def generate_html(metrics):
             currentCategory = category;
 
             // Update category buttons
-            document.querySelectorAll('.cat-btn').forEach(btn => {{
+            getKbIndex().catButtons.forEach(btn => {{
                 btn.classList.toggle('active', btn.dataset.cat === category);
             }});
 
-            // Apply filter and update indicator
             applyFilters();
-            updateFilterIndicator();
         }}
 
         function filterKB() {{
             applyFilters();
-            updateFilterIndicator();
         }}
 
         function clearFilters() {{
-            currentCategory = 'all';
             document.getElementById('kb-search').value = '';
-            document.querySelectorAll('.cat-btn').forEach(btn => {{
-                btn.classList.toggle('active', btn.dataset.cat === 'all');
-            }});
-            applyFilters();
-            updateFilterIndicator();
+            filterCategory('all');
         }}
 
         function updateFilterIndicator() {{
@@ -3674,41 +3835,77 @@ def generate_html(metrics):
             }}
         }}
 
+        // Cards, categories, search text (data-search, lowercased by the
+        // generator) and the filter buttons are read from the DOM once, when
+        // the KB is mounted; filters then work on these arrays and only touch
+        // the DOM in a single requestAnimationFrame write pass
+        var kbIndex = null;
+
+        function getKbIndex() {{
+            if (!kbIndex) {{
+                var cards = Array.from(document.querySelectorAll('.kb-card'));
+                kbIndex = {{
+                    cards: cards,
+                    categories: cards.map(card => card.dataset.category),
+                    text: cards.map(card => card.dataset.search),
+                    summaries: cards.map(card => ({{
+                        design: card.querySelector('.summary-value .design-value'),
+                        actual: card.querySelector('.summary-value .actual-value'),
+                        unit: card.querySelector('.summary-value .unit')
+                    }})),
+                    catButtons: Array.from(document.querySelectorAll('.cat-btn')),
+                    unitButtons: Array.from(document.querySelectorAll('.unit-btn'))
+                }};
+            }}
+            return kbIndex;
+        }}
+
+        // Filter requests are coalesced: any number of keystrokes or clicks
+        // within one frame produce a single read pass and a single write pass
+        var filterFrame = 0;
+
         function applyFilters() {{
+            if (!filterFrame) filterFrame = requestAnimationFrame(runFilters);
+        }}
+
+        function runFilters() {{
+            filterFrame = 0;
             var searchTerm = (document.getElementById('kb-search').value || '').toLowerCase();
-            var cards = document.querySelectorAll('.kb-card');
+            var index = getKbIndex();
             var counts = {{ all: 0, feeds: 0, products: 0, flares: 0, fuel: 0, other: 0 }};
-            var visibleCount = 0;
+            var mask = new Array(index.cards.length);
 
-            cards.forEach(card => {{
-                var category = card.dataset.category;
-                var text = card.textContent.toLowerCase();
+            // Read phase: decide visibility without touching the DOM, and
+            // check (before any write) whether the grid's top is on screen
+            var cardsContainer = document.getElementById('kb-cards-container');
+            var gridTop = cardsContainer ? cardsContainer.getBoundingClientRect().top : 0;
+            var gridOffscreen = gridTop < 0 || gridTop > window.innerHeight;
 
+            for (var i = 0; i < mask.length; i++) {{
+                var category = index.categories[i];
                 var categoryMatch = currentCategory === 'all' || category === currentCategory;
-                var searchMatch = !searchTerm || text.includes(searchTerm);
-
-                var visible = categoryMatch && searchMatch;
-                card.classList.toggle('hidden', !visible);
+                var searchMatch = !searchTerm || index.text[i].includes(searchTerm);
 
-                if (visible) {{
-                    visibleCount++;
+                mask[i] = categoryMatch && searchMatch;
+                if (mask[i]) {{
                     counts.all++;
                     if (counts[category] !== undefined) counts[category]++;
                 }}
-            }});
+            }}
+
+            // Write phase
+            index.cards.forEach((card, i) => card.classList.toggle('hidden', !mask[i]));
 
-            // Update counts
             Object.keys(counts).forEach(cat => {{
                 var el = document.getElementById('count-' + cat);
                 if (el) el.textContent = counts[cat];
             }});
+            updateFilterIndicator();
 
-            // Scroll to cards if filtering
-            if (currentCategory !== 'all' || searchTerm) {{
-                var cardsContainer = document.getElementById('kb-cards-container');
-                if (cardsContainer && visibleCount > 0) {{
-                    cardsContainer.scrollIntoView({{ behavior: 'smooth', block: 'start' }});
-                }}
+            // Scroll to cards if filtering and the results start off screen;
+            // otherwise every keystroke would queue another smooth scroll
+            if ((currentCategory !== 'all' || searchTerm) && gridOffscreen && counts.all > 0) {{
+                cardsContainer.scrollIntoView({{ behavior: 'smooth', block: 'start' }});
             }}
         }}
 
@@ -3716,79 +3913,179 @@ def generate_html(metrics):
             currentUnit = unit;
 
             // Update unit buttons
-            document.querySelectorAll('.unit-btn').forEach(btn => {{
+            getKbIndex().unitButtons.forEach(btn => {{
                 btn.classList.toggle('active', btn.dataset.unit === unit);
             }});
 
             // Update displayed values
             updateUnitDisplay();
+
+            var chartId = 'chart-kb-design-' + currentLang;
+            if (plotted[chartId] && document.getElementById(chartId).offsetParent) {{
+                syncChartUnit(chartId);
+            }}
         }}
 
+        // Cards carry both unit versions of their summary values, formatted
+        // by the generator; switching units only swaps text
         function updateUnitDisplay() {{
-            document.querySelectorAll('.kb-card').forEach(card => {{
-                var designVal = parseFloat(card.dataset.designValue);
-                var designUnit = card.dataset.designUnit || '';
-                var actualVal = parseFloat(card.dataset.actualValue);
-                var actualUnit = card.dataset.actualUnit || designUnit;
-
-                if (isNaN(designVal) && isNaN(actualVal)) return;
-
-                var designDisplay = card.querySelector('.summary-value .design-value');
-                var actualDisplay = card.querySelector('.summary-value .actual-value');
-                var unitDisplay = card.querySelector('.summary-value .unit');
-
-                if (currentUnit === 'annual') {{
-                    // Convert to annual
-                    var annualDesign = convertToAnnual(designVal, designUnit);
-                    var annualActual = convertToAnnual(actualVal, actualUnit);
-
-                    if (designDisplay && !isNaN(annualDesign)) {{
-                        designDisplay.textContent = formatNumber(annualDesign);
-                    }}
-                    if (actualDisplay && !isNaN(annualActual)) {{
-                        actualDisplay.textContent = formatNumber(annualActual);
-                    }}
-                    if (unitDisplay) unitDisplay.textContent = 'T/year';
-                }} else {{
-                    // Show original hourly values
-                    if (designDisplay && !isNaN(designVal)) {{
-                        designDisplay.textContent = formatNumber(designVal);
-                    }}
-                    if (actualDisplay && !isNaN(actualVal)) {{
-                        actualDisplay.textContent = formatNumber(actualVal);
-                    }}
-                    if (unitDisplay) unitDisplay.textContent = designUnit;
-                }}
+            var index = getKbIndex();
+            var annual = currentUnit === 'annual';
+            var key = annual ? 'Annual' : 'Hourly';
+
+            requestAnimationFrame(() => {{
+                index.cards.forEach((card, i) => {{
+                    var data = card.dataset;
+                    if (!data.designHourly && !data.actualHourly) return;
+
+                    var summary = index.summaries[i];
+                    var design = data['design' + key];
+                    var actual = data['actual' + key];
+                    if (summary.design && design) summary.design.textContent = design;
+                    if (summary.actual && actual) summary.actual.textContent = actual;
+                    if (summary.unit) summary.unit.textContent = annual ? 'T/year' : data.designUnit;
+                }});
             }});
         }}
 
-        function convertToAnnual(value, unit) {{
-            if (isNaN(value)) return NaN;
-            if (unit.includes('Year')) return value;
-            if (unit.includes('Kg')) return value * OPERATING_HOURS / 1000;
-            return value * OPERATING_HOURS; // T/hr -> T/year
-        }}
-
-        function formatNumber(num) {{
-            if (isNaN(num)) return 'N/A';
-            if (num >= 1000000) return (num / 1000000).toFixed(1) + 'M';
-            if (num >= 1000) return (num / 1000).toFixed(1) + 'K';
-            return num.toFixed(1);
-        }}
-
-        // Initial render
-        renderCharts('en');
+        // Initial render, once the deferred plotly.js has run
+        document.addEventListener('DOMContentLoaded', () => renderCharts(currentLang));
     </script>
 </body>
 </html>
 '''
 
-    return html
+
+# ============================================================================
+# HTML GENERATION - ORIGINAL DASHBOARD
+# ============================================================================
+
+STREAM_CARD_COMPONENTS = ('H2', 'CH4', 'C2', 'C3', 'C4', 'C5+')
+
+_STREAM_CARD_TEMPLATE = '''
+        <div class="data-card">
+            <div class="data-card-header">{name} <span class="ar-only">({name_ar})</span></div>
+            <div class="data-card-value">{flow:.1f}K <span style="font-size: 0.8rem; color: var(--gray);">t/y</span></div>
+            <div class="data-row"><span>H2</span><span>{0} t/y</span></div>
+            <div class="data-row"><span>CH4</span><span>{1} t/y</span></div>
+            <div class="data-row"><span>C2</span><span>{2} t/y</span></div>
+            <div class="data-row"><span>C3</span><span>{3} t/y</span></div>
+            <div class="data-row"><span>C4</span><span>{4} t/y</span></div>
+            <div class="data-row"><span>C5+</span><span>{5} t/y</span></div>
+        </div>
+        '''
+
+def generate_stream_cards(metrics):
+    """Generate stream detail cards HTML (cached by stream values)."""
+    streams = metrics['streams']
+    comps = metrics['stream_components']
+    return _stream_cards_cached(
+        tuple(streams['names']), tuple(streams['names_ar']), tuple(streams['flow_ty']),
+        tuple(tuple(comps[k]) for k in STREAM_CARD_COMPONENTS)
+    )
+
+@functools.lru_cache(maxsize=8)
+def _stream_cards_cached(names, names_ar, flow_ty, components):
+    # Format every component value once, then transpose to one row per stream
+    formatted = [[f'{v:,.0f}' for v in row] for row in components]
+    return ''.join(
+        _STREAM_CARD_TEMPLATE.format(*values, name=name, name_ar=name_ar, flow=flow / 1000)
+        for name, name_ar, flow, values in zip(names, names_ar, flow_ty, zip(*formatted))
+    )
+
+def generate_prices_table(metrics):
+    """Generate product prices table rows (cached by price values)."""
+    return _prices_table_cached(tuple(metrics['prices'].items()))
+
+@functools.lru_cache(maxsize=8)
+def _prices_table_cached(prices):
+    return ''.join([f'<tr><td>{k}</td><td>${v:,}</td></tr>' for k, v in prices])
+
+# Product value table: (label, metric group, quantity key, value key)
+PRODUCT_VALUE_ROWS = (
+    ('LPG (C3+C4)', 'calc1', 'total_LPG', 'LPG_value'),
+    ('C5+ (Naphtha)', 'calc1', 'total_C5+', 'C5+_value'),
+    ('Hydrogen (H2)', 'calc2', 'total_H2', 'H2_value'),
+    ('Ethane (C2)', 'calc3', 'MIDOR_C2_supply', 'C2_value'),
+    ('Methanol Blend', 'calc6', 'methanol_in_gasoline', 'methanol_value'),
+    ('Ethylene (MTO)', 'calc6', 'ethylene_from_MTO', 'ethylene_value'),
+    ('Propylene (MTO)', 'calc6', 'propylene_from_MTO', 'propylene_value'),
+)
+
+_PRODUCT_ROW_TEMPLATE = '''<tr>
+                            <td>{0}</td>
+                            <td>{1:,.0f}</td>
+                            <td class="value">${2:,.0f}</td>
+                        </tr>'''
+
+def generate_product_rows(metrics):
+    """Generate the product quantity/value table rows."""
+    return '\n                        '.join([
+        _PRODUCT_ROW_TEMPLATE.format(label, metrics[group][qty_key], metrics[group][value_key])
+        for label, group, qty_key, value_key in PRODUCT_VALUE_ROWS
+    ])
+
+def generate_html(metrics):
+    """Generate the complete modern HTML dashboard."""
+
+    # Pre-generate stream cards and the price and product tables
+    stream_cards_html = generate_stream_cards(metrics)
+    prices_table_html = generate_prices_table(metrics)
+    product_rows_html = generate_product_rows(metrics)
+
+    # Load ETHYDCO data and generate Knowledge Base content
+    ethydco_data = load_ethydco_data()
+    kb_html = generate_kb_html(ethydco_data)
+
+    # Pre-generate all chart JSON for both languages; the two builds are
+    # independent, so run them side by side
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        futures = {lang: executor.submit(chart_json, metrics, ethydco_data, lang)
+                   for lang in ('en', 'ar')}
+        charts = {lang: future.result() for lang, future in futures.items()}
+    charts_json = {lang: charts_json_payload(charts[lang]) for lang in charts}
+    charts_json['template'] = chart_template_json()
+
+    summary = metrics['summary']
+
+    # Extract values for KPIs
+    total_value = summary['total_net']
+    phase12 = summary['phase12_net']
+    phase34 = summary['phase34_net']
+
+    # Fill the page body in a single format_map pass
+    return DASHBOARD_HEAD + DASHBOARD_BODY.format_map({
+        'stream_cards_html': stream_cards_html,
+        'prices_table_html': prices_table_html,
+        'kb_html': kb_html,
+        'kb_css': KB_CSS,
+        'charts_json': charts_json,
+        'product_rows_html': product_rows_html,
+        'summary': summary,
+        'total_value_m': total_value / 1e6,
+        'phase12_m': phase12 / 1e6,
+        'phase34_m': phase34 / 1e6,
+        'generated': pd.Timestamp.now().strftime('%Y-%m-%d'),
+    })
 
 # ============================================================================
 # MAIN
 # ============================================================================
 
+def write_output(path, html):
+    """Write the dashboard HTML plus precompressed copies alongside it."""
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(html)
+    data = html.encode('utf-8')
+
+    # Static hosts (e.g. nginx gzip_static / brotli_static) serve path + '.gz'
+    # or '.br' directly; mtime=0 keeps the archive reproducible between runs
+    with open(path + '.gz', 'wb') as f:
+        f.write(gzip.compress(data, compresslevel=9, mtime=0))
+    if brotli is not None:
+        with open(path + '.br', 'wb') as f:
+            f.write(brotli.compress(data, mode=brotli.MODE_TEXT, quality=11))
+
 def main():
     print("Loading metrics...")
     metrics = load_metrics()
@@ -3797,13 +4094,12 @@ def main():
     html = generate_html(metrics)
 
     print("Writing HTML file...")
-    with open('integration_dashboard_v2.html', 'w', encoding='utf-8') as f:
-        f.write(html)
+    write_output('integration_dashboard_v2.html', html)
 
     print("\n" + "="*60)
     print("Dashboard V2 generated successfully!")
     print("="*60)
-    print("\nOutput: integration_dashboard_v2.html")
+    print("\nOutput: integration_dashboard_v2.html (+ .gz%s)" % (", .br" if brotli else ""))
     print("\nFeatures:")
     print("  - Modern dark glassmorphism design")
     print("  - Language toggle (English/Arabic)")
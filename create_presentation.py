@@ -7,13 +7,15 @@ Creates a professional PowerPoint presentation with visuals and text
 from pptx import Presentation
 from pptx.util import Inches, Pt
 from pptx.dml.color import RGBColor
-from pptx.enum.text import PP_ALIGN, MSO_ANCHOR
+from pptx.enum.text import PP_ALIGN
 from pptx.enum.shapes import MSO_SHAPE
-from pptx.oxml.ns import nsmap
-from pptx.oxml import parse_xml
-import plotly.graph_objects as go
-import plotly.io as pio
-from io import BytesIO
+from pptx.shapes.autoshape import AutoShapeType
+from pptx.oxml.ns import qn
+from pptx.oxml.shapes.autoshape import CT_Shape
+from pptx.text.text import TextFrame
+from lxml import etree
+import copy
+import functools
 
 # Color scheme
 COLORS = {
@@ -29,95 +31,173 @@ COLORS = {
     'light': RGBColor(241, 245, 249),       # #f1f5f9
 }
 
+# Font sizes and line widths used across the deck, converted to EMUs once
+PT = {size: Pt(size) for size in (0.5, 2, 3, 10, 11, 12, 13, 14, 15, 16, 18, 20, 22, 24, 28, 32, 36, 42, 48, 54)}
+
+# Inch offsets and sizes used by the slide layouts, converted to EMUs once
+IN = {size: Inches(size) for size in (
+    0.05, 0.06, 0.1, 0.12, 0.15, 0.25, 0.3, 0.35, 0.4, 0.45, 0.5, 0.55, 0.6, 0.65, 0.7,
+    0.75, 0.8, 0.82, 0.9, 0.95, 1, 1.1, 1.2, 1.3, 1.35, 1.4, 1.5, 1.6, 1.7, 1.8, 1.85, 1.9,
+    2, 2.2, 2.4, 2.5, 2.6, 2.7, 2.8, 2.9, 3, 3.1, 3.2, 3.5, 3.6, 3.75, 3.8, 3.85, 4, 4.05,
+    4.2, 4.3, 4.4, 4.5, 4.55, 4.6, 4.7, 4.8, 5, 5.1, 5.15, 5.2, 5.25, 5.3, 5.4, 5.5, 5.65,
+    5.8, 5.95, 6, 6.3, 6.4, 6.5, 6.8, 7.5, 7.6, 8, 8.2, 8.5, 8.6, 9, 10
+)}
+
 def set_slide_background(slide, color):
-    """Set slide background color."""
+    """Set the background color of a slide or slide master."""
     background = slide.background
     fill = background.fill
     fill.solid()
     fill.fore_color.rgb = color
 
-def add_title_slide(prs):
-    """Create title slide."""
-    slide_layout = prs.slide_layouts[6]  # Blank layout
-    slide = prs.slides.add_slide(slide_layout)
-    set_slide_background(slide, COLORS['dark'])
+# DrawingML tags resolved once for writing shape fills and outlines directly
+_SOLID_FILL = qn('a:solidFill')
+_SRGB_CLR = qn('a:srgbClr')
+_LN = qn('a:ln')
+_NO_FILL = qn('a:noFill')
+_P = qn('a:p')
+_P_PR = qn('a:pPr')
+_DEF_RPR = qn('a:defRPr')
+_R = qn('a:r')
+_T = qn('a:t')
+_T_PATH = './/' + qn('a:t')
+
+@functools.lru_cache(maxsize=None)
+def _solid_fill_element(color):
+    """Build <a:solidFill><a:srgbClr val="RRGGBB"/></a:solidFill> once per color."""
+    fill = etree.Element(_SOLID_FILL)
+    etree.SubElement(fill, _SRGB_CLR, val=str(color))
+    return fill
+
+def _append_solid_fill(parent, color):
+    """Append a copy of the cached solid fill for `color` to `parent`."""
+    parent.append(copy.deepcopy(_solid_fill_element(color)))
+
+@functools.lru_cache(maxsize=None)
+def _outline_element(color, width):
+    """Build the <a:ln> outline once per (color, width); None color means no line."""
+    ln = etree.Element(_LN)
+    if color is None:
+        etree.SubElement(ln, _NO_FILL)
+    else:
+        ln.set('w', str(width))
+        ln.append(copy.deepcopy(_solid_fill_element(color)))
+    return ln
+
+def add_filled_shape(slide, shape_type, x, y, cx, cy, fill, line=None, line_width=None):
+    """Add a solid autoshape, outlined in `line` or borderless if None; returns its <p:sp>."""
+    # Append the <p:sp> straight to the shape tree; builders never need the Shape proxy
+    sp = slide.shapes._add_sp(AutoShapeType(shape_type), x, y, cx, cy)
+    # Same XML the fill/line proxies produce, without their per-call lookups
+    spPr = sp.spPr
+    _append_solid_fill(spPr, fill)
+    spPr.append(copy.deepcopy(_outline_element(line, line_width)))
+    return sp
+
+@functools.lru_cache(maxsize=None)
+def _text_body_template(size, color, bold, align, wrap=False):
+    """Build a styled one-run <p:txBody> once per text style."""
+    body = CT_Shape.new_textbox_sp(0, '', 0, 0, 0, 0).txBody
+    if wrap:
+        body.bodyPr.set('wrap', 'square')
+    p = body.find(_P)
+    pPr = etree.SubElement(p, _P_PR)
+    if align is not None:
+        pPr.set('algn', PP_ALIGN.to_xml(align))
+    rPr = etree.SubElement(pPr, _DEF_RPR, sz=str(size.centipoints))
+    if bold is not None:
+        rPr.set('b', '1' if bold else '0')
+    _append_solid_fill(rPr, color)
+    etree.SubElement(etree.SubElement(p, _R), _T).text = ' '
+    return body
+
+def _styled_paragraph(text, size, color, bold=None, align=None):
+    """Return a copy of the cached template's <a:p> holding `text`."""
+    p = copy.deepcopy(_text_body_template(size, color, bold, align).find(_P))
+    p.find(_T_PATH).text = text
+    return p
+
+def add_text(slide, x, y, cx, cy, text, size, color, bold=None, align=None, wrap=False):
+    """Add a single-run text box styled from a cached template body; returns its <p:sp>."""
+    sp = slide.shapes._add_textbox_sp(x, y, cx, cy)
+    body = copy.deepcopy(_text_body_template(size, color, bold, align, wrap))
+    body.find(_T_PATH).text = text
+    sp.replace(sp.txBody, body)
+    return sp
+
+def add_blank_slide(prs, layout):
+    """Add a slide that assigns shape ids without rescanning."""
+    slide = prs.slides.add_slide(layout)
+    # Builders add every shape through this one Slide object, so turbo-add
+    # can count ids up instead of searching the shape tree per shape
+    slide.shapes.turbo_add_enabled = True
+    return slide
 
-    # Add gradient overlay shape
-    shape = slide.shapes.add_shape(MSO_SHAPE.RECTANGLE, 0, 0, prs.slide_width, prs.slide_height)
-    shape.fill.solid()
-    shape.fill.fore_color.rgb = COLORS['dark']
-    shape.line.fill.background()
+def add_line_list(slide, x, y, cx, lines, size, color, pitch):
+    """Add one text box with a paragraph per line, spaced `pitch` EMUs apart."""
+    sp = slide.shapes._add_textbox_sp(x, y, cx, pitch * (len(lines) - 1) + IN[0.4])
+    body = copy.deepcopy(_text_body_template(size, color, None, None))
+    body.find(_T_PATH).text = lines[0]
+    for line in lines[1:]:
+        body.append(_styled_paragraph(line, size, color))
+    # A single-spaced line is ~1.2x the font size; the rest of the pitch
+    # goes before each following paragraph
+    gap = pitch - int(size * 1.2)
+    for p in TextFrame(body, None).paragraphs[1:]:
+        p.space_before = gap
+    sp.replace(sp.txBody, body)
+    return sp
+
+def add_text_rows(slide, x, y, cx, cy, rows, align=None):
+    """Add one text box with a paragraph per (offset, text, size, color, bold) row.
+
+    Each row's offset is in inches below `y`; like add_line_list, the gap left
+    after a ~1.2x-size line goes before the next paragraph.
+    """
+    sp = slide.shapes._add_textbox_sp(x, y, cx, cy)
+    body = copy.deepcopy(_text_body_template(*rows[0][2:], align))
+    body.find(_T_PATH).text = rows[0][1]
+    for offset, text, size, color, bold in rows[1:]:
+        body.append(_styled_paragraph(text, size, color, bold, align))
+    for p, prev, row in zip(TextFrame(body, None).paragraphs[1:], rows, rows[1:]):
+        p.space_before = Inches(row[0] - prev[0]) - int(prev[2] * 1.2)
+    sp.replace(sp.txBody, body)
+    return sp
+
+def add_title_slide(prs, layout):
+    """Create title slide."""
+    slide = add_blank_slide(prs, layout)
 
     # Main title
-    title_box = slide.shapes.add_textbox(Inches(0.5), Inches(2.5), Inches(9), Inches(1.5))
-    tf = title_box.text_frame
-    p = tf.paragraphs[0]
-    p.text = "MIDOR-ETHYDCO Integration"
-    p.font.size = Pt(54)
-    p.font.bold = True
-    p.font.color.rgb = COLORS['white']
-    p.alignment = PP_ALIGN.CENTER
+    add_text(slide, IN[0.5], IN[2.5], IN[9], IN[1.5], "MIDOR-ETHYDCO Integration", PT[54], COLORS['white'], bold=True, align=PP_ALIGN.CENTER)
 
     # Subtitle
-    subtitle_box = slide.shapes.add_textbox(Inches(0.5), Inches(4), Inches(9), Inches(0.8))
-    tf = subtitle_box.text_frame
-    p = tf.paragraphs[0]
-    p.text = "Petrochemical Integration Analysis"
-    p.font.size = Pt(28)
-    p.font.color.rgb = COLORS['secondary']
-    p.alignment = PP_ALIGN.CENTER
+    add_text(slide, IN[0.5], IN[4], IN[9], IN[0.8], "Petrochemical Integration Analysis", PT[28], COLORS['secondary'], align=PP_ALIGN.CENTER)
 
     # Value highlight
-    value_box = slide.shapes.add_textbox(Inches(0.5), Inches(5), Inches(9), Inches(1))
-    tf = value_box.text_frame
-    p = tf.paragraphs[0]
-    p.text = "$196 Million/Year Net Value"
-    p.font.size = Pt(32)
-    p.font.bold = True
-    p.font.color.rgb = COLORS['accent']
-    p.alignment = PP_ALIGN.CENTER
+    add_text(slide, IN[0.5], IN[5], IN[9], IN[1], "$196 Million/Year Net Value", PT[32], COLORS['accent'], bold=True, align=PP_ALIGN.CENTER)
 
     # Footer
-    footer_box = slide.shapes.add_textbox(Inches(0.5), Inches(6.5), Inches(9), Inches(0.5))
-    tf = footer_box.text_frame
-    p = tf.paragraphs[0]
-    p.text = "Middle East Oil Refinery (MIDOR) & Egyptian Ethylene and Derivatives Company (ETHYDCO)"
-    p.font.size = Pt(14)
-    p.font.color.rgb = COLORS['gray']
-    p.alignment = PP_ALIGN.CENTER
+    add_text(slide, IN[0.5], IN[6.5], IN[9], IN[0.5], "Middle East Oil Refinery (MIDOR) & Egyptian Ethylene and Derivatives Company (ETHYDCO)", PT[14], COLORS['gray'], align=PP_ALIGN.CENTER)
 
     return slide
 
-def add_executive_summary(prs):
+def add_executive_summary(prs, layout):
     """Create executive summary slide."""
-    slide_layout = prs.slide_layouts[6]
-    slide = prs.slides.add_slide(slide_layout)
-    set_slide_background(slide, COLORS['dark'])
+    slide = add_blank_slide(prs, layout)
 
     # Title
-    title_box = slide.shapes.add_textbox(Inches(0.5), Inches(0.3), Inches(9), Inches(0.8))
-    tf = title_box.text_frame
-    p = tf.paragraphs[0]
-    p.text = "Executive Summary"
-    p.font.size = Pt(36)
-    p.font.bold = True
-    p.font.color.rgb = COLORS['white']
+    add_text(slide, IN[0.5], IN[0.3], IN[9], IN[0.8], "Executive Summary", PT[36], COLORS['white'], bold=True)
 
     # Key message box
-    msg_shape = slide.shapes.add_shape(MSO_SHAPE.ROUNDED_RECTANGLE, Inches(0.5), Inches(1.2), Inches(9), Inches(1.2))
-    msg_shape.fill.solid()
-    msg_shape.fill.fore_color.rgb = COLORS['dark_light']
-    msg_shape.line.color.rgb = COLORS['secondary']
-    msg_shape.line.width = Pt(2)
-
-    tf = msg_shape.text_frame
-    tf.word_wrap = True
-    p = tf.paragraphs[0]
-    p.text = "Strategic integration between MIDOR refinery and ETHYDCO petrochemical complex creates significant value through gas recovery, hydrogen utilization, and methanol production pathways."
-    p.font.size = Pt(16)
-    p.font.color.rgb = COLORS['light']
-    p.alignment = PP_ALIGN.CENTER
-    tf.paragraphs[0].space_before = Pt(15)
+    msg_shape = add_filled_shape(slide, MSO_SHAPE.ROUNDED_RECTANGLE, IN[0.5], IN[1.2], IN[9], IN[1.2], COLORS['dark_light'], COLORS['secondary'], PT[2])
+
+    body = msg_shape.txBody
+    body.bodyPr.set('wrap', 'square')
+    body.replace(body.find(_P), _styled_paragraph(
+        "Strategic integration between MIDOR refinery and ETHYDCO petrochemical complex creates significant value through gas recovery, hydrogen utilization, and methanol production pathways.",
+        PT[16], COLORS['light'], align=PP_ALIGN.CENTER))
+    TextFrame(body, None).paragraphs[0].space_before = PT[15]
 
     # Three KPI cards
     kpis = [
@@ -126,102 +206,48 @@ def add_executive_summary(prs):
         ("$96M", "Phase 3+4", "Methanol & MTO", COLORS['accent']),
     ]
 
+    x0, dx = IN[0.5], IN[3.1]
     for i, (value, title, subtitle, color) in enumerate(kpis):
-        x = Inches(0.5 + i * 3.1)
+        x = x0 + i * dx
 
         # Card background
-        card = slide.shapes.add_shape(MSO_SHAPE.ROUNDED_RECTANGLE, x, Inches(2.6), Inches(2.9), Inches(1.8))
-        card.fill.solid()
-        card.fill.fore_color.rgb = COLORS['dark_light']
-        card.line.color.rgb = color
-        card.line.width = Pt(3)
+        add_filled_shape(slide, MSO_SHAPE.ROUNDED_RECTANGLE, x, IN[2.6], IN[2.9], IN[1.8], COLORS['dark_light'], color, PT[3])
 
         # Value
-        val_box = slide.shapes.add_textbox(x, Inches(2.8), Inches(2.9), Inches(0.8))
-        tf = val_box.text_frame
-        p = tf.paragraphs[0]
-        p.text = value
-        p.font.size = Pt(36)
-        p.font.bold = True
-        p.font.color.rgb = color
-        p.alignment = PP_ALIGN.CENTER
+        add_text(slide, x, IN[2.8], IN[2.9], IN[0.8], value, PT[36], color, bold=True, align=PP_ALIGN.CENTER)
 
         # Title
-        title_box = slide.shapes.add_textbox(x, Inches(3.5), Inches(2.9), Inches(0.4))
-        tf = title_box.text_frame
-        p = tf.paragraphs[0]
-        p.text = title
-        p.font.size = Pt(14)
-        p.font.bold = True
-        p.font.color.rgb = COLORS['white']
-        p.alignment = PP_ALIGN.CENTER
+        add_text(slide, x, IN[3.5], IN[2.9], IN[0.4], title, PT[14], COLORS['white'], bold=True, align=PP_ALIGN.CENTER)
 
         # Subtitle
-        sub_box = slide.shapes.add_textbox(x, Inches(3.85), Inches(2.9), Inches(0.4))
-        tf = sub_box.text_frame
-        p = tf.paragraphs[0]
-        p.text = subtitle
-        p.font.size = Pt(12)
-        p.font.color.rgb = COLORS['gray']
-        p.alignment = PP_ALIGN.CENTER
+        add_text(slide, x, IN[3.85], IN[2.9], IN[0.4], subtitle, PT[12], COLORS['gray'], align=PP_ALIGN.CENTER)
 
     # Key benefits section
-    benefits_title = slide.shapes.add_textbox(Inches(0.5), Inches(4.6), Inches(9), Inches(0.5))
-    tf = benefits_title.text_frame
-    p = tf.paragraphs[0]
-    p.text = "Key Benefits"
-    p.font.size = Pt(20)
-    p.font.bold = True
-    p.font.color.rgb = COLORS['secondary']
+    add_text(slide, IN[0.5], IN[4.6], IN[9], IN[0.5], "Key Benefits", PT[20], COLORS['secondary'], bold=True)
 
     benefits = [
-        "Eliminates flare gas waste - converts to valuable products",
-        "Provides 49-71% of ETHYDCO's ethane feedstock requirements",
-        "Creates new revenue streams from hydrogen and methanol",
-        "Reduces environmental impact through emission reduction"
+        "✓  Eliminates flare gas waste - converts to valuable products",
+        "✓  Provides 49-71% of ETHYDCO's ethane feedstock requirements",
+        "✓  Creates new revenue streams from hydrogen and methanol",
+        "✓  Reduces environmental impact through emission reduction"
     ]
 
-    for i, benefit in enumerate(benefits):
-        y = Inches(5.1 + i * 0.4)
-        bullet_box = slide.shapes.add_textbox(Inches(0.7), y, Inches(8.5), Inches(0.4))
-        tf = bullet_box.text_frame
-        p = tf.paragraphs[0]
-        p.text = f"✓  {benefit}"
-        p.font.size = Pt(14)
-        p.font.color.rgb = COLORS['light']
+    add_line_list(slide, IN[0.7], IN[5.1], IN[8.5], benefits, PT[14], COLORS['light'], pitch=IN[0.4])
 
     return slide
 
-def add_problem_statement(prs):
+def add_problem_statement(prs, layout):
     """Create problem statement slide."""
-    slide_layout = prs.slide_layouts[6]
-    slide = prs.slides.add_slide(slide_layout)
-    set_slide_background(slide, COLORS['dark'])
+    slide = add_blank_slide(prs, layout)
 
     # Title
-    title_box = slide.shapes.add_textbox(Inches(0.5), Inches(0.3), Inches(9), Inches(0.8))
-    tf = title_box.text_frame
-    p = tf.paragraphs[0]
-    p.text = "The Opportunity"
-    p.font.size = Pt(36)
-    p.font.bold = True
-    p.font.color.rgb = COLORS['white']
+    add_text(slide, IN[0.5], IN[0.3], IN[9], IN[0.8], "The Opportunity", PT[36], COLORS['white'], bold=True)
 
     # Two columns layout
     # Left column - MIDOR
-    midor_title = slide.shapes.add_textbox(Inches(0.5), Inches(1.2), Inches(4.3), Inches(0.5))
-    tf = midor_title.text_frame
-    p = tf.paragraphs[0]
-    p.text = "MIDOR Refinery"
-    p.font.size = Pt(22)
-    p.font.bold = True
-    p.font.color.rgb = COLORS['primary']
-
-    midor_box = slide.shapes.add_shape(MSO_SHAPE.ROUNDED_RECTANGLE, Inches(0.5), Inches(1.7), Inches(4.3), Inches(2.5))
-    midor_box.fill.solid()
-    midor_box.fill.fore_color.rgb = COLORS['dark_light']
-    midor_box.line.color.rgb = COLORS['primary']
-    midor_box.line.width = Pt(2)
+    add_text(slide, IN[0.5], IN[1.2], IN[4.3], IN[0.5], "MIDOR Refinery", PT[22], COLORS['primary'], bold=True)
+
+    add_filled_shape(slide, MSO_SHAPE.ROUNDED_RECTANGLE, IN[0.5], IN[1.7], IN[4.3], IN[2.5], COLORS['dark_light'], COLORS['primary'], PT[2])
 
     midor_issues = [
         "• Flaring valuable gases",
@@ -231,28 +257,12 @@ def add_problem_statement(prs):
         "• Wasted economic potential"
     ]
 
-    for i, issue in enumerate(midor_issues):
-        issue_box = slide.shapes.add_textbox(Inches(0.7), Inches(1.9 + i * 0.45), Inches(4), Inches(0.4))
-        tf = issue_box.text_frame
-        p = tf.paragraphs[0]
-        p.text = issue
-        p.font.size = Pt(14)
-        p.font.color.rgb = COLORS['light']
+    add_line_list(slide, IN[0.7], IN[1.9], IN[4], midor_issues, PT[14], COLORS['light'], pitch=IN[0.45])
 
     # Right column - ETHYDCO
-    ethydco_title = slide.shapes.add_textbox(Inches(5.2), Inches(1.2), Inches(4.3), Inches(0.5))
-    tf = ethydco_title.text_frame
-    p = tf.paragraphs[0]
-    p.text = "ETHYDCO Complex"
-    p.font.size = Pt(22)
-    p.font.bold = True
-    p.font.color.rgb = COLORS['accent']
-
-    ethydco_box = slide.shapes.add_shape(MSO_SHAPE.ROUNDED_RECTANGLE, Inches(5.2), Inches(1.7), Inches(4.3), Inches(2.5))
-    ethydco_box.fill.solid()
-    ethydco_box.fill.fore_color.rgb = COLORS['dark_light']
-    ethydco_box.line.color.rgb = COLORS['accent']
-    ethydco_box.line.width = Pt(2)
+    add_text(slide, IN[5.2], IN[1.2], IN[4.3], IN[0.5], "ETHYDCO Complex", PT[22], COLORS['accent'], bold=True)
+
+    add_filled_shape(slide, MSO_SHAPE.ROUNDED_RECTANGLE, IN[5.2], IN[1.7], IN[4.3], IN[2.5], COLORS['dark_light'], COLORS['accent'], PT[2])
 
     ethydco_issues = [
         "• Needs ethane feedstock",
@@ -262,204 +272,78 @@ def add_problem_statement(prs):
         "• Cost pressures"
     ]
 
-    for i, issue in enumerate(ethydco_issues):
-        issue_box = slide.shapes.add_textbox(Inches(5.4), Inches(1.9 + i * 0.45), Inches(4), Inches(0.4))
-        tf = issue_box.text_frame
-        p = tf.paragraphs[0]
-        p.text = issue
-        p.font.size = Pt(14)
-        p.font.color.rgb = COLORS['light']
+    add_line_list(slide, IN[5.4], IN[1.9], IN[4], ethydco_issues, PT[14], COLORS['light'], pitch=IN[0.45])
 
     # Arrow in middle
-    arrow_box = slide.shapes.add_textbox(Inches(4.3), Inches(2.7), Inches(1.4), Inches(0.5))
-    tf = arrow_box.text_frame
-    p = tf.paragraphs[0]
-    p.text = "↔"
-    p.font.size = Pt(48)
-    p.font.color.rgb = COLORS['success']
-    p.alignment = PP_ALIGN.CENTER
+    add_text(slide, IN[4.3], IN[2.7], IN[1.4], IN[0.5], "↔", PT[48], COLORS['success'], align=PP_ALIGN.CENTER)
 
     # Solution box
-    solution_box = slide.shapes.add_shape(MSO_SHAPE.ROUNDED_RECTANGLE, Inches(0.5), Inches(4.5), Inches(9), Inches(2))
-    solution_box.fill.solid()
-    solution_box.fill.fore_color.rgb = COLORS['dark_light']
-    solution_box.line.color.rgb = COLORS['success']
-    solution_box.line.width = Pt(3)
-
-    sol_title = slide.shapes.add_textbox(Inches(0.7), Inches(4.7), Inches(8.6), Inches(0.5))
-    tf = sol_title.text_frame
-    p = tf.paragraphs[0]
-    p.text = "The Solution: Strategic Integration"
-    p.font.size = Pt(20)
-    p.font.bold = True
-    p.font.color.rgb = COLORS['success']
+    add_filled_shape(slide, MSO_SHAPE.ROUNDED_RECTANGLE, IN[0.5], IN[4.5], IN[9], IN[2], COLORS['dark_light'], COLORS['success'], PT[3])
+
+    add_text(slide, IN[0.7], IN[4.7], IN[8.6], IN[0.5], "The Solution: Strategic Integration", PT[20], COLORS['success'], bold=True)
 
     solution_text = "By integrating MIDOR's off-gas streams with ETHYDCO's feedstock needs, we create a symbiotic relationship that transforms waste into value. MIDOR's flare gases become ETHYDCO's feedstock, while recovered hydrogen enables methanol production for gasoline blending."
 
-    sol_desc = slide.shapes.add_textbox(Inches(0.7), Inches(5.2), Inches(8.6), Inches(1.2))
-    tf = sol_desc.text_frame
-    tf.word_wrap = True
-    p = tf.paragraphs[0]
-    p.text = solution_text
-    p.font.size = Pt(14)
-    p.font.color.rgb = COLORS['light']
+    add_text(slide, IN[0.7], IN[5.2], IN[8.6], IN[1.2], solution_text, PT[14], COLORS['light'], wrap=True)
 
     return slide
 
-def add_integration_phases(prs):
+def add_integration_phases(prs, layout):
     """Create integration phases overview slide."""
-    slide_layout = prs.slide_layouts[6]
-    slide = prs.slides.add_slide(slide_layout)
-    set_slide_background(slide, COLORS['dark'])
+    slide = add_blank_slide(prs, layout)
 
     # Title
-    title_box = slide.shapes.add_textbox(Inches(0.5), Inches(0.3), Inches(9), Inches(0.8))
-    tf = title_box.text_frame
-    p = tf.paragraphs[0]
-    p.text = "Integration Phases"
-    p.font.size = Pt(36)
-    p.font.bold = True
-    p.font.color.rgb = COLORS['white']
+    add_text(slide, IN[0.5], IN[0.3], IN[9], IN[0.8], "Integration Phases", PT[36], COLORS['white'], bold=True)
 
     phases = [
-        {
-            "num": "1",
-            "title": "LPG & C5+ Recovery",
-            "value": "$105M",
-            "desc": "Recover propane, butane, and naphtha from all gas streams",
-            "color": COLORS['secondary']
-        },
-        {
-            "num": "2",
-            "title": "Hydrogen Recovery",
-            "value": "$79M",
-            "desc": "Extract hydrogen for refinery use and methanol synthesis",
-            "color": COLORS['primary']
-        },
-        {
-            "num": "3",
-            "title": "Methanol Production",
-            "value": "$36M",
-            "desc": "Convert CO/CO2 + H2 to methanol for gasoline blending",
-            "color": COLORS['accent']
-        },
-        {
-            "num": "4",
-            "title": "MTO Conversion",
-            "value": "$60M",
-            "desc": "Methanol-to-Olefins producing ethylene & propylene",
-            "color": COLORS['success']
-        }
+        ("1", "LPG & C5+ Recovery", "$105M", "Recover propane, butane, and naphtha from all gas streams", COLORS['secondary']),
+        ("2", "Hydrogen Recovery", "$79M", "Extract hydrogen for refinery use and methanol synthesis", COLORS['primary']),
+        ("3", "Methanol Production", "$36M", "Convert CO/CO2 + H2 to methanol for gasoline blending", COLORS['accent']),
+        ("4", "MTO Conversion", "$60M", "Methanol-to-Olefins producing ethylene & propylene", COLORS['success']),
     ]
 
-    for i, phase in enumerate(phases):
-        y = Inches(1.2 + i * 1.4)
+    y0, dy = IN[1.2], IN[1.4]
+    for i, (num, title, value, desc, color) in enumerate(phases):
+        y = y0 + i * dy
 
         # Phase number circle
-        circle = slide.shapes.add_shape(MSO_SHAPE.OVAL, Inches(0.5), y, Inches(0.7), Inches(0.7))
-        circle.fill.solid()
-        circle.fill.fore_color.rgb = phase['color']
-        circle.line.fill.background()
-
-        num_box = slide.shapes.add_textbox(Inches(0.5), y + Inches(0.1), Inches(0.7), Inches(0.5))
-        tf = num_box.text_frame
-        p = tf.paragraphs[0]
-        p.text = phase['num']
-        p.font.size = Pt(24)
-        p.font.bold = True
-        p.font.color.rgb = COLORS['white']
-        p.alignment = PP_ALIGN.CENTER
+        add_filled_shape(slide, MSO_SHAPE.OVAL, IN[0.5], y, IN[0.7], IN[0.7], color)
+
+        add_text(slide, IN[0.5], y + IN[0.1], IN[0.7], IN[0.5], num, PT[24], COLORS['white'], bold=True, align=PP_ALIGN.CENTER)
 
         # Phase content box
-        box = slide.shapes.add_shape(MSO_SHAPE.ROUNDED_RECTANGLE, Inches(1.4), y, Inches(6.5), Inches(1.1))
-        box.fill.solid()
-        box.fill.fore_color.rgb = COLORS['dark_light']
-        box.line.color.rgb = phase['color']
-        box.line.width = Pt(2)
+        add_filled_shape(slide, MSO_SHAPE.ROUNDED_RECTANGLE, IN[1.4], y, IN[6.5], IN[1.1], COLORS['dark_light'], color, PT[2])
 
         # Title
-        title = slide.shapes.add_textbox(Inches(1.6), y + Inches(0.15), Inches(4), Inches(0.4))
-        tf = title.text_frame
-        p = tf.paragraphs[0]
-        p.text = phase['title']
-        p.font.size = Pt(18)
-        p.font.bold = True
-        p.font.color.rgb = COLORS['white']
+        add_text(slide, IN[1.6], y + IN[0.15], IN[4], IN[0.4], title, PT[18], COLORS['white'], bold=True)
 
         # Description
-        desc = slide.shapes.add_textbox(Inches(1.6), y + Inches(0.55), Inches(5), Inches(0.5))
-        tf = desc.text_frame
-        p = tf.paragraphs[0]
-        p.text = phase['desc']
-        p.font.size = Pt(12)
-        p.font.color.rgb = COLORS['gray']
+        add_text(slide, IN[1.6], y + IN[0.55], IN[5], IN[0.5], desc, PT[12], COLORS['gray'])
 
         # Value
-        val = slide.shapes.add_textbox(Inches(6.8), y + Inches(0.25), Inches(1.1), Inches(0.6))
-        tf = val.text_frame
-        p = tf.paragraphs[0]
-        p.text = phase['value']
-        p.font.size = Pt(22)
-        p.font.bold = True
-        p.font.color.rgb = phase['color']
-        p.alignment = PP_ALIGN.CENTER
+        add_text(slide, IN[6.8], y + IN[0.25], IN[1.1], IN[0.6], value, PT[22], color, bold=True, align=PP_ALIGN.CENTER)
 
         # Connector line
         if i < 3:
-            line = slide.shapes.add_shape(MSO_SHAPE.RECTANGLE, Inches(0.82), y + Inches(0.75), Inches(0.06), Inches(0.65))
-            line.fill.solid()
-            line.fill.fore_color.rgb = COLORS['gray']
-            line.line.fill.background()
+            add_filled_shape(slide, MSO_SHAPE.RECTANGLE, IN[0.82], y + IN[0.75], IN[0.06], IN[0.65], COLORS['gray'])
 
     # Total value box
-    total_box = slide.shapes.add_shape(MSO_SHAPE.ROUNDED_RECTANGLE, Inches(8.2), Inches(2.5), Inches(1.5), Inches(2))
-    total_box.fill.solid()
-    total_box.fill.fore_color.rgb = COLORS['dark_light']
-    total_box.line.color.rgb = COLORS['white']
-    total_box.line.width = Pt(2)
-
-    total_title = slide.shapes.add_textbox(Inches(8.2), Inches(2.7), Inches(1.5), Inches(0.4))
-    tf = total_title.text_frame
-    p = tf.paragraphs[0]
-    p.text = "TOTAL"
-    p.font.size = Pt(12)
-    p.font.bold = True
-    p.font.color.rgb = COLORS['gray']
-    p.alignment = PP_ALIGN.CENTER
-
-    total_val = slide.shapes.add_textbox(Inches(8.2), Inches(3.1), Inches(1.5), Inches(0.6))
-    tf = total_val.text_frame
-    p = tf.paragraphs[0]
-    p.text = "$196M"
-    p.font.size = Pt(28)
-    p.font.bold = True
-    p.font.color.rgb = COLORS['white']
-    p.alignment = PP_ALIGN.CENTER
-
-    total_sub = slide.shapes.add_textbox(Inches(8.2), Inches(3.6), Inches(1.5), Inches(0.4))
-    tf = total_sub.text_frame
-    p = tf.paragraphs[0]
-    p.text = "Net/Year"
-    p.font.size = Pt(11)
-    p.font.color.rgb = COLORS['gray']
-    p.alignment = PP_ALIGN.CENTER
+    add_filled_shape(slide, MSO_SHAPE.ROUNDED_RECTANGLE, IN[8.2], IN[2.5], IN[1.5], IN[2], COLORS['dark_light'], COLORS['white'], PT[2])
+
+    add_text(slide, IN[8.2], IN[2.7], IN[1.5], IN[0.4], "TOTAL", PT[12], COLORS['gray'], bold=True, align=PP_ALIGN.CENTER)
+
+    add_text(slide, IN[8.2], IN[3.1], IN[1.5], IN[0.6], "$196M", PT[28], COLORS['white'], bold=True, align=PP_ALIGN.CENTER)
+
+    add_text(slide, IN[8.2], IN[3.6], IN[1.5], IN[0.4], "Net/Year", PT[11], COLORS['gray'], align=PP_ALIGN.CENTER)
 
     return slide
 
-def add_product_values(prs):
+def add_product_values(prs, layout):
     """Create product values slide."""
-    slide_layout = prs.slide_layouts[6]
-    slide = prs.slides.add_slide(slide_layout)
-    set_slide_background(slide, COLORS['dark'])
+    slide = add_blank_slide(prs, layout)
 
     # Title
-    title_box = slide.shapes.add_textbox(Inches(0.5), Inches(0.3), Inches(9), Inches(0.8))
-    tf = title_box.text_frame
-    p = tf.paragraphs[0]
-    p.text = "Annual Product Values"
-    p.font.size = Pt(36)
-    p.font.bold = True
-    p.font.color.rgb = COLORS['white']
+    add_text(slide, IN[0.5], IN[0.3], IN[9], IN[0.8], "Annual Product Values", PT[36], COLORS['white'], bold=True)
 
     products = [
         ("LPG (C3+C4)", "$91.5M", "125,509 t/y", COLORS['secondary'], 0.915),
@@ -472,87 +356,44 @@ def add_product_values(prs):
     ]
 
     max_width = 7.5  # inches for 100%
+    bar_x, bar_gap = IN[2.7], IN[0.1]
+    bar_widths = [Inches(max_width * pct) for *_, pct in products]
 
-    for i, (name, value, qty, color, pct) in enumerate(products):
-        y = Inches(1.1 + i * 0.75)
+    y0, dy = IN[1.1], IN[0.75]
+    for i, ((name, value, qty, color, _), bar_width) in enumerate(zip(products, bar_widths)):
+        y = y0 + i * dy
 
         # Product name
-        name_box = slide.shapes.add_textbox(Inches(0.5), y, Inches(2.2), Inches(0.4))
-        tf = name_box.text_frame
-        p = tf.paragraphs[0]
-        p.text = name
-        p.font.size = Pt(13)
-        p.font.color.rgb = COLORS['light']
+        add_text(slide, IN[0.5], y, IN[2.2], IN[0.4], name, PT[13], COLORS['light'])
 
         # Bar background
-        bar_bg = slide.shapes.add_shape(MSO_SHAPE.ROUNDED_RECTANGLE, Inches(2.7), y + Inches(0.05), Inches(max_width), Inches(0.35))
-        bar_bg.fill.solid()
-        bar_bg.fill.fore_color.rgb = COLORS['dark_light']
-        bar_bg.line.fill.background()
+        add_filled_shape(slide, MSO_SHAPE.ROUNDED_RECTANGLE, bar_x, y + IN[0.05], Inches(max_width), IN[0.35], COLORS['dark_light'])
 
         # Bar fill
-        bar_width = max_width * pct
-        bar = slide.shapes.add_shape(MSO_SHAPE.ROUNDED_RECTANGLE, Inches(2.7), y + Inches(0.05), Inches(bar_width), Inches(0.35))
-        bar.fill.solid()
-        bar.fill.fore_color.rgb = color
-        bar.line.fill.background()
+        add_filled_shape(slide, MSO_SHAPE.ROUNDED_RECTANGLE, bar_x, y + IN[0.05], bar_width, IN[0.35], color)
 
         # Value label
-        val_box = slide.shapes.add_textbox(Inches(2.7 + bar_width + 0.1), y, Inches(1), Inches(0.4))
-        tf = val_box.text_frame
-        p = tf.paragraphs[0]
-        p.text = value
-        p.font.size = Pt(13)
-        p.font.bold = True
-        p.font.color.rgb = COLORS['white']
+        add_text(slide, bar_x + bar_width + bar_gap, y, IN[1], IN[0.4], value, PT[13], COLORS['white'], bold=True)
 
         # Quantity
-        qty_box = slide.shapes.add_textbox(Inches(0.5), y + Inches(0.35), Inches(2.2), Inches(0.3))
-        tf = qty_box.text_frame
-        p = tf.paragraphs[0]
-        p.text = qty
-        p.font.size = Pt(10)
-        p.font.color.rgb = COLORS['gray']
+        add_text(slide, IN[0.5], y + IN[0.35], IN[2.2], IN[0.3], qty, PT[10], COLORS['gray'])
 
     # Note about costs
-    note_box = slide.shapes.add_shape(MSO_SHAPE.ROUNDED_RECTANGLE, Inches(0.5), Inches(6.3), Inches(9), Inches(0.6))
-    note_box.fill.solid()
-    note_box.fill.fore_color.rgb = COLORS['dark_light']
-    note_box.line.color.rgb = COLORS['danger']
-    note_box.line.width = Pt(2)
-
-    note = slide.shapes.add_textbox(Inches(0.7), Inches(6.4), Inches(8.6), Inches(0.4))
-    tf = note.text_frame
-    p = tf.paragraphs[0]
-    p.text = "Note: Natural Gas makeup cost of $76.2M/year deducted to arrive at net value of $196M"
-    p.font.size = Pt(12)
-    p.font.color.rgb = COLORS['light']
-    p.alignment = PP_ALIGN.CENTER
+    add_filled_shape(slide, MSO_SHAPE.ROUNDED_RECTANGLE, IN[0.5], IN[6.3], IN[9], IN[0.6], COLORS['dark_light'], COLORS['danger'], PT[2])
+
+    add_text(slide, IN[0.7], IN[6.4], IN[8.6], IN[0.4], "Note: Natural Gas makeup cost of $76.2M/year deducted to arrive at net value of $196M", PT[12], COLORS['light'], align=PP_ALIGN.CENTER)
 
     return slide
 
-def add_c2_coverage(prs):
+def add_c2_coverage(prs, layout):
     """Create C2 coverage slide."""
-    slide_layout = prs.slide_layouts[6]
-    slide = prs.slides.add_slide(slide_layout)
-    set_slide_background(slide, COLORS['dark'])
+    slide = add_blank_slide(prs, layout)
 
     # Title
-    title_box = slide.shapes.add_textbox(Inches(0.5), Inches(0.3), Inches(9), Inches(0.8))
-    tf = title_box.text_frame
-    p = tf.paragraphs[0]
-    p.text = "ETHYDCO C2 Feed Coverage"
-    p.font.size = Pt(36)
-    p.font.bold = True
-    p.font.color.rgb = COLORS['white']
+    add_text(slide, IN[0.5], IN[0.3], IN[9], IN[0.8], "ETHYDCO C2 Feed Coverage", PT[36], COLORS['white'], bold=True)
 
     # Subtitle
-    sub = slide.shapes.add_textbox(Inches(0.5), Inches(0.9), Inches(9), Inches(0.5))
-    tf = sub.text_frame
-    p = tf.paragraphs[0]
-    p.text = "MIDOR can supply 59,005 t/y of ethane to ETHYDCO"
-    p.font.size = Pt(16)
-    p.font.color.rgb = COLORS['gray']
+    add_text(slide, IN[0.5], IN[0.9], IN[9], IN[0.5], "MIDOR can supply 59,005 t/y of ethane to ETHYDCO", PT[16], COLORS['gray'])
 
     # Two gauge-like displays
     gauges = [
@@ -560,93 +401,40 @@ def add_c2_coverage(prs):
         ("Maximum Demand", "121,600 t/y", "48.5%", COLORS['accent'])
     ]
 
+    x0, dx = IN[0.8], IN[4.7]
     for i, (title, demand, coverage, color) in enumerate(gauges):
-        x = Inches(0.8 + i * 4.7)
+        x = x0 + i * dx
 
         # Card
-        card = slide.shapes.add_shape(MSO_SHAPE.ROUNDED_RECTANGLE, x, Inches(1.6), Inches(4), Inches(3.2))
-        card.fill.solid()
-        card.fill.fore_color.rgb = COLORS['dark_light']
-        card.line.color.rgb = color
-        card.line.width = Pt(2)
+        add_filled_shape(slide, MSO_SHAPE.ROUNDED_RECTANGLE, x, IN[1.6], IN[4], IN[3.2], COLORS['dark_light'], color, PT[2])
 
         # Title
-        t = slide.shapes.add_textbox(x, Inches(1.8), Inches(4), Inches(0.4))
-        tf = t.text_frame
-        p = tf.paragraphs[0]
-        p.text = title
-        p.font.size = Pt(18)
-        p.font.bold = True
-        p.font.color.rgb = COLORS['white']
-        p.alignment = PP_ALIGN.CENTER
+        add_text(slide, x, IN[1.8], IN[4], IN[0.4], title, PT[18], COLORS['white'], bold=True, align=PP_ALIGN.CENTER)
 
         # Demand
-        d = slide.shapes.add_textbox(x, Inches(2.2), Inches(4), Inches(0.4))
-        tf = d.text_frame
-        p = tf.paragraphs[0]
-        p.text = f"ETHYDCO needs: {demand}"
-        p.font.size = Pt(12)
-        p.font.color.rgb = COLORS['gray']
-        p.alignment = PP_ALIGN.CENTER
+        add_text(slide, x, IN[2.2], IN[4], IN[0.4], f"ETHYDCO needs: {demand}", PT[12], COLORS['gray'], align=PP_ALIGN.CENTER)
 
         # Big percentage
-        pct = slide.shapes.add_textbox(x, Inches(2.8), Inches(4), Inches(1))
-        tf = pct.text_frame
-        p = tf.paragraphs[0]
-        p.text = coverage
-        p.font.size = Pt(54)
-        p.font.bold = True
-        p.font.color.rgb = color
-        p.alignment = PP_ALIGN.CENTER
+        add_text(slide, x, IN[2.8], IN[4], IN[1], coverage, PT[54], color, bold=True, align=PP_ALIGN.CENTER)
 
         # Coverage label
-        lbl = slide.shapes.add_textbox(x, Inches(3.8), Inches(4), Inches(0.4))
-        tf = lbl.text_frame
-        p = tf.paragraphs[0]
-        p.text = "Coverage"
-        p.font.size = Pt(14)
-        p.font.color.rgb = COLORS['gray']
-        p.alignment = PP_ALIGN.CENTER
+        add_text(slide, x, IN[3.8], IN[4], IN[0.4], "Coverage", PT[14], COLORS['gray'], align=PP_ALIGN.CENTER)
 
     # Key insight
-    insight_box = slide.shapes.add_shape(MSO_SHAPE.ROUNDED_RECTANGLE, Inches(0.5), Inches(5.1), Inches(9), Inches(1.5))
-    insight_box.fill.solid()
-    insight_box.fill.fore_color.rgb = COLORS['dark_light']
-    insight_box.line.color.rgb = COLORS['secondary']
-    insight_box.line.width = Pt(2)
-
-    insight_title = slide.shapes.add_textbox(Inches(0.7), Inches(5.25), Inches(8.6), Inches(0.4))
-    tf = insight_title.text_frame
-    p = tf.paragraphs[0]
-    p.text = "Key Insight"
-    p.font.size = Pt(16)
-    p.font.bold = True
-    p.font.color.rgb = COLORS['secondary']
-
-    insight_text = slide.shapes.add_textbox(Inches(0.7), Inches(5.65), Inches(8.6), Inches(0.9))
-    tf = insight_text.text_frame
-    tf.word_wrap = True
-    p = tf.paragraphs[0]
-    p.text = "MIDOR's integration can provide nearly half to over two-thirds of ETHYDCO's ethane requirements, significantly reducing import dependency and creating a reliable local supply chain worth $23.6M annually."
-    p.font.size = Pt(13)
-    p.font.color.rgb = COLORS['light']
+    add_filled_shape(slide, MSO_SHAPE.ROUNDED_RECTANGLE, IN[0.5], IN[5.1], IN[9], IN[1.5], COLORS['dark_light'], COLORS['secondary'], PT[2])
+
+    add_text(slide, IN[0.7], IN[5.25], IN[8.6], IN[0.4], "Key Insight", PT[16], COLORS['secondary'], bold=True)
+
+    add_text(slide, IN[0.7], IN[5.65], IN[8.6], IN[0.9], "MIDOR's integration can provide nearly half to over two-thirds of ETHYDCO's ethane requirements, significantly reducing import dependency and creating a reliable local supply chain worth $23.6M annually.", PT[13], COLORS['light'], wrap=True)
 
     return slide
 
-def add_hydrogen_balance(prs):
+def add_hydrogen_balance(prs, layout):
     """Create hydrogen balance slide."""
-    slide_layout = prs.slide_layouts[6]
-    slide = prs.slides.add_slide(slide_layout)
-    set_slide_background(slide, COLORS['dark'])
+    slide = add_blank_slide(prs, layout)
 
     # Title
-    title_box = slide.shapes.add_textbox(Inches(0.5), Inches(0.3), Inches(9), Inches(0.8))
-    tf = title_box.text_frame
-    p = tf.paragraphs[0]
-    p.text = "Hydrogen Balance for Methanol"
-    p.font.size = Pt(36)
-    p.font.bold = True
-    p.font.color.rgb = COLORS['white']
+    add_text(slide, IN[0.5], IN[0.3], IN[9], IN[0.8], "Hydrogen Balance for Methanol", PT[36], COLORS['white'], bold=True)
 
     # Three columns showing H2 balance
     columns = [
@@ -655,156 +443,78 @@ def add_hydrogen_balance(prs):
         ("H2 Deficit", "26.2K t/y", "External supply needed", COLORS['danger']),
     ]
 
+    x0, dx = IN[0.5], IN[3.1]
     for i, (title, value, desc, color) in enumerate(columns):
-        x = Inches(0.5 + i * 3.1)
+        x = x0 + i * dx
 
         # Card
-        card = slide.shapes.add_shape(MSO_SHAPE.ROUNDED_RECTANGLE, x, Inches(1.2), Inches(2.9), Inches(2.2))
-        card.fill.solid()
-        card.fill.fore_color.rgb = COLORS['dark_light']
-        card.line.color.rgb = color
-        card.line.width = Pt(2)
+        add_filled_shape(slide, MSO_SHAPE.ROUNDED_RECTANGLE, x, IN[1.2], IN[2.9], IN[2.2], COLORS['dark_light'], color, PT[2])
 
         # Title
-        t = slide.shapes.add_textbox(x, Inches(1.4), Inches(2.9), Inches(0.4))
-        tf = t.text_frame
-        p = tf.paragraphs[0]
-        p.text = title
-        p.font.size = Pt(14)
-        p.font.color.rgb = COLORS['gray']
-        p.alignment = PP_ALIGN.CENTER
+        add_text(slide, x, IN[1.4], IN[2.9], IN[0.4], title, PT[14], COLORS['gray'], align=PP_ALIGN.CENTER)
 
         # Value
-        v = slide.shapes.add_textbox(x, Inches(1.9), Inches(2.9), Inches(0.8))
-        tf = v.text_frame
-        p = tf.paragraphs[0]
-        p.text = value
-        p.font.size = Pt(36)
-        p.font.bold = True
-        p.font.color.rgb = color
-        p.alignment = PP_ALIGN.CENTER
+        add_text(slide, x, IN[1.9], IN[2.9], IN[0.8], value, PT[36], color, bold=True, align=PP_ALIGN.CENTER)
 
         # Description
-        d = slide.shapes.add_textbox(x, Inches(2.7), Inches(2.9), Inches(0.5))
-        tf = d.text_frame
-        p = tf.paragraphs[0]
-        p.text = desc
-        p.font.size = Pt(11)
-        p.font.color.rgb = COLORS['gray']
-        p.alignment = PP_ALIGN.CENTER
+        add_text(slide, x, IN[2.7], IN[2.9], IN[0.5], desc, PT[11], COLORS['gray'], align=PP_ALIGN.CENTER)
 
     # Utilization highlight
-    util_box = slide.shapes.add_shape(MSO_SHAPE.ROUNDED_RECTANGLE, Inches(3), Inches(3.6), Inches(4), Inches(1))
-    util_box.fill.solid()
-    util_box.fill.fore_color.rgb = COLORS['dark_light']
-    util_box.line.color.rgb = COLORS['secondary']
-    util_box.line.width = Pt(3)
-
-    util_title = slide.shapes.add_textbox(Inches(3), Inches(3.75), Inches(4), Inches(0.4))
-    tf = util_title.text_frame
-    p = tf.paragraphs[0]
-    p.text = "H2 Utilization Rate"
-    p.font.size = Pt(14)
-    p.font.color.rgb = COLORS['gray']
-    p.alignment = PP_ALIGN.CENTER
-
-    util_val = slide.shapes.add_textbox(Inches(3), Inches(4.05), Inches(4), Inches(0.5))
-    tf = util_val.text_frame
-    p = tf.paragraphs[0]
-    p.text = "60%"
-    p.font.size = Pt(32)
-    p.font.bold = True
-    p.font.color.rgb = COLORS['secondary']
-    p.alignment = PP_ALIGN.CENTER
+    add_filled_shape(slide, MSO_SHAPE.ROUNDED_RECTANGLE, IN[3], IN[3.6], IN[4], IN[1], COLORS['dark_light'], COLORS['secondary'], PT[3])
+
+    add_text(slide, IN[3], IN[3.75], IN[4], IN[0.4], "H2 Utilization Rate", PT[14], COLORS['gray'], align=PP_ALIGN.CENTER)
+
+    add_text(slide, IN[3], IN[4.05], IN[4], IN[0.5], "60%", PT[32], COLORS['secondary'], bold=True, align=PP_ALIGN.CENTER)
 
     # Methanol allocation section
-    alloc_title = slide.shapes.add_textbox(Inches(0.5), Inches(4.8), Inches(9), Inches(0.5))
-    tf = alloc_title.text_frame
-    p = tf.paragraphs[0]
-    p.text = "Methanol Allocation (224,070 t/y Total)"
-    p.font.size = Pt(20)
-    p.font.bold = True
-    p.font.color.rgb = COLORS['white']
+    add_text(slide, IN[0.5], IN[4.8], IN[9], IN[0.5], "Methanol Allocation (224,070 t/y Total)", PT[20], COLORS['white'], bold=True)
 
     allocations = [
         ("Gasoline Blending", "79,540 t/y", "35.5%", "$35.8M", COLORS['secondary']),
         ("MTO Conversion", "144,530 t/y", "64.5%", "$60.4M", COLORS['accent']),
     ]
 
-    for i, (name, qty, pct, value, color) in enumerate(allocations):
-        y = Inches(5.3 + i * 0.7)
+    bar_widths = [Inches(5 * float(pct.rstrip('%')) / 100) for _, _, pct, _, _ in allocations]
+
+    y0, dy = IN[5.3], IN[0.7]
+    for i, ((name, qty, pct, value, color), bar_width) in enumerate(zip(allocations, bar_widths)):
+        y = y0 + i * dy
 
         # Name
-        n = slide.shapes.add_textbox(Inches(0.5), y, Inches(2), Inches(0.4))
-        tf = n.text_frame
-        p = tf.paragraphs[0]
-        p.text = name
-        p.font.size = Pt(14)
-        p.font.color.rgb = COLORS['light']
+        add_text(slide, IN[0.5], y, IN[2], IN[0.4], name, PT[14], COLORS['light'])
 
         # Bar
-        bar_bg = slide.shapes.add_shape(MSO_SHAPE.ROUNDED_RECTANGLE, Inches(2.5), y + Inches(0.05), Inches(5), Inches(0.35))
-        bar_bg.fill.solid()
-        bar_bg.fill.fore_color.rgb = COLORS['dark_light']
-        bar_bg.line.fill.background()
+        add_filled_shape(slide, MSO_SHAPE.ROUNDED_RECTANGLE, IN[2.5], y + IN[0.05], IN[5], IN[0.35], COLORS['dark_light'])
 
-        bar_width = 5 * float(pct.replace('%', '')) / 100
-        bar = slide.shapes.add_shape(MSO_SHAPE.ROUNDED_RECTANGLE, Inches(2.5), y + Inches(0.05), Inches(bar_width), Inches(0.35))
-        bar.fill.solid()
-        bar.fill.fore_color.rgb = color
-        bar.line.fill.background()
+        add_filled_shape(slide, MSO_SHAPE.ROUNDED_RECTANGLE, IN[2.5], y + IN[0.05], bar_width, IN[0.35], color)
 
         # Percentage and value
-        info = slide.shapes.add_textbox(Inches(7.6), y, Inches(2), Inches(0.4))
-        tf = info.text_frame
-        p = tf.paragraphs[0]
-        p.text = f"{pct} | {value}"
-        p.font.size = Pt(12)
-        p.font.bold = True
-        p.font.color.rgb = color
+        add_text(slide, IN[7.6], y, IN[2], IN[0.4], f"{pct} | {value}", PT[12], color, bold=True)
 
     return slide
 
-def add_financial_summary(prs):
+def add_financial_summary(prs, layout):
     """Create financial summary slide."""
-    slide_layout = prs.slide_layouts[6]
-    slide = prs.slides.add_slide(slide_layout)
-    set_slide_background(slide, COLORS['dark'])
+    slide = add_blank_slide(prs, layout)
 
     # Title
-    title_box = slide.shapes.add_textbox(Inches(0.5), Inches(0.3), Inches(9), Inches(0.8))
-    tf = title_box.text_frame
-    p = tf.paragraphs[0]
-    p.text = "Financial Summary"
-    p.font.size = Pt(36)
-    p.font.bold = True
-    p.font.color.rgb = COLORS['white']
+    add_text(slide, IN[0.5], IN[0.3], IN[9], IN[0.8], "Financial Summary", PT[36], COLORS['white'], bold=True)
 
     # Table header
     headers = ["Category", "Gross Value", "NG Cost", "Net Value"]
-    col_widths = [2.5, 2, 2, 2]
+    col_widths = [Inches(w) for w in (2.5, 2, 2, 2)]
 
-    y = Inches(1.2)
-    x_start = Inches(0.75)
+    y = IN[1.2]
+    x_start = IN[0.75]
 
     # Header row
     x = x_start
     for i, header in enumerate(headers):
-        header_box = slide.shapes.add_shape(MSO_SHAPE.RECTANGLE, x, y, Inches(col_widths[i]), Inches(0.5))
-        header_box.fill.solid()
-        header_box.fill.fore_color.rgb = COLORS['secondary']
-        header_box.line.fill.background()
-
-        txt = slide.shapes.add_textbox(x, y + Inches(0.1), Inches(col_widths[i]), Inches(0.4))
-        tf = txt.text_frame
-        p = tf.paragraphs[0]
-        p.text = header
-        p.font.size = Pt(14)
-        p.font.bold = True
-        p.font.color.rgb = COLORS['white']
-        p.alignment = PP_ALIGN.CENTER
-
-        x += Inches(col_widths[i])
+        add_filled_shape(slide, MSO_SHAPE.RECTANGLE, x, y, col_widths[i], IN[0.5], COLORS['secondary'])
+
+        add_text(slide, x, y + IN[0.1], col_widths[i], IN[0.4], header, PT[14], COLORS['white'], bold=True, align=PP_ALIGN.CENTER)
+
+        x += col_widths[i]
 
     # Data rows
     rows = [
@@ -814,237 +524,114 @@ def add_financial_summary(prs):
     ]
 
     for row_idx, row_data in enumerate(rows):
-        y += Inches(0.6)
+        y += IN[0.6]
         x = x_start
 
         is_total = row_idx == len(rows) - 1
 
         for col_idx, cell in enumerate(row_data):
-            cell_box = slide.shapes.add_shape(MSO_SHAPE.RECTANGLE, x, y, Inches(col_widths[col_idx]), Inches(0.55))
-            cell_box.fill.solid()
-            cell_box.fill.fore_color.rgb = COLORS['dark_light'] if not is_total else RGBColor(20, 50, 40)
-            cell_box.line.color.rgb = COLORS['gray']
-            cell_box.line.width = Pt(0.5)
-
-            txt = slide.shapes.add_textbox(x, y + Inches(0.12), Inches(col_widths[col_idx]), Inches(0.4))
-            tf = txt.text_frame
-            p = tf.paragraphs[0]
-            p.text = cell
-            p.font.size = Pt(13) if not is_total else Pt(14)
-            p.font.bold = is_total or col_idx == 0
+            add_filled_shape(slide, MSO_SHAPE.RECTANGLE, x, y, col_widths[col_idx], IN[0.55], COLORS['dark_light'] if not is_total else RGBColor(20, 50, 40), COLORS['gray'], PT[0.5])
 
             # Color coding
             if col_idx == 2 and "-" in cell:
-                p.font.color.rgb = COLORS['danger']
+                color = COLORS['danger']
             elif col_idx == 3:
-                p.font.color.rgb = COLORS['success']
+                color = COLORS['success']
             else:
-                p.font.color.rgb = COLORS['white']
+                color = COLORS['white']
 
-            if col_idx > 0:
-                p.alignment = PP_ALIGN.CENTER
+            add_text(slide, x, y + IN[0.12], col_widths[col_idx], IN[0.4], cell,
+                     PT[13] if not is_total else PT[14], color,
+                     bold=is_total or col_idx == 0,
+                     align=PP_ALIGN.CENTER if col_idx > 0 else None)
 
-            x += Inches(col_widths[col_idx])
+            x += col_widths[col_idx]
 
     # Value breakdown visual
-    breakdown_title = slide.shapes.add_textbox(Inches(0.5), Inches(3.8), Inches(9), Inches(0.5))
-    tf = breakdown_title.text_frame
-    p = tf.paragraphs[0]
-    p.text = "Value Composition"
-    p.font.size = Pt(20)
-    p.font.bold = True
-    p.font.color.rgb = COLORS['white']
-
-    # Stacked bar visualization
+    add_text(slide, IN[0.5], IN[3.8], IN[9], IN[0.5], "Value Composition", PT[20], COLORS['white'], bold=True)
+
+    # Stacked bar visualization; extents are converted to EMUs once and
+    # shared by each bar and its label
     total_width = 8.5
-    phase12_width = total_width * (99.8 / 196.1)
-    phase34_width = total_width * (96.2 / 196.1)
+    phase12_width = Inches(total_width * (99.8 / 196.1))
+    phase34_width = Inches(total_width * (96.2 / 196.1))
+    bar2_x = Inches(0.75 + total_width * (99.8 / 196.1))
 
     # Phase 1+2 bar
-    bar1 = slide.shapes.add_shape(MSO_SHAPE.ROUNDED_RECTANGLE, Inches(0.75), Inches(4.4), Inches(phase12_width), Inches(0.8))
-    bar1.fill.solid()
-    bar1.fill.fore_color.rgb = COLORS['primary']
-    bar1.line.fill.background()
-
-    bar1_txt = slide.shapes.add_textbox(Inches(0.75), Inches(4.55), Inches(phase12_width), Inches(0.5))
-    tf = bar1_txt.text_frame
-    p = tf.paragraphs[0]
-    p.text = "Phase 1+2: $99.8M (51%)"
-    p.font.size = Pt(14)
-    p.font.bold = True
-    p.font.color.rgb = COLORS['white']
-    p.alignment = PP_ALIGN.CENTER
+    add_filled_shape(slide, MSO_SHAPE.ROUNDED_RECTANGLE, IN[0.75], IN[4.4], phase12_width, IN[0.8], COLORS['primary'])
+
+    add_text(slide, IN[0.75], IN[4.55], phase12_width, IN[0.5], "Phase 1+2: $99.8M (51%)", PT[14], COLORS['white'], bold=True, align=PP_ALIGN.CENTER)
 
     # Phase 3+4 bar
-    bar2 = slide.shapes.add_shape(MSO_SHAPE.ROUNDED_RECTANGLE, Inches(0.75 + phase12_width), Inches(4.4), Inches(phase34_width), Inches(0.8))
-    bar2.fill.solid()
-    bar2.fill.fore_color.rgb = COLORS['accent']
-    bar2.line.fill.background()
-
-    bar2_txt = slide.shapes.add_textbox(Inches(0.75 + phase12_width), Inches(4.55), Inches(phase34_width), Inches(0.5))
-    tf = bar2_txt.text_frame
-    p = tf.paragraphs[0]
-    p.text = "Phase 3+4: $96.2M (49%)"
-    p.font.size = Pt(14)
-    p.font.bold = True
-    p.font.color.rgb = COLORS['white']
-    p.alignment = PP_ALIGN.CENTER
+    add_filled_shape(slide, MSO_SHAPE.ROUNDED_RECTANGLE, bar2_x, IN[4.4], phase34_width, IN[0.8], COLORS['accent'])
+
+    add_text(slide, bar2_x, IN[4.55], phase34_width, IN[0.5], "Phase 3+4: $96.2M (49%)", PT[14], COLORS['white'], bold=True, align=PP_ALIGN.CENTER)
 
     # ROI note
-    roi_box = slide.shapes.add_shape(MSO_SHAPE.ROUNDED_RECTANGLE, Inches(0.5), Inches(5.5), Inches(9), Inches(1.3))
-    roi_box.fill.solid()
-    roi_box.fill.fore_color.rgb = COLORS['dark_light']
-    roi_box.line.color.rgb = COLORS['success']
-    roi_box.line.width = Pt(2)
-
-    roi_title = slide.shapes.add_textbox(Inches(0.7), Inches(5.65), Inches(8.6), Inches(0.4))
-    tf = roi_title.text_frame
-    p = tf.paragraphs[0]
-    p.text = "Investment Considerations"
-    p.font.size = Pt(16)
-    p.font.bold = True
-    p.font.color.rgb = COLORS['success']
-
-    roi_text = slide.shapes.add_textbox(Inches(0.7), Inches(6.0), Inches(8.6), Inches(0.7))
-    tf = roi_text.text_frame
-    tf.word_wrap = True
-    p = tf.paragraphs[0]
-    p.text = "• Net annual value of $196M provides strong basis for capital investment\n• Phased implementation reduces initial capital requirements\n• Phase 1+2 can be implemented independently with positive returns"
-    p.font.size = Pt(12)
-    p.font.color.rgb = COLORS['light']
+    add_filled_shape(slide, MSO_SHAPE.ROUNDED_RECTANGLE, IN[0.5], IN[5.5], IN[9], IN[1.3], COLORS['dark_light'], COLORS['success'], PT[2])
+
+    add_text(slide, IN[0.7], IN[5.65], IN[8.6], IN[0.4], "Investment Considerations", PT[16], COLORS['success'], bold=True)
+
+    roi_points = [
+        "• Net annual value of $196M provides strong basis for capital investment",
+        "• Phased implementation reduces initial capital requirements",
+        "• Phase 1+2 can be implemented independently with positive returns",
+    ]
+    roi_text = add_text(slide, IN[0.7], IN[6.0], IN[8.6], IN[0.7], roi_points[0], PT[12], COLORS['light'], wrap=True)
+    for point in roi_points[1:]:
+        roi_text.txBody.append(_styled_paragraph(point, PT[12], COLORS['light']))
 
     return slide
 
-def add_next_steps(prs):
+def add_next_steps(prs, layout):
     """Create next steps / recommendations slide."""
-    slide_layout = prs.slide_layouts[6]
-    slide = prs.slides.add_slide(slide_layout)
-    set_slide_background(slide, COLORS['dark'])
+    slide = add_blank_slide(prs, layout)
 
     # Title
-    title_box = slide.shapes.add_textbox(Inches(0.5), Inches(0.3), Inches(9), Inches(0.8))
-    tf = title_box.text_frame
-    p = tf.paragraphs[0]
-    p.text = "Recommendations & Next Steps"
-    p.font.size = Pt(36)
-    p.font.bold = True
-    p.font.color.rgb = COLORS['white']
+    add_text(slide, IN[0.5], IN[0.3], IN[9], IN[0.8], "Recommendations & Next Steps", PT[36], COLORS['white'], bold=True)
 
     steps = [
-        {
-            "num": "1",
-            "title": "Feasibility Study",
-            "desc": "Conduct detailed engineering and economic feasibility study for gas recovery infrastructure",
-            "color": COLORS['secondary']
-        },
-        {
-            "num": "2",
-            "title": "Partnership Agreement",
-            "desc": "Establish formal partnership framework between MIDOR and ETHYDCO for feedstock supply",
-            "color": COLORS['primary']
-        },
-        {
-            "num": "3",
-            "title": "Phase 1 Implementation",
-            "desc": "Begin with LPG and hydrogen recovery as quick wins with proven technology",
-            "color": COLORS['accent']
-        },
-        {
-            "num": "4",
-            "title": "Methanol Unit Planning",
-            "desc": "Plan methanol synthesis and MTO units based on Phase 1 performance",
-            "color": COLORS['success']
-        },
+        ("1", "Feasibility Study", "Conduct detailed engineering and economic feasibility study for gas recovery infrastructure", COLORS['secondary']),
+        ("2", "Partnership Agreement", "Establish formal partnership framework between MIDOR and ETHYDCO for feedstock supply", COLORS['primary']),
+        ("3", "Phase 1 Implementation", "Begin with LPG and hydrogen recovery as quick wins with proven technology", COLORS['accent']),
+        ("4", "Methanol Unit Planning", "Plan methanol synthesis and MTO units based on Phase 1 performance", COLORS['success']),
     ]
 
-    for i, step in enumerate(steps):
-        y = Inches(1.1 + i * 1.35)
+    # Row offsets as one EMU range rather than per-iteration arithmetic
+    ys = range(IN[1.1], IN[1.1] + len(steps) * IN[1.35], IN[1.35])
+    for y, (num, title, desc, color) in zip(ys, steps):
 
         # Number box
-        num_box = slide.shapes.add_shape(MSO_SHAPE.ROUNDED_RECTANGLE, Inches(0.5), y, Inches(0.6), Inches(0.6))
-        num_box.fill.solid()
-        num_box.fill.fore_color.rgb = step['color']
-        num_box.line.fill.background()
-
-        num_txt = slide.shapes.add_textbox(Inches(0.5), y + Inches(0.1), Inches(0.6), Inches(0.4))
-        tf = num_txt.text_frame
-        p = tf.paragraphs[0]
-        p.text = step['num']
-        p.font.size = Pt(24)
-        p.font.bold = True
-        p.font.color.rgb = COLORS['white']
-        p.alignment = PP_ALIGN.CENTER
+        add_filled_shape(slide, MSO_SHAPE.ROUNDED_RECTANGLE, IN[0.5], y, IN[0.6], IN[0.6], color)
+
+        add_text(slide, IN[0.5], y + IN[0.1], IN[0.6], IN[0.4], num, PT[24], COLORS['white'], bold=True, align=PP_ALIGN.CENTER)
 
         # Content
-        title_txt = slide.shapes.add_textbox(Inches(1.3), y, Inches(8), Inches(0.5))
-        tf = title_txt.text_frame
-        p = tf.paragraphs[0]
-        p.text = step['title']
-        p.font.size = Pt(18)
-        p.font.bold = True
-        p.font.color.rgb = step['color']
-
-        desc_txt = slide.shapes.add_textbox(Inches(1.3), y + Inches(0.45), Inches(8), Inches(0.5))
-        tf = desc_txt.text_frame
-        p = tf.paragraphs[0]
-        p.text = step['desc']
-        p.font.size = Pt(13)
-        p.font.color.rgb = COLORS['light']
+        add_text_rows(slide, IN[1.3], y, IN[8], IN[0.95], [
+            (0, title, PT[18], color, True),
+            (0.45, desc, PT[13], COLORS['light'], None),
+        ])
 
     # Timeline hint
-    timeline = slide.shapes.add_shape(MSO_SHAPE.ROUNDED_RECTANGLE, Inches(0.5), Inches(5.8), Inches(9), Inches(1))
-    timeline.fill.solid()
-    timeline.fill.fore_color.rgb = COLORS['dark_light']
-    timeline.line.color.rgb = COLORS['secondary']
-    timeline.line.width = Pt(2)
-
-    tl_title = slide.shapes.add_textbox(Inches(0.7), Inches(5.95), Inches(8.6), Inches(0.4))
-    tf = tl_title.text_frame
-    p = tf.paragraphs[0]
-    p.text = "Suggested Timeline"
-    p.font.size = Pt(14)
-    p.font.bold = True
-    p.font.color.rgb = COLORS['secondary']
-
-    tl_text = slide.shapes.add_textbox(Inches(0.7), Inches(6.3), Inches(8.6), Inches(0.4))
-    tf = tl_text.text_frame
-    p = tf.paragraphs[0]
-    p.text = "Phase 1+2: 18-24 months  |  Phase 3+4: 24-36 months after Phase 1+2 completion"
-    p.font.size = Pt(12)
-    p.font.color.rgb = COLORS['light']
+    add_filled_shape(slide, MSO_SHAPE.ROUNDED_RECTANGLE, IN[0.5], IN[5.8], IN[9], IN[1], COLORS['dark_light'], COLORS['secondary'], PT[2])
+
+    add_text(slide, IN[0.7], IN[5.95], IN[8.6], IN[0.4], "Suggested Timeline", PT[14], COLORS['secondary'], bold=True)
+
+    add_text(slide, IN[0.7], IN[6.3], IN[8.6], IN[0.4], "Phase 1+2: 18-24 months  |  Phase 3+4: 24-36 months after Phase 1+2 completion", PT[12], COLORS['light'])
 
     return slide
 
-def add_conclusion(prs):
+def add_conclusion(prs, layout):
     """Create conclusion slide."""
-    slide_layout = prs.slide_layouts[6]
-    slide = prs.slides.add_slide(slide_layout)
-    set_slide_background(slide, COLORS['dark'])
+    slide = add_blank_slide(prs, layout)
 
     # Title
-    title_box = slide.shapes.add_textbox(Inches(0.5), Inches(0.5), Inches(9), Inches(1))
-    tf = title_box.text_frame
-    p = tf.paragraphs[0]
-    p.text = "Conclusion"
-    p.font.size = Pt(42)
-    p.font.bold = True
-    p.font.color.rgb = COLORS['white']
+    add_text(slide, IN[0.5], IN[0.5], IN[9], IN[1], "Conclusion", PT[42], COLORS['white'], bold=True)
 
     # Main message
-    msg_box = slide.shapes.add_shape(MSO_SHAPE.ROUNDED_RECTANGLE, Inches(0.5), Inches(1.6), Inches(9), Inches(1.5))
-    msg_box.fill.solid()
-    msg_box.fill.fore_color.rgb = COLORS['dark_light']
-    msg_box.line.color.rgb = COLORS['secondary']
-    msg_box.line.width = Pt(3)
-
-    msg = slide.shapes.add_textbox(Inches(0.7), Inches(1.85), Inches(8.6), Inches(1.2))
-    tf = msg.text_frame
-    tf.word_wrap = True
-    p = tf.paragraphs[0]
-    p.text = "The MIDOR-ETHYDCO integration represents a transformative opportunity to create $196 million in annual value while strengthening Egypt's petrochemical industry and reducing environmental impact."
-    p.font.size = Pt(18)
-    p.font.color.rgb = COLORS['light']
-    p.alignment = PP_ALIGN.CENTER
+    add_filled_shape(slide, MSO_SHAPE.ROUNDED_RECTANGLE, IN[0.5], IN[1.6], IN[9], IN[1.5], COLORS['dark_light'], COLORS['secondary'], PT[3])
+
+    add_text(slide, IN[0.7], IN[1.85], IN[8.6], IN[1.2], "The MIDOR-ETHYDCO integration represents a transformative opportunity to create $196 million in annual value while strengthening Egypt's petrochemical industry and reducing environmental impact.", PT[18], COLORS['light'], align=PP_ALIGN.CENTER, wrap=True)
 
     # Key stats row
     stats = [
@@ -1054,49 +641,21 @@ def add_conclusion(prs):
         ("60%+", "Feedstock Coverage"),
     ]
 
-    for i, (value, label) in enumerate(stats):
-        x = Inches(0.5 + i * 2.4)
-
-        stat_val = slide.shapes.add_textbox(x, Inches(3.5), Inches(2.2), Inches(0.8))
-        tf = stat_val.text_frame
-        p = tf.paragraphs[0]
-        p.text = value
-        p.font.size = Pt(36)
-        p.font.bold = True
-        p.font.color.rgb = COLORS['secondary']
-        p.alignment = PP_ALIGN.CENTER
-
-        stat_lbl = slide.shapes.add_textbox(x, Inches(4.2), Inches(2.2), Inches(0.5))
-        tf = stat_lbl.text_frame
-        p = tf.paragraphs[0]
-        p.text = label
-        p.font.size = Pt(12)
-        p.font.color.rgb = COLORS['gray']
-        p.alignment = PP_ALIGN.CENTER
+    xs = range(IN[0.5], IN[0.5] + len(stats) * IN[2.4], IN[2.4])
+    for x, (value, label) in zip(xs, stats):
+
+        add_text_rows(slide, x, IN[3.5], IN[2.2], IN[1.2], [
+            (0, value, PT[36], COLORS['secondary'], True),
+            (0.7, label, PT[12], COLORS['gray'], None),
+        ], align=PP_ALIGN.CENTER)
 
     # Call to action
-    cta = slide.shapes.add_shape(MSO_SHAPE.ROUNDED_RECTANGLE, Inches(2.5), Inches(5), Inches(5), Inches(0.8))
-    cta.fill.solid()
-    cta.fill.fore_color.rgb = COLORS['success']
-    cta.line.fill.background()
-
-    cta_txt = slide.shapes.add_textbox(Inches(2.5), Inches(5.15), Inches(5), Inches(0.5))
-    tf = cta_txt.text_frame
-    p = tf.paragraphs[0]
-    p.text = "Ready to Transform Waste into Value"
-    p.font.size = Pt(20)
-    p.font.bold = True
-    p.font.color.rgb = COLORS['white']
-    p.alignment = PP_ALIGN.CENTER
+    add_filled_shape(slide, MSO_SHAPE.ROUNDED_RECTANGLE, IN[2.5], IN[5], IN[5], IN[0.8], COLORS['success'])
+
+    add_text(slide, IN[2.5], IN[5.15], IN[5], IN[0.5], "Ready to Transform Waste into Value", PT[20], COLORS['white'], bold=True, align=PP_ALIGN.CENTER)
 
     # Contact/footer
-    footer = slide.shapes.add_textbox(Inches(0.5), Inches(6.3), Inches(9), Inches(0.5))
-    tf = footer.text_frame
-    p = tf.paragraphs[0]
-    p.text = "MIDOR-ETHYDCO Integration Analysis | December 2025"
-    p.font.size = Pt(12)
-    p.font.color.rgb = COLORS['gray']
-    p.alignment = PP_ALIGN.CENTER
+    add_text(slide, IN[0.5], IN[6.3], IN[9], IN[0.5], "MIDOR-ETHYDCO Integration Analysis | December 2025", PT[12], COLORS['gray'], align=PP_ALIGN.CENTER)
 
     return slide
 
@@ -1106,41 +665,51 @@ def main():
 
     # Create presentation with 16:9 aspect ratio
     prs = Presentation()
-    prs.slide_width = Inches(10)
-    prs.slide_height = Inches(7.5)
-
-    # Add slides
-    add_title_slide(prs)
-    add_executive_summary(prs)
-    add_problem_statement(prs)
-    add_integration_phases(prs)
-    add_product_values(prs)
-    add_c2_coverage(prs)
-    add_hydrogen_balance(prs)
-    add_financial_summary(prs)
-    add_next_steps(prs)
-    add_conclusion(prs)
+    prs.slide_width = IN[10]
+    prs.slide_height = IN[7.5]
+    # Every slide inherits the dark background from the master
+    set_slide_background(prs.slide_master, COLORS['dark'])
+
+    # Add slides; every slide uses the blank layout, looked up once
+    blank = prs.slide_layouts[6]
+    # Drop the default template's other layouts so they aren't written out
+    for layout in list(prs.slide_layouts):
+        if layout != blank:
+            prs.slide_layouts.remove(layout)
+    add_title_slide(prs, blank)
+    add_executive_summary(prs, blank)
+    add_problem_statement(prs, blank)
+    add_integration_phases(prs, blank)
+    add_product_values(prs, blank)
+    add_c2_coverage(prs, blank)
+    add_hydrogen_balance(prs, blank)
+    add_financial_summary(prs, blank)
+    add_next_steps(prs, blank)
+    add_conclusion(prs, blank)
 
     # Save presentation
     output_path = 'MIDOR_ETHYDCO_Integration_Presentation.pptx'
     prs.save(output_path)
 
-    print(f"\n{'='*60}")
-    print("Presentation created successfully!")
-    print(f"{'='*60}")
-    print(f"\nOutput: {output_path}")
-    print(f"\nSlides: 10")
-    print("\nContents:")
-    print("  1. Title Slide")
-    print("  2. Executive Summary")
-    print("  3. The Opportunity")
-    print("  4. Integration Phases")
-    print("  5. Annual Product Values")
-    print("  6. ETHYDCO C2 Feed Coverage")
-    print("  7. Hydrogen Balance for Methanol")
-    print("  8. Financial Summary")
-    print("  9. Recommendations & Next Steps")
-    print(" 10. Conclusion")
+    # One buffered write for the whole summary instead of a print per line
+    print("\n".join([
+        f"\n{'='*60}",
+        "Presentation created successfully!",
+        f"{'='*60}",
+        f"\nOutput: {output_path}",
+        f"\nSlides: {len(prs.slides)}",
+        "\nContents:",
+        "  1. Title Slide",
+        "  2. Executive Summary",
+        "  3. The Opportunity",
+        "  4. Integration Phases",
+        "  5. Annual Product Values",
+        "  6. ETHYDCO C2 Feed Coverage",
+        "  7. Hydrogen Balance for Methanol",
+        "  8. Financial Summary",
+        "  9. Recommendations & Next Steps",
+        " 10. Conclusion",
+    ]))
 
 if __name__ == '__main__':
     main()